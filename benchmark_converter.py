@@ -0,0 +1,406 @@
+"""
+Benchmark harness for convert_to_from_pdf.py.
+
+Generates a deterministic corpus (same seed -> byte-identical inputs), times each converter on it and
+prints the results as JSON: throughput (pages/s, MB/s), p50/p95 latency and peak RSS per case.
+
+    python benchmark_converter.py                      # quick corpus, 5 runs per case
+    python benchmark_converter.py --full --repeat 3    # adds the 10 MB / 100 MB text files and larger PDFs
+    python benchmark_converter.py --output after.json --compare before.json
+
+Every case runs in a fresh process so its peak RSS is not inflated by earlier cases.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import multiprocessing
+
+try:
+    import resource # Unix only; peak RSS is reported as null elsewhere
+except ImportError:
+    resource = None
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+
+DEFAULT_SEED = 1234
+DEFAULT_REPEAT = 5
+REGRESSION_THRESHOLD = 1.10 # --compare flags cases whose p50 got more than 10% slower
+
+# --- Corpus Definition ---
+# (name, pages) for generated PDFs; text sizes in bytes; (format, count, width, height) for image sets
+QUICK_CORPUS = {
+    "pdfs": [("pdf_10p", 10), ("pdf_100p", 100)],
+    "texts": [("text_1k", 1024), ("text_100k", 100 * 1024), ("text_1m", 1024 * 1024)],
+    "images": [("jpeg", 10, 1600, 1200), ("png", 10, 1600, 1200), ("bmp", 10, 1600, 1200), ("tiff", 10, 1600, 1200)],
+    "docx": [("docx_small", 20)], # paragraphs
+    "font_texts": [("text_cjk_100k", 100 * 1024)], # UTF-8 CJK text laid out with an embedded TrueType font
+}
+FULL_CORPUS = {
+    "pdfs": QUICK_CORPUS["pdfs"] + [("pdf_500p", 500)],
+    "texts": QUICK_CORPUS["texts"] + [("text_10m", 10 * 1024 * 1024), ("text_100m", 100 * 1024 * 1024)],
+    "images": QUICK_CORPUS["images"],
+    "docx": QUICK_CORPUS["docx"] + [("docx_medium", 400)],
+    "font_texts": QUICK_CORPUS["font_texts"] + [("text_cjk_1m", 1024 * 1024)],
+}
+PDF_TO_IMAGES_MAX_PAGES = 100 # Rendering every page of the largest PDFs adds little over the 100-page case
+PDF_TO_OFFICE_MAX_PAGES = 100 # pdf2docx is slow; larger PDFs only add minutes per run
+BENCHMARK_FONT = "cjk" # PyMuPDF's bundled Droid Sans Fallback: a ~3.5 MB TrueType font, so subsetting shows in output_bytes
+
+CJK_WORDS = "日本語 文章 変換 中文 文本 转换 한국어 문서 변환 東京 北京 서울".split()
+WORDS = ("lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore "
+         "et dolore magna aliqua ut enim ad minim veniam quis nostrud exercitation ullamco laboris nisi").split()
+
+
+# --- Corpus Generation ---
+def _sentence(rng, words=12):
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+def generate_text(path, size, rng):
+    """Writes `size` bytes of line-oriented ASCII prose."""
+    with open(path, 'w', encoding='ascii', newline='\n') as f:
+        written = 0
+        while written < size:
+            line = _sentence(rng, rng.randint(4, 16)) + "\n"
+            if written + len(line) > size:
+                line = line[:size - written]
+            f.write(line)
+            written += len(line)
+
+def generate_cjk_text(path, size, rng):
+    """Writes about `size` bytes of UTF-8 CJK lines (never splitting a character)."""
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        written = 0
+        while True:
+            line = " ".join(rng.choice(CJK_WORDS) for _ in range(rng.randint(4, 12))) + "\n"
+            written += len(line.encode('utf-8'))
+            if written > size:
+                break
+            f.write(line)
+
+def generate_font(path, rng):
+    """Copies a TrueType font bundled with PyMuPDF, so the corpus needs no system fonts."""
+    from convert_to_from_pdf import load_fitz
+    with open(path, 'wb') as f:
+        f.write(load_fitz().Font(BENCHMARK_FONT).buffer)
+
+def generate_pdf(path, pages, rng):
+    """Text-heavy pages with a few vector shapes; every tenth page also carries an embedded image."""
+    from convert_to_from_pdf import load_fitz
+    fitz = load_fitz()
+    doc = fitz.open()
+    tile = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 64, 64), False)
+    tile.set_rect(tile.irect, (200, 120, 40))
+    for page_number in range(pages):
+        page = doc.new_page(width=595, height=842) # A4 in points
+        page.insert_text((72, 60), f"Benchmark page {page_number + 1}", fontsize=16)
+        y = 90
+        while y < 780:
+            page.insert_text((72, y), _sentence(rng, 10), fontsize=10)
+            y += 14
+        page.draw_rect(fitz.Rect(60, 40, 535, 800), color=(0.2, 0.2, 0.6), width=0.5)
+        if page_number % 10 == 0:
+            page.insert_image(fitz.Rect(400, 40, 520, 160), pixmap=tile)
+    doc.save(path, garbage=1, deflate=True, no_new_id=True) # A random trailer /ID would make every corpus differ
+    doc.close()
+
+def generate_image(path, fmt, width, height, rng):
+    """A gradient with deterministic noise, so JPEG/PNG sizes are realistic rather than trivially small."""
+    from PIL import Image
+    gradient = Image.linear_gradient("L").resize((width, height))
+    noise = Image.frombytes("RGB", (width, height), rng.randbytes(width * height * 3))
+    image = Image.blend(Image.merge("RGB", (gradient, gradient.transpose(Image.Transpose.FLIP_LEFT_RIGHT), gradient)), noise, 0.25)
+    save_format = {"jpeg": "JPEG", "png": "PNG", "bmp": "BMP", "tiff": "TIFF"}[fmt]
+    image.save(path, save_format, **({"quality": 85} if fmt == "jpeg" else {}))
+
+def generate_docx(path, paragraphs, rng):
+    """A minimal valid DOCX (WordprocessingML in a zip), written without python-docx."""
+    body = "".join(f"<w:p><w:r><w:t>{_sentence(rng, 20)}</w:t></w:r></w:p>" for _ in range(paragraphs))
+    files = {
+        "[Content_Types].xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/word/document.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+            '</Types>'),
+        "_rels/.rels": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+            'Target="word/document.xml"/></Relationships>'),
+        "word/document.xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f'<w:body>{body}</w:body></w:document>'),
+    }
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, content in files.items():
+            info = zipfile.ZipInfo(name, date_time=(2000, 1, 1, 0, 0, 0)) # Fixed timestamps keep the file byte-identical
+            info.compress_type = zipfile.ZIP_DEFLATED
+            zf.writestr(info, content)
+
+def build_corpus(corpus_dir, corpus, seed):
+    """Generates every corpus file (skipping ones already present) and returns a manifest of inputs."""
+    os.makedirs(corpus_dir, exist_ok=True)
+    manifest = {"pdfs": [], "texts": [], "images": [], "docx": [], "font_texts": []}
+
+    def make(name, generator, *args):
+        path = os.path.join(corpus_dir, name)
+        if not os.path.exists(path):
+            # Each file gets its own RNG so adding corpus entries never changes existing files
+            generator(path + ".tmp", *args, random.Random(f"{seed}:{name}"))
+            os.replace(path + ".tmp", path)
+        return path
+
+    for name, pages in corpus["pdfs"]:
+        manifest["pdfs"].append({"name": name, "path": make(f"{name}.pdf", generate_pdf, pages), "pages": pages})
+    for name, size in corpus["texts"]:
+        manifest["texts"].append({"name": name, "path": make(f"{name}.txt", generate_text, size)})
+    for fmt, count, width, height in corpus["images"]:
+        ext = {"jpeg": "jpg", "tiff": "tiff"}.get(fmt, fmt)
+        paths = [make(f"image_{fmt}_{i:02d}.{ext}", generate_image, fmt, width, height) for i in range(count)]
+        manifest["images"].append({"name": f"images_{fmt}", "paths": paths})
+    for name, paragraphs in corpus["docx"]:
+        manifest["docx"].append({"name": name, "path": make(f"{name}.docx", generate_docx, paragraphs)})
+    if corpus["font_texts"]:
+        font_path = make(f"font_{BENCHMARK_FONT}.ttf", generate_font)
+        for name, size in corpus["font_texts"]:
+            manifest["font_texts"].append({"name": name, "path": make(f"{name}.txt", generate_cjk_text, size), "font": font_path})
+    return manifest
+
+
+# --- Benchmark Cases ---
+def _count_pdf_pages(path):
+    from convert_to_from_pdf import load_fitz
+    with load_fitz().open(path) as doc:
+        return doc.page_count
+
+def build_cases(manifest, soffice_available):
+    """One case per (converter, input). Each case is a plain dict so it can be sent to a worker process."""
+    cases = []
+    for image_set in manifest["images"]:
+        cases.append({"case": f"images_to_pdf/{image_set['name']}", "function": "convert_images_to_pdf",
+                      "inputs": image_set["paths"], "pages": len(image_set["paths"])})
+    for text in manifest["texts"]:
+        cases.append({"case": f"text_to_pdf/{text['name']}", "function": "convert_text_to_pdf", "inputs": [text["path"]], "pages": None})
+    for text in manifest["font_texts"]:
+        cases.append({"case": f"text_to_pdf_font/{text['name']}", "function": "convert_text_to_pdf_font",
+                      "inputs": [text["path"]], "font": text["font"], "pages": None})
+    for pdf in manifest["pdfs"]:
+        cases.append({"case": f"pdf_to_text/{pdf['name']}", "function": "convert_pdf_to_text", "inputs": [pdf["path"]], "pages": pdf["pages"]})
+        if pdf["pages"] <= PDF_TO_IMAGES_MAX_PAGES:
+            cases.append({"case": f"pdf_to_images/{pdf['name']}", "function": "convert_pdf_to_images", "inputs": [pdf["path"]], "pages": pdf["pages"]})
+        if pdf["pages"] <= PDF_TO_OFFICE_MAX_PAGES:
+            cases.append({"case": f"pdf_to_office/{pdf['name']}", "function": "convert_pdf_to_office", "inputs": [pdf["path"]], "pages": pdf["pages"]})
+    if soffice_available:
+        for document in manifest["docx"]:
+            cases.append({"case": f"office_to_pdf/{document['name']}", "function": "convert_office_to_pdf", "inputs": [document["path"]], "pages": None})
+    return cases
+
+def _check_text_round_trip(text_path, pdf_path):
+    """Fails the case if the first line cannot be extracted again, e.g. after font subsetting broke the glyph map."""
+    from convert_to_from_pdf import load_fitz
+    with open(text_path, 'r', encoding='utf-8') as f:
+        first_line = f.readline().strip()
+    with load_fitz().open(pdf_path) as doc:
+        extracted = doc[0].get_text().splitlines()
+    if not extracted or extracted[0].strip() != first_line:
+        raise ValueError(f"Text extracted from {os.path.basename(pdf_path)} does not match the input")
+
+def _invoke(function_name, inputs, out_dir, font=None):
+    """Runs one conversion into `out_dir` and returns the number of pages it produced (or None)."""
+    import convert_to_from_pdf as converter
+    stem = os.path.splitext(os.path.basename(inputs[0]))[0]
+    if function_name == "convert_images_to_pdf":
+        output = converter.convert_images_to_pdf(inputs, os.path.join(out_dir, f"{stem}.pdf"))
+    elif function_name == "convert_text_to_pdf":
+        output = converter.convert_text_to_pdf(inputs[0], os.path.join(out_dir, f"{stem}.pdf"))
+    elif function_name == "convert_text_to_pdf_font":
+        output = converter.convert_text_to_pdf(inputs[0], os.path.join(out_dir, f"{stem}.pdf"), font_path=font)
+        _check_text_round_trip(inputs[0], output)
+    elif function_name == "convert_pdf_to_text":
+        converter.convert_pdf_to_text(inputs[0], os.path.join(out_dir, f"{stem}.txt"))
+        return None
+    elif function_name == "convert_pdf_to_images":
+        return len(converter.convert_pdf_to_images(inputs[0], os.path.join(out_dir, f"{stem}.png")))
+    elif function_name == "convert_pdf_to_office":
+        converter.convert_pdf_to_office(inputs[0], os.path.join(out_dir, f"{stem}.docx"))
+        return None
+    elif function_name == "convert_office_to_pdf":
+        output = converter.convert_office_to_pdf(inputs[0], os.path.join(out_dir, f"{stem}.pdf"))
+    else:
+        raise ValueError(f"Unknown benchmark function: {function_name}")
+    return _count_pdf_pages(output) # Text and Office inputs have no page count until converted
+
+def _peak_rss_mb(who):
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, int(round(fraction * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+def _quiet_console_logging():
+    # pdf2docx calls logging.basicConfig, which echoes every page (and our debug log) to the console;
+    # terminal output would then be part of the timing. A root handler makes basicConfig a no-op.
+    # The file logs are kept, as in normal use.
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, logging.StreamHandler) and getattr(handler, "stream", None) in (sys.stderr, sys.stdout):
+            root.removeHandler(handler)
+    root.addHandler(logging.NullHandler())
+
+def _reap_worker_processes():
+    # RUSAGE_CHILDREN only counts children that have exited and been waited for, so the converter's
+    # process pools are shut down and joined before peak RSS is read
+    import convert_to_from_pdf as converter
+    converter.shutdown_render_process_pool(wait=True)
+    converter.shutdown_soffice_listener_pool()
+
+def run_case(case, repeat, work_dir):
+    """Worker-process entry point: warm-up run, then `repeat` timed runs. Returns the result dict."""
+    result = {"case": case["case"], "function": case["function"], "runs": repeat,
+              "input_bytes": sum(os.path.getsize(p) for p in case["inputs"]), "pages": case["pages"]}
+    out_dir = os.path.join(work_dir, "out", case["case"].replace("/", "__"))
+    timings = []
+    _quiet_console_logging()
+    try:
+        for run in range(repeat + 1):
+            os.makedirs(out_dir, exist_ok=True)
+            start = time.perf_counter()
+            produced_pages = _invoke(case["function"], case["inputs"], out_dir, case.get("font"))
+            elapsed = time.perf_counter() - start
+            result["output_bytes"] = sum(entry.stat().st_size for entry in os.scandir(out_dir) if entry.is_file())
+            shutil.rmtree(out_dir, ignore_errors=True)
+            if result["pages"] is None:
+                result["pages"] = produced_pages
+            if run > 0: # Run 0 warms imports, font caches and worker pools
+                timings.append(elapsed)
+    except Exception as e:
+        result.update(status="failed", error=f"{type(e).__name__}: {e}")
+        return result
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+        _reap_worker_processes()
+
+    p50 = statistics.median(timings)
+    result.update(
+        status="ok",
+        error=None,
+        p50_s=round(p50, 4),
+        p95_s=round(percentile(timings, 0.95), 4),
+        mean_s=round(statistics.fmean(timings), 4),
+        min_s=round(min(timings), 4),
+        pages_per_s=round(result["pages"] / p50, 2) if result["pages"] else None,
+        mb_per_s=round(result["input_bytes"] / (1024 * 1024) / p50, 2),
+        peak_rss_mb=_peak_rss_mb(resource.RUSAGE_SELF) if resource else None,
+        peak_rss_children_mb=_peak_rss_mb(resource.RUSAGE_CHILDREN) if resource else None, # Render / pdf2docx workers
+    )
+    return result
+
+
+# --- Reporting ---
+def environment_info(seed, repeat, corpus_name):
+    from importlib import metadata
+    versions = {}
+    for dist in ("PyMuPDF", "pdf2docx", "Pillow"):
+        try:
+            versions[dist] = metadata.version(dist)
+        except metadata.PackageNotFoundError:
+            versions[dist] = None
+    return {
+        "timestamp": datetime.now().isoformat(timespec='seconds'),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": seed,
+        "repeat": repeat,
+        "corpus": corpus_name,
+        "backends": versions,
+        "soffice": shutil.which("soffice"),
+    }
+
+def compare_results(current, previous_path):
+    """Adds `p50_ratio` (current / previous) to each case and returns the names of regressed cases."""
+    with open(previous_path, 'r', encoding='utf-8') as f:
+        previous = {res["case"]: res for res in json.load(f)["results"]}
+    regressions = []
+    for res in current["results"]:
+        before = previous.get(res["case"])
+        if res.get("status") != "ok" or not before or before.get("status") != "ok":
+            continue
+        res["p50_ratio"] = round(res["p50_s"] / before["p50_s"], 3) if before["p50_s"] else None
+        if res["p50_ratio"] and res["p50_ratio"] > REGRESSION_THRESHOLD:
+            regressions.append(res["case"])
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark File Converter on a generated corpus.")
+    parser.add_argument("--full", action="store_true", help="Use the full corpus (10 MB / 100 MB text, 500-page PDF)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help=f"Timed runs per case (default: {DEFAULT_REPEAT})")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Corpus seed")
+    parser.add_argument("--only", action="append", default=[], help="Run only cases whose name contains this text (repeatable)")
+    parser.add_argument("--work-dir", help="Where to keep the corpus (default: a temporary folder, removed afterwards)")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    parser.add_argument("--compare", help="Previous JSON report; adds p50 ratios and exits 1 on a regression")
+    args = parser.parse_args(argv)
+
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="file_converter_bench_")
+    corpus_name = "full" if args.full else "quick"
+    try:
+        print(f"Generating {corpus_name} corpus (seed {args.seed}) in {work_dir}...", file=sys.stderr)
+        manifest = build_corpus(os.path.join(work_dir, f"corpus_{corpus_name}_{args.seed}"),
+                                FULL_CORPUS if args.full else QUICK_CORPUS, args.seed)
+        cases = build_cases(manifest, soffice_available=shutil.which("soffice") is not None)
+        if args.only:
+            selected = [case for case in cases if any(token in case["case"] for token in args.only)]
+            if not selected: # An empty report would look like a passing run
+                parser.error(f"no case matches --only {', '.join(args.only)}; cases: {', '.join(case['case'] for case in cases)}")
+            cases = selected
+
+        report = {"environment": environment_info(args.seed, args.repeat, corpus_name), "results": []}
+        spawn = multiprocessing.get_context("spawn")
+        for case in cases:
+            print(f"  {case['case']} ...", file=sys.stderr, end=" ", flush=True)
+            with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as pool: # Fresh process: per-case peak RSS
+                result = pool.submit(run_case, case, max(1, args.repeat), work_dir).result()
+            report["results"].append(result)
+            print(f"p50 {result['p50_s']}s" if result["status"] == "ok" else f"FAILED ({result['error']})", file=sys.stderr)
+
+        regressions = compare_results(report, args.compare) if args.compare else []
+        output = json.dumps(report, indent=2)
+        print(output)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(output + "\n")
+        if regressions:
+            print(f"Regressions (p50 > {REGRESSION_THRESHOLD:.2f}x previous): {', '.join(regressions)}", file=sys.stderr)
+            return 1
+        return 0 if all(res["status"] == "ok" for res in report["results"]) else 1
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
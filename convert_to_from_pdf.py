@@ -1,15 +1,45 @@
+import time
+_STARTUP_T0 = time.perf_counter() # Reference point for --startup-timing
 import os
 import subprocess
 import platform
-from PIL import Image
-from fpdf import FPDF
-from pdf2docx import Converter
 import sys
-import fitz
-import shutil
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
 import logging
+import logging.handlers
+import importlib
+import importlib.util
+import shutil
+import hashlib
+import io
+import re
+import zlib
+import bisect
+import binascii
+import math
+try:
+    import tkinter as tk
+    from tkinter import filedialog, messagebox, ttk
+except ImportError: # Headless Python builds (build servers, cron) may not ship Tk; the CLI does not need it
+    tk = None
+import argparse
+import glob
+import json
+import atexit
+import socket
+import select
+import struct
+import tempfile
+import tarfile
+import zipfile
+import queue
+import threading
+import itertools
+import contextlib
+import functools
+import inspect
+import sqlite3
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from datetime import datetime
 
 # --- Backend Logging Setup ---
@@ -39,71 +69,672 @@ def get_log_filename(base_filename):
 USER_LOG_FILE_PATH = os.path.join(LOG_DIR, USER_LOG_FILENAME)
 DEBUG_LOG_FILE_PATH = os.path.join(LOG_DIR, DEBUG_LOG_FILENAME)
 
+LOG_MAX_BYTES = 10 * 1024 * 1024 # Size-based rotation on top of the daily rename: user_log.txt -> user_log.txt.1 ...
+LOG_BACKUP_COUNT = 5
+LOG_FORMAT_ENV = "FILE_CONVERTER_LOG_FORMAT" # "text" (default) or "json" for one JSON object per line
+USER_LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+DEBUG_LOG_FORMAT = '%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(funcName)s - %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+class JsonLogFormatter(logging.Formatter):
+    """One JSON object per record; `include_source` adds file, line, function and thread (debug log)."""
+    def __init__(self, include_source=False):
+        super().__init__(datefmt=LOG_DATE_FORMAT)
+        self.include_source = include_source
+
+    def format(self, record):
+        entry = {"time": self.formatTime(record, self.datefmt), "level": record.levelname, "message": record.getMessage()}
+        if self.include_source:
+            entry.update(file=record.filename, line=record.lineno, function=record.funcName, thread=record.threadName)
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Hands records to the log listener thread without formatting them. The standard QueueHandler formats
+    on the calling thread (so records can be pickled); this queue never leaves the process, so message
+    %-formatting, tracebacks and file I/O all happen on the listener thread instead.
+    """
+    def prepare(self, record):
+        return record
+
+@contextlib.contextmanager
+def interprocess_lock(lock_path):
+    """Holds an exclusive lock on `lock_path` (created if missing) that other processes respect, e.g. a second GUI or a CLI run."""
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if os.name == 'nt':
+            import msvcrt
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError: # LK_LOCK gives up after about 10 s; keep waiting
+                    continue
+            try:
+                yield
+            finally:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+class SharedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that several processes can share. Every write holds an interprocess_lock on
+    `<log file>.lock` and re-opens the file first if another process has rotated or renamed it. On Windows,
+    where an open file can't be renamed, the file is closed again after each write.
+    """
+    def __init__(self, filename, **kwargs):
+        super().__init__(filename, **kwargs)
+        self.lock_path = self.baseFilename + ".lock"
+
+    def _stream_is_stale(self):
+        try:
+            return os.fstat(self.stream.fileno()).st_ino != os.stat(self.baseFilename).st_ino
+        except OSError: # Renamed away and not recreated yet
+            return True
+
+    def emit(self, record):
+        try:
+            with interprocess_lock(self.lock_path):
+                if self.stream is not None and self._stream_is_stale():
+                    self.stream.close()
+                    self.stream = None # Re-opened by the write below
+                super().emit(record) # Rolls over first if the (current) file is full
+                if os.name == 'nt' and self.stream is not None:
+                    self.stream.close()
+                    self.stream = None
+        except Exception:
+            self.handleError(record)
+
+def is_worker_process():
+    # Render / pdf2docx worker. A spawned worker imports this module before parent_process() is set, hence the name check.
+    return multiprocessing.parent_process() is not None or multiprocessing.current_process().name != "MainProcess"
+
+_log_listener = None
+_log_file_handlers = []
+_worker_log_queue = None
+_worker_log_listener = None
+_worker_log_lock = threading.Lock()
+
+def stop_logging():
+    """Flushes queued records to the log files and stops the listener threads (registered with atexit)."""
+    global _log_listener, _worker_log_listener
+    for listener in (_worker_log_listener, _log_listener):
+        if listener is not None:
+            listener.stop()
+    _log_listener = _worker_log_listener = None
+
+def get_worker_log_queue():
+    """
+    Returns the queue through which worker processes log, pass it to init_worker_logging. Records arrive
+    already formatted and are written to the log files by a second listener thread of this process.
+    """
+    global _worker_log_queue, _worker_log_listener
+    with _worker_log_lock:
+        if _worker_log_queue is None:
+            _worker_log_queue = multiprocessing.get_context("spawn").Queue()
+            if _log_listener is not None: # Logging is set up (not the DummyLogger fallback)
+                _worker_log_listener = logging.handlers.QueueListener(_worker_log_queue, *_log_file_handlers, respect_handler_level=True)
+                _worker_log_listener.start()
+        return _worker_log_queue
+
+def init_worker_logging(log_queue):
+    # Process pool initializer: sends this worker's records to the parent process's log files
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    for logger in (user_log, debug_log):
+        if isinstance(logger, logging.Logger):
+            logger.handlers[:] = [queue_handler]
+
 def setup_logging():
+    global _log_listener
+    user_logger = logging.getLogger('UserLogger')
+    debug_logger = logging.getLogger('DebugLogger')
+    if is_worker_process():
+        # Workers neither rotate nor open the log files; init_worker_logging connects them to the parent
+        for logger, level in ((user_logger, logging.INFO), (debug_logger, logging.DEBUG)):
+            logger.setLevel(level)
+            logger.propagate = False
+            if not logger.handlers:
+                logger.addHandler(logging.NullHandler())
+        return user_logger, debug_logger
+
     if not os.path.exists(LOG_DIR):
         try:
             os.makedirs(LOG_DIR)
         except OSError as e:
             print(f"Critical: Could not create log directory {LOG_DIR}. Error: {e}", file=sys.stderr)
             class DummyLogger:
-                def info(self, msg): pass
-                def debug(self, msg): pass
-                def error(self, msg, exc_info=False): pass
-                def exception(self, msg): pass
+                def debug(self, msg, *args, **kwargs): pass
+                def info(self, msg, *args, **kwargs): pass
+                def warning(self, msg, *args, **kwargs): pass
+                def error(self, msg, *args, **kwargs): pass
+                def exception(self, msg, *args, **kwargs): pass
+                def isEnabledFor(self, level): return False
             return DummyLogger(), DummyLogger()
 
-    # Check if log files need to be renamed (i.e., if they exist and are from a previous day)
+    if any(type(h).__name__ == "DeferredQueueHandler" for h in user_logger.handlers):
+        return user_logger, debug_logger # Already set up (module imported twice)
+
+    # Check if log files need to be renamed (i.e., if they exist and are from a previous day).
+    # The lock and the re-check keep two processes starting at once from both renaming.
+    rename_messages = []
     for log_file in [USER_LOG_FILE_PATH, DEBUG_LOG_FILE_PATH]:
-        if os.path.exists(log_file):
-            # Get the last modified time of the log file
-            last_modified = datetime.fromtimestamp(os.path.getmtime(log_file))
-            if last_modified.date() < datetime.now().date():
-                # Rename the log file to include the date
-                new_filename = get_log_filename(os.path.basename(log_file))
-                new_path = os.path.join(LOG_DIR, new_filename)
-                try:
+        try:
+            with interprocess_lock(log_file + ".lock"):
+                if not os.path.exists(log_file):
+                    continue
+                # Get the last modified time of the log file
+                last_modified = datetime.fromtimestamp(os.path.getmtime(log_file))
+                if last_modified.date() < datetime.now().date():
+                    # Rename the log file to include the date; other processes re-open log_file on their next write
+                    new_path = os.path.join(LOG_DIR, get_log_filename(os.path.basename(log_file)))
                     os.rename(log_file, new_path)
-                    print(f"Renamed log file {log_file} to {new_path}")
-                except OSError as e:
-                    print(f"Error renaming log file {log_file}: {e}", file=sys.stderr)
+                    rename_messages.append((logging.INFO, f"Renamed log file {log_file} to {new_path}"))
+        except OSError as e:
+            rename_messages.append((logging.WARNING, f"Error renaming log file {log_file}: {e}"))
 
-    # User Logger
-    user_logger = logging.getLogger('UserLogger')
-    user_logger.setLevel(logging.INFO)
-    user_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-    
-    if not any(isinstance(h, logging.FileHandler) and h.baseFilename == USER_LOG_FILE_PATH for h in user_logger.handlers):
+    use_json = os.environ.get(LOG_FORMAT_ENV, "text").lower() == "json"
+    file_handlers = []
+    for logger, path, level, text_format in ((user_logger, USER_LOG_FILE_PATH, logging.INFO, USER_LOG_FORMAT),
+                                              (debug_logger, DEBUG_LOG_FILE_PATH, logging.DEBUG, DEBUG_LOG_FORMAT)):
+        logger.setLevel(level)
+        logger.propagate = False # Keep our records out of root handlers that libraries install (pdf2docx calls basicConfig)
         try:
-            user_file_handler = logging.FileHandler(USER_LOG_FILE_PATH, encoding='utf-8')
-            user_file_handler.setFormatter(user_formatter)
-            user_logger.addHandler(user_file_handler)
+            file_handler = SharedRotatingFileHandler(path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT,
+                                                     encoding='utf-8', delay=True)
         except Exception as e:
-            print(f"Error setting up user_log file handler: {e}", file=sys.stderr)
+            print(f"Error setting up {os.path.basename(path)} file handler: {e}", file=sys.stderr)
+            continue
+        if use_json:
+            file_handler.setFormatter(JsonLogFormatter(include_source=logger is debug_logger))
+        else:
+            file_handler.setFormatter(logging.Formatter(text_format, datefmt=LOG_DATE_FORMAT))
+        file_handler.addFilter(logging.Filter(logger.name)) # One listener serves both files
+        file_handlers.append(file_handler)
 
-    # Debug Logger
-    debug_logger = logging.getLogger('DebugLogger')
-    debug_logger.setLevel(logging.DEBUG)
-    debug_formatter = logging.Formatter('%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(funcName)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-    
-    if not any(isinstance(h, logging.FileHandler) and h.baseFilename == DEBUG_LOG_FILE_PATH for h in debug_logger.handlers):
-        try:
-            debug_file_handler = logging.FileHandler(DEBUG_LOG_FILE_PATH, encoding='utf-8')
-            debug_file_handler.setFormatter(debug_formatter)
-            debug_logger.addHandler(debug_file_handler)
-        except Exception as e:
-            print(f"Error setting up debug_log file handler: {e}", file=sys.stderr)
-            
+    # Loggers only enqueue; a single background thread formats and writes both files
+    log_queue = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    user_logger.addHandler(queue_handler)
+    debug_logger.addHandler(queue_handler)
+    _log_listener = logging.handlers.QueueListener(log_queue, *file_handlers, respect_handler_level=True)
+    _log_listener.start()
+    _log_file_handlers[:] = file_handlers
+    atexit.register(stop_logging)
+    for level, message in rename_messages:
+        debug_logger.log(level, message)
     return user_logger, debug_logger
 
 user_log, debug_log = setup_logging()
 # --- End Backend Logging Setup ---
 
+# --- Lazy Backend Imports ---
+# PyMuPDF, pdf2docx and Pillow are imported by the converter that first needs them,
+# so the window (or CLI) comes up without loading libraries the session may never use.
+backend_import_times = {} # module name -> seconds spent importing it
+
+def import_backend(module_name):
+    module = sys.modules.get(module_name)
+    if module is None:
+        started = time.perf_counter()
+        module = importlib.import_module(module_name)
+        backend_import_times[module_name] = time.perf_counter() - started
+        debug_log.debug("Imported backend '%s' in %.1f ms", module_name, backend_import_times[module_name]*1000)
+    return module
+
+_fitz_module = None
+
+def load_fitz():
+    global _fitz_module
+    if _fitz_module is None:
+        try:
+            fitz = import_backend('pymupdf') # PyMuPDF >= 1.24.3; 'import fitz' prints a deprecation notice on stdout there
+        except ImportError:
+            fitz = import_backend('fitz')
+        if hasattr(fitz, "set_messages"):
+            # MuPDF notices go to the debug log instead of stdout, which the CLI reserves for JSON results
+            fitz.set_messages(pylogging_name='DebugLogger', pylogging_level=logging.WARNING)
+        _fitz_module = fitz
+    return _fitz_module
+
+STARTUP_TIMING_ENV = "FILE_CONVERTER_STARTUP_TIMING" # Set to 1 (or pass --startup-timing) to report startup latency
+
+def report_startup_timing(stage):
+    # Logs (and prints, when a console exists) the time from the start of the module import until `stage`
+    elapsed_ms = (time.perf_counter() - _STARTUP_T0) * 1000
+    loaded = ', '.join(f"{name} {secs*1000:.0f} ms" for name, secs in backend_import_times.items()) or "none"
+    message = f"Startup timing: {stage} after {elapsed_ms:.1f} ms (backends loaded: {loaded})"
+    user_log.info(message)
+    if sys.stderr is not None: # sys.stderr is None in the --noconsole build
+        print(message, file=sys.stderr)
+    return elapsed_ms
+
+# --- Conversion Metrics ---
+# Every top-level conversion is timed stage by stage (open, decode, render/convert, write, sort, open_file).
+# Finished conversions are appended to Logs/metrics.jsonl; running totals are kept in Logs/metrics.prom
+# (Prometheus text format, e.g. for node_exporter's textfile collector).
+METRICS_ENABLED = os.environ.get("FILE_CONVERTER_METRICS", "1") != "0"
+METRICS_JSONL_PATH = os.path.join(LOG_DIR, "metrics.jsonl")
+METRICS_PROM_PATH = os.path.join(LOG_DIR, "metrics.prom")
+METRICS_PREFIX = "file_converter"
+STAGE_FIELDS = ("calls", "seconds", "bytes_in", "bytes_out", "pages")
+
+_metrics_local = threading.local() # .conversion: the record of the conversion running on this thread
+_metrics_lock = threading.Lock()
+# Increments not yet merged into metrics.prom; write_metrics_snapshot adds them to the file's totals
+_stage_totals = {} # (stage, backend) -> {field: total}
+_conversion_totals = {} # (kind, status) -> {"count": n, "seconds": s}
+
+class StageTimer:
+    """Handed out by stage(); set bytes_in / bytes_out / pages on it while the stage runs."""
+    def __init__(self, name, backend="", bytes_in=0, bytes_out=0, pages=0):
+        self.name = name
+        self.backend = backend
+        self.bytes_in = bytes_in
+        self.bytes_out = bytes_out
+        self.pages = pages
+
+@contextlib.contextmanager
+def stage(name, backend="", bytes_in=0, bytes_out=0, pages=0):
+    """Times the enclosed block as one `name` stage of the current conversion."""
+    timer = StageTimer(name, backend, bytes_in, bytes_out, pages)
+    started = time.perf_counter()
+    try:
+        yield timer
+    finally:
+        record_stage(name, time.perf_counter() - started, backend=timer.backend,
+                     bytes_in=timer.bytes_in, bytes_out=timer.bytes_out, pages=timer.pages)
+
+def record_stage(name, seconds, backend="", bytes_in=0, bytes_out=0, pages=0, calls=1):
+    """Adds a measured stage, e.g. time reported back by a worker process. Seconds are work time, summed."""
+    if not METRICS_ENABLED:
+        return
+    values = {"calls": calls, "seconds": seconds, "bytes_in": bytes_in or 0, "bytes_out": bytes_out or 0, "pages": pages or 0}
+    conversion = getattr(_metrics_local, "conversion", None)
+    if conversion is not None:
+        totals = conversion["stages"].setdefault((name, backend), dict.fromkeys(STAGE_FIELDS, 0))
+        for field in STAGE_FIELDS:
+            totals[field] += values[field]
+    with _metrics_lock:
+        totals = _stage_totals.setdefault((name, backend), dict.fromkeys(STAGE_FIELDS, 0))
+        for field in STAGE_FIELDS:
+            totals[field] += values[field]
+    if conversion is None: # Stages outside a conversion (e.g. previewing a file) are not followed by a flush
+        write_metrics_snapshot()
+
+def _path_size(path):
+    try:
+        return os.path.getsize(path)
+    except (OSError, TypeError):
+        return 0
+
+def track_conversion(kind):
+    """
+    Decorator for top-level converters: collects their stages into one metrics record, and records the
+    job (parameters, input hashes, outputs) in the job journal.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not (METRICS_ENABLED or JOURNAL_ENABLED) or getattr(_metrics_local, "conversion", None) is not None:
+                return func(*args, **kwargs) # A nested conversion belongs to the outer record
+            inputs = args[0] if args else kwargs.get("input_paths_raw") or kwargs.get("input_path")
+            if isinstance(inputs, str):
+                inputs = inputs.split(';')
+            output_type = kwargs.get("output_type", args[1] if len(args) > 1 and isinstance(args[1], str) else "pdf")
+            record = {"kind": kind, "output_type": output_type, "inputs": [str(p) for p in inputs or []], "stages": {},
+                      "params": _journal_params(signature, args, kwargs), "hashes": {}, "outputs": []}
+            _metrics_local.conversion = record
+            started_at = time.time()
+            started = time.perf_counter()
+            status, error = "succeeded", None
+            try:
+                record["outputs"] = func(*args, **kwargs)
+                return record["outputs"]
+            except Exception as e:
+                status, error = "failed", f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                _metrics_local.conversion = None
+                _finish_conversion_record(record, status, error, started_at, time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+def _finish_conversion_record(record, status, error, started_at, seconds):
+    if JOURNAL_ENABLED:
+        journal = get_job_journal()
+        if journal is not None:
+            journal.record(record, status, error, started_at, seconds)
+    if not METRICS_ENABLED:
+        return
+    line = {
+        "time": datetime.fromtimestamp(started_at).isoformat(timespec='milliseconds'),
+        "kind": record["kind"],
+        "output_type": record["output_type"],
+        "inputs": record["inputs"],
+        "input_bytes": sum(_path_size(p) for p in record["inputs"]),
+        "status": status,
+        "error": error,
+        "seconds": round(seconds, 6),
+        "stages": [dict(stage=name, backend=backend, **{field: round(v, 6) if field == "seconds" else v for field, v in totals.items()})
+                   for (name, backend), totals in record["stages"].items()],
+    }
+    with _metrics_lock:
+        totals = _conversion_totals.setdefault((record["kind"], status), {"count": 0, "seconds": 0.0})
+        totals["count"] += 1
+        totals["seconds"] += seconds
+        try:
+            with open(METRICS_JSONL_PATH, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(line) + "\n")
+        except OSError as e:
+            debug_log.warning(f"Could not append to {METRICS_JSONL_PATH}: {e}")
+    slowest = max(line["stages"], key=lambda st: st["seconds"], default=None)
+    if slowest:
+        debug_log.debug("Conversion metrics: %s %s in %.3fs, slowest stage %s%s %.3fs", record['kind'], status, seconds, slowest['stage'],
+                        '/' + slowest['backend'] if slowest['backend'] else '', slowest['seconds'])
+    else:
+        debug_log.debug("Conversion metrics: %s %s in %.3fs", record['kind'], status, seconds)
+    write_metrics_snapshot()
+
+def _prom_labels(**labels):
+    escaped = {key: str(value).replace('\\', '\\\\').replace('"', '\\"') for key, value in labels.items()}
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped.items()) + "}"
+
+def _read_metric_totals():
+    # The counters in metrics.prom, as (stage totals, conversion totals). Caller holds the metrics.prom lock.
+    stage_totals, conversion_totals = {}, {}
+    try:
+        with open(METRICS_PROM_PATH, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return stage_totals, conversion_totals
+    stage_prefix, conversion_prefix = f"{METRICS_PREFIX}_stage_", f"{METRICS_PREFIX}_conversions_"
+    for line in lines:
+        if line.startswith('#') or '{' not in line:
+            continue
+        try:
+            name, rest = line.split('{', 1)
+            label_text, value = rest.rsplit('} ', 1)
+            labels = dict(item.split('=', 1) for item in label_text.split(','))
+            labels = {key: val.strip('"') for key, val in labels.items()}
+            value = float(value)
+        except ValueError:
+            continue
+        if name.startswith(stage_prefix) and name.endswith("_total"):
+            field = name[len(stage_prefix):-len("_total")]
+            if field in STAGE_FIELDS:
+                totals = stage_totals.setdefault((labels.get("stage", ""), labels.get("backend", "")), dict.fromkeys(STAGE_FIELDS, 0))
+                totals[field] += value
+        elif name == conversion_prefix + "total":
+            conversion_totals.setdefault((labels.get("kind", ""), labels.get("status", "")), {"count": 0, "seconds": 0.0})["count"] += value
+        elif name == conversion_prefix + "seconds_total":
+            conversion_totals.setdefault((labels.get("kind", ""), labels.get("status", "")), {"count": 0, "seconds": 0.0})["seconds"] += value
+    return stage_totals, conversion_totals
+
+def write_metrics_snapshot():
+    """
+    Merges this process's new counts into Logs/metrics.prom. The file is re-read under an interprocess lock,
+    so concurrent GUI and CLI runs add to each other's totals, and replaced atomically (temp file + rename),
+    so a scraper never sees a partial file. Counters only reset when the file is deleted.
+    """
+    if not METRICS_ENABLED:
+        return
+    with _metrics_lock:
+        if not _stage_totals and not _conversion_totals:
+            return
+        try:
+            with interprocess_lock(METRICS_PROM_PATH + ".lock"):
+                stage_totals, conversion_totals = _read_metric_totals()
+                for key, pending in _stage_totals.items():
+                    totals = stage_totals.setdefault(key, dict.fromkeys(STAGE_FIELDS, 0))
+                    for field in STAGE_FIELDS:
+                        totals[field] += pending[field]
+                for key, pending in _conversion_totals.items():
+                    totals = conversion_totals.setdefault(key, {"count": 0, "seconds": 0.0})
+                    totals["count"] += pending["count"]
+                    totals["seconds"] += pending["seconds"]
+                _write_metrics_file(stage_totals, conversion_totals)
+        except OSError as e:
+            debug_log.warning("Could not write metrics snapshot %s: %s", METRICS_PROM_PATH, e)
+            return # The counts stay pending and are merged by the next snapshot
+        _stage_totals.clear()
+        _conversion_totals.clear()
+
+def _write_metrics_file(stage_totals, conversion_totals):
+    out = []
+    help_texts = {
+        "calls": "Number of times the stage ran.",
+        "seconds": "Time spent in the stage (summed across worker processes).",
+        "bytes_in": "Bytes read by the stage.",
+        "bytes_out": "Bytes written by the stage.",
+        "pages": "Pages or images handled by the stage.",
+    }
+    for field in STAGE_FIELDS:
+        metric = f"{METRICS_PREFIX}_stage_{field}_total"
+        out.append(f"# HELP {metric} {help_texts[field]}")
+        out.append(f"# TYPE {metric} counter")
+        for (name, backend), totals in sorted(stage_totals.items()):
+            out.append(f"{metric}{_prom_labels(stage=name, backend=backend)} {totals[field]:.15g}") # Re-read by the next merge, so keep full precision
+    for metric, field, help_text in ((f"{METRICS_PREFIX}_conversions_total", "count", "Finished conversions."),
+                                     (f"{METRICS_PREFIX}_conversions_seconds_total", "seconds", "Wall time of finished conversions.")):
+        out.append(f"# HELP {metric} {help_text}")
+        out.append(f"# TYPE {metric} counter")
+        for (kind, status), totals in sorted(conversion_totals.items()):
+            out.append(f"{metric}{_prom_labels(kind=kind, status=status)} {totals[field]:.15g}")
+    out.append(f"# HELP {METRICS_PREFIX}_metrics_updated_timestamp_seconds Time this snapshot was written.")
+    out.append(f"# TYPE {METRICS_PREFIX}_metrics_updated_timestamp_seconds gauge")
+    out.append(f"{METRICS_PREFIX}_metrics_updated_timestamp_seconds {time.time():.3f}")
+    tmp_path = f"{METRICS_PROM_PATH}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write("\n".join(out) + "\n")
+    os.replace(tmp_path, METRICS_PROM_PATH)
+
+# --- Job Journal ---
+# Every top-level conversion is also written to a SQLite database: parameters, inputs with their SHA-256,
+# the sorted outputs, duration, bytes and errors. The history window and `history` command query it.
+JOURNAL_ENABLED = os.environ.get("FILE_CONVERTER_JOURNAL", "1") != "0"
+JOURNAL_PATH = os.path.join(LOG_DIR, "journal.sqlite3")
+JOURNAL_SCHEMA_VERSION = 1
+JOURNAL_BUSY_TIMEOUT_SECONDS = 10 # Several processes (GUI, CLI runs) may write at once
+JOURNAL_SKIPPED_PARAMS = {"input_paths_raw", "input_path", "output_type", "tool", "progress_callback"}
+JOURNAL_PARAM_TYPES = (str, int, float, bool, type(None))
+JOURNAL_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL, -- Unix time
+    kind TEXT NOT NULL,
+    output_type TEXT,
+    status TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    input_bytes INTEGER NOT NULL,
+    output_bytes INTEGER NOT NULL,
+    params TEXT NOT NULL, -- JSON object
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS inputs (
+    job_id INTEGER NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    sha256 TEXT,
+    bytes INTEGER,
+    PRIMARY KEY (job_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS outputs (
+    job_id INTEGER NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    bytes INTEGER,
+    PRIMARY KEY (job_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS jobs_started_at ON jobs (started_at);
+CREATE INDEX IF NOT EXISTS jobs_status_started_at ON jobs (status, started_at);
+CREATE INDEX IF NOT EXISTS inputs_sha256 ON inputs (sha256);
+"""
+
+def _journal_params(signature, args, kwargs):
+    # The converter's arguments (with defaults) that describe the job; callbacks and inputs are left out
+    try:
+        bound = signature.bind(*args, **kwargs)
+    except TypeError:
+        return {}
+    bound.apply_defaults()
+    return {name: value for name, value in bound.arguments.items()
+            if name not in JOURNAL_SKIPPED_PARAMS and isinstance(value, JOURNAL_PARAM_TYPES)}
+
+class JobJournal:
+    """
+    SQLite journal of finished conversions (`jobs`, plus one `inputs` / `outputs` row per file).
+    One connection is shared by all threads behind a lock; WAL mode lets readers (the history window,
+    other processes) query while a job is being written.
+    """
+    def __init__(self, path=JOURNAL_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=JOURNAL_BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL") # WAL keeps the database consistent; a crash may lose the last jobs
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] < JOURNAL_SCHEMA_VERSION:
+                self._conn.executescript(JOURNAL_SCHEMA)
+                self._conn.execute(f"PRAGMA user_version={JOURNAL_SCHEMA_VERSION}")
+
+    def record(self, record, status, error, started_at, seconds):
+        """Stores one finished conversion (a track_conversion record). Journal errors are logged, never raised."""
+        try:
+            inputs = []
+            for path in record["inputs"]:
+                sha256 = record["hashes"].get(path) # Already computed for the cache key, unless the cache was off
+                if sha256 is None and os.path.isfile(path):
+                    sha256 = file_sha256(path)
+                inputs.append((path, sha256, _path_size(path) if os.path.isfile(path) else None))
+            outputs = [(path, _path_size(path)) for path in record["outputs"] or []]
+            # Each result has a copy in 'All' and a link in its type folder; bytes count the 'All' copies
+            output_bytes = sum(size for path, size in outputs if os.path.basename(os.path.dirname(path)) == 'All')
+            with self._lock, self._conn:
+                job_id = self._conn.execute(
+                    "INSERT INTO jobs (started_at, kind, output_type, status, seconds, input_bytes, output_bytes, params, error) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (started_at, record["kind"], record["output_type"], status, seconds, sum(size or 0 for _, _, size in inputs),
+                     output_bytes, json.dumps(record["params"], sort_keys=True), error)).lastrowid
+                self._conn.executemany("INSERT INTO inputs (job_id, position, path, sha256, bytes) VALUES (?, ?, ?, ?, ?)",
+                                       [(job_id, i, *item) for i, item in enumerate(inputs)])
+                self._conn.executemany("INSERT INTO outputs (job_id, position, path, bytes) VALUES (?, ?, ?, ?)",
+                                       [(job_id, i, *item) for i, item in enumerate(outputs)])
+            return job_id
+        except (sqlite3.Error, OSError) as e:
+            debug_log.warning(f"Could not record {record['kind']} job for {record['inputs']} in the journal: {e}")
+            return None
+
+    def _where(self, since=None, until=None, status=None, kind=None, input_sha256=None):
+        clauses, args = [], []
+        if since is not None:
+            clauses.append("started_at >= ?")
+            args.append(since)
+        if until is not None:
+            clauses.append("started_at < ?")
+            args.append(until)
+        if status:
+            clauses.append("status = ?")
+            args.append(status)
+        if kind:
+            clauses.append("kind = ?")
+            args.append(kind)
+        if input_sha256:
+            clauses.append("id IN (SELECT job_id FROM inputs WHERE sha256 = ?)")
+            args.append(input_sha256)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), args
+
+    def query(self, limit=100, **filters):
+        """
+        Newest jobs first, as dicts with their inputs and outputs. Filters: since / until (Unix time),
+        status, kind, input_sha256. Served from the indexes, so the cost depends on `limit`, not on the
+        journal size.
+        """
+        where, args = self._where(**filters)
+        with self._lock:
+            jobs = [dict(row) for row in self._conn.execute(
+                f"SELECT * FROM jobs{where} ORDER BY started_at DESC, id DESC LIMIT ?", args + [limit])]
+            if not jobs:
+                return []
+            by_id = {job["id"]: job for job in jobs}
+            for job in jobs:
+                job["params"] = json.loads(job["params"])
+                job["inputs"], job["outputs"] = [], []
+            placeholders = ",".join("?" * len(by_id))
+            for row in self._conn.execute(f"SELECT * FROM inputs WHERE job_id IN ({placeholders}) ORDER BY job_id, position", list(by_id)):
+                by_id[row["job_id"]]["inputs"].append({"path": row["path"], "sha256": row["sha256"], "bytes": row["bytes"]})
+            for row in self._conn.execute(f"SELECT * FROM outputs WHERE job_id IN ({placeholders}) ORDER BY job_id, position", list(by_id)):
+                by_id[row["job_id"]]["outputs"].append({"path": row["path"], "bytes": row["bytes"]})
+        return jobs
+
+    def summary(self, **filters):
+        """Job count, total and longest duration, and bytes per (kind, status) for the filtered jobs."""
+        where, args = self._where(**filters)
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(
+                "SELECT kind, status, COUNT(*) AS jobs, SUM(seconds) AS seconds, MAX(seconds) AS max_seconds, "
+                f"SUM(input_bytes) AS input_bytes, SUM(output_bytes) AS output_bytes FROM jobs{where} "
+                "GROUP BY kind, status ORDER BY kind, status", args)]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+_job_journal = None
+_job_journal_lock = threading.Lock()
+
+def get_job_journal():
+    """Returns the shared JobJournal, or None if it is disabled or cannot be opened."""
+    global _job_journal, JOURNAL_ENABLED
+    if not JOURNAL_ENABLED:
+        return None
+    with _job_journal_lock:
+        if _job_journal is None:
+            try:
+                os.makedirs(os.path.dirname(JOURNAL_PATH), exist_ok=True)
+                _job_journal = JobJournal(JOURNAL_PATH)
+            except (sqlite3.Error, OSError) as e:
+                user_log.warning(f"Job journal disabled: could not open {JOURNAL_PATH}: {e}")
+                JOURNAL_ENABLED = False
+                return None
+    return _job_journal
+
+JOB_HISTORY_LIMIT = 500 # Rows shown in the history window
+JOB_HISTORY_PERIODS = {"Last 24 hours": 86400, "Last 7 days": 7 * 86400, "Last 30 days": 30 * 86400, "All time": None}
+
+def parse_journal_time(text):
+    """
+    Turns a `--since` / `--until` value into Unix time: an age such as "30m", "12h", "7d" or "2w" (counted
+    back from now), or an ISO date/time such as "2024-05-01" or "2024-05-01T08:00".
+    """
+    text = str(text).strip()
+    units = {"m": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+    if len(text) > 1 and text[-1].lower() in units and text[:-1].replace('.', '', 1).isdigit():
+        return time.time() - float(text[:-1]) * units[text[-1].lower()]
+    try:
+        return datetime.fromisoformat(text).timestamp()
+    except ValueError:
+        raise ValueError(f"Invalid time '{text}'. Use an age like '7d' or '12h', or a date like '2024-05-01'.")
+
 def create_folders():
-    folders = ['All', 'Pdf', 'Office', 'Image', 'Txt', 'Other_Unprocessed']
+    folders = ['All', 'Pdf', 'Office', 'Image', 'Txt', 'Archive', 'Other_Unprocessed']
     # SCRIPT_DIR is already defined globally
     
     user_log.info("Ensuring output folders exist.")
-    debug_log.debug(f"Script directory for folders: {SCRIPT_DIR}")
+    debug_log.debug("Script directory for folders: %s", SCRIPT_DIR)
     
     for folder in folders:
         folder_path = os.path.join(SCRIPT_DIR, folder)
@@ -111,46 +742,233 @@ def create_folders():
             try:
                 os.makedirs(folder_path)
                 user_log.info(f"Created folder: {folder_path}")
-                debug_log.debug(f"Created folder: {folder_path}")
+                debug_log.debug("Created folder: %s", folder_path)
             except OSError as e:
                 user_log.error(f"Failed to create folder {folder_path}: {e}")
                 debug_log.exception(f"OSError while creating folder {folder_path}")
         else:
-            debug_log.debug(f"Folder already exists: {folder_path}")
+            debug_log.debug("Folder already exists: %s", folder_path)
     return SCRIPT_DIR
 
-def get_unique_filename(directory, filename):
-    base_name, ext = os.path.splitext(filename)
-    counter = 1
-    new_filename = f"{base_name}{ext}"
-    new_path = os.path.join(directory, new_filename)
-    
-    original_new_path = new_path
-    while os.path.exists(new_path):
-        new_filename = f"{base_name}_{counter}{ext}"
-        new_path = os.path.join(directory, new_filename)
-        counter += 1
-    
+def _split_name(filename):
+    # os.path.splitext, but archive extensions such as `.png.zip` (ARCHIVE_FORMATS) stay whole,
+    # so a clash gives `report_1.png.zip` rather than `report.png_1.zip`
+    lower = filename.lower()
+    for archive_ext in ARCHIVE_FORMATS:
+        if lower.endswith('.' + archive_ext) and len(filename) > len(archive_ext) + 1:
+            return filename[:-len(archive_ext) - 1], filename[-len(archive_ext) - 1:]
+    return os.path.splitext(filename)
+
+DIRECTORY_RESCAN_INTERVAL_SECONDS = 2.0 # A changed directory is scanned again at most this often; All/ can hold tens of thousands of files
+DIRECTORY_MTIME_GRANULARITY_SECONDS = 2.0 # Coarsest mtime resolution (FAT); a scan this close to a change may miss a later one
+
+class DirectoryNameIndex:
+    """
+    In-memory view of the names taken in one directory, built with a single os.scandir.
+    Keeps the lowest suffix that may still be free per (base, ext), so the next free `base_N.ext` is found
+    without probing `base_1`, `base_2`, ... one stat call at a time. Like a plain probe, gaps left by deleted
+    files are filled first. When the directory's mtime changes behind the index's back (files added or
+    deleted by other programs or processes), it is scanned again, at most every DIRECTORY_RESCAN_INTERVAL_SECONDS.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self.lock = threading.Lock()
+        self.scan()
+
+    def scan(self):
+        self._taken = set()
+        self._lowest_free = {} # (base, ext) -> lowest N for which base_N.ext may be free
+        self._mtime_ns = os.stat(self.directory).st_mtime_ns # Before the scan, so changes during it trigger a rescan
+        # Like git's "racy" index entries: a change in the same clock tick as the scan leaves the mtime unchanged
+        self._racy = time.time_ns() - self._mtime_ns < DIRECTORY_MTIME_GRANULARITY_SECONDS * 1e9
+        self._scanned_at = time.monotonic()
+        self._unchanged = True
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                self.add(entry.name)
+
+    def refresh(self):
+        """Rescans if the directory changed since the last scan or own reservation. Caller holds self.lock."""
+        self._unchanged = os.stat(self.directory).st_mtime_ns == self._mtime_ns and not self._racy
+        if not self._unchanged and time.monotonic() - self._scanned_at >= DIRECTORY_RESCAN_INTERVAL_SECONDS:
+            self.scan()
+            debug_log.debug("Directory %s may have changed; re-indexed %d name(s)", self.directory, len(self._taken))
+
+    def note_own_change(self):
+        # A name this index handed out was just created. If nothing else had changed, that needs no rescan.
+        if self._unchanged:
+            try:
+                self._mtime_ns = os.stat(self.directory).st_mtime_ns
+            except OSError:
+                pass
+
+    @staticmethod
+    def _key(name):
+        return os.path.normcase(name) # Case-insensitive on Windows, like the file system
+
+    def add(self, name):
+        self._taken.add(self._key(name))
+
+    def discard(self, name):
+        key = self._key(name)
+        self._taken.discard(key)
+        stem, ext = _split_name(key)
+        base, sep, number = stem.rpartition('_')
+        if sep and base and number.isdigit() and (base, ext) in self._lowest_free:
+            suffix_key = (base, ext)
+            self._lowest_free[suffix_key] = min(self._lowest_free[suffix_key], int(number))
+
+    def is_taken(self, name):
+        return self._key(name) in self._taken
+
+    def next_candidate(self, filename):
+        if not self.is_taken(filename):
+            return filename
+        base_name, ext = _split_name(filename)
+        suffix_key = (self._key(base_name), self._key(ext))
+        counter = self._lowest_free.get(suffix_key, 1)
+        while self.is_taken(f"{base_name}_{counter}{ext}"):
+            counter += 1
+        self._lowest_free[suffix_key] = counter
+        return f"{base_name}_{counter}{ext}"
+
+
+_directory_indexes = {}
+_directory_indexes_lock = threading.Lock()
+
+def _get_directory_index(directory):
+    key = os.path.normcase(os.path.abspath(directory))
+    with _directory_indexes_lock:
+        index = _directory_indexes.get(key)
+        if index is None:
+            index = DirectoryNameIndex(directory) # Raises FileNotFoundError for missing directories
+            _directory_indexes[key] = index
+            debug_log.debug("Indexed %d name(s) in %s", len(index._taken), directory)
+        return index
+
+def _forget_directory_index(directory):
+    with _directory_indexes_lock:
+        _directory_indexes.pop(os.path.normcase(os.path.abspath(directory)), None)
+
+def release_filename(path):
+    """Tells the directory index that `path` was moved away or deleted, so its name can be handed out again."""
+    key = os.path.normcase(os.path.abspath(os.path.dirname(path)))
+    with _directory_indexes_lock:
+        index = _directory_indexes.get(key)
+    if index is not None:
+        with index.lock:
+            index.discard(os.path.basename(path))
+
+def get_unique_filename(directory, filename, reserve=False):
+    """
+    Returns a path in `directory` for `filename` that is not in use, adding the lowest free `_1`, `_2`, ...
+    on conflicts. With `reserve=True` the name is claimed atomically by creating an empty file (O_EXCL), so
+    concurrent workers, even in other processes, never get the same path; the caller then overwrites that file.
+    """
+    original_new_path = os.path.join(directory, filename)
+    try:
+        index = _get_directory_index(directory)
+        with index.lock:
+            index.refresh()
+            while True:
+                new_filename = index.next_candidate(filename)
+                new_path = os.path.join(directory, new_filename)
+                if reserve:
+                    try:
+                        os.close(os.open(new_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                    except FileExistsError: # Created behind the index's back
+                        index.add(new_filename)
+                        continue
+                    index.note_own_change()
+                elif os.path.lexists(new_path): # One stat call guards against files added since the last scan
+                    index.add(new_filename)
+                    continue
+                index.add(new_filename)
+                break
+    except FileNotFoundError: # Directory does not exist (yet, or any more); every name in it is free
+        _forget_directory_index(directory)
+        return original_new_path
+
     if new_path != original_new_path:
-        debug_log.debug(f"Filename conflict for {original_new_path}. Renamed to {new_path}")
-        
+        debug_log.debug("Filename conflict for %s. Renamed to %s", original_new_path, new_path)
+
     return new_path
 
+# How sort_output_file puts a result into its second folder, in order of preference
+PLACEMENT_STRATEGIES = ["hardlink", "reflink", "copy"]
+LINUX_FICLONE = 0x40049409 # ioctl request for copy-on-write clones (Btrfs, XFS with reflink, ...)
+
+def _reflink_file(src, dst):
+    # Copy-on-write clone; only attempted on Linux. Returns True on success.
+    # On failure `dst` is left truncated for the caller to overwrite (it may be a reserved name).
+    if not sys.platform.startswith('linux'):
+        return False
+    import fcntl
+    try:
+        with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+            fcntl.ioctl(dst_file.fileno(), LINUX_FICLONE, src_file.fileno())
+        shutil.copystat(src, dst)
+        return True
+    except OSError:
+        return False
+
+def move_output_file(src, dst):
+    """
+    Moves `src` to `dst`, replacing a name reserved by get_unique_filename.
+    Returns "move" for a rename, or "copy" when it had to copy across devices.
+    """
+    try:
+        os.replace(src, dst)
+        strategy = "move"
+    except OSError:
+        shutil.move(src, dst) # Cross-device: copies, then removes the source
+        strategy = "copy"
+    release_filename(src)
+    return strategy
+
+def link_output_file(src, dst):
+    """
+    Makes `dst` (possibly a reserved, empty placeholder) a second name for `src`:
+    hardlink, reflink or (last resort) a copy. Returns the strategy used.
+    """
+    tmp_link = f"{dst}.{os.getpid()}.{threading.get_ident()}.link"
+    try:
+        os.link(src, tmp_link)
+        os.replace(tmp_link, dst) # os.link cannot overwrite the placeholder directly
+        return "hardlink"
+    except (OSError, AttributeError, NotImplementedError) as e: # Cross-device, FAT/exFAT, network shares, ...
+        debug_log.debug("Hardlink %s -> %s not possible: %s", src, dst, e)
+        if os.path.lexists(tmp_link):
+            os.remove(tmp_link)
+    if _reflink_file(src, dst):
+        return "reflink"
+    shutil.copy2(src, dst)
+    return "copy"
+
 def sort_output_file(output_path, script_dir):
-    user_log.info(f"Sorting output file: {os.path.basename(output_path)}")
-    debug_log.debug(f"sort_output_file called with output_path='{output_path}', script_dir='{script_dir}'")
+    # Runs once per output file (every page of a PDF-to-image job), so log arguments are %-style and only
+    # formatted by the log listener thread.
+    user_log.info("Sorting output file: %s", os.path.basename(output_path))
+    debug_log.debug("sort_output_file called with output_path='%s', script_dir='%s'", output_path, script_dir)
 
     all_folder = os.path.join(script_dir, 'All')
     base_name = os.path.basename(output_path)
-    
+    all_path = None
+    sort_started = time.perf_counter()
+    output_size = _path_size(output_path)
+
+    # The result is moved (not copied) into 'All'; the type folder then gets a link to the same data.
     try:
-        all_path = get_unique_filename(all_folder, base_name)
-        shutil.copy2(output_path, all_path)
-        user_log.info(f"Copied '{base_name}' to 'All' folder as '{os.path.basename(all_path)}'")
-        debug_log.debug(f"Copied {output_path} to {all_path}")
+        all_path = get_unique_filename(all_folder, base_name, reserve=True)
+        move_strategy = move_output_file(output_path, all_path)
+        user_log.info("Placed '%s' in 'All' folder as '%s' (strategy: %s)", base_name, os.path.basename(all_path), move_strategy)
+        debug_log.debug("Moved %s to %s via %s", output_path, all_path, move_strategy)
     except Exception as e:
-        user_log.error(f"Failed to copy {base_name} to 'All' folder: {e}")
-        debug_log.exception(f"Error copying {output_path} to {all_path}")
+        user_log.error(f"Failed to move {base_name} to 'All' folder: {e}")
+        debug_log.exception(f"Error moving {output_path} to {all_path}")
+        if all_path and os.path.exists(output_path) and os.path.exists(all_path) and os.path.getsize(all_path) == 0:
+            os.remove(all_path) # Drop the empty reserved name
+            release_filename(all_path)
         raise # Re-raise to indicate failure in sorting
 
     ext = os.path.splitext(output_path)[1].lower()
@@ -162,61 +980,58 @@ def sort_output_file(output_path, script_dir):
         dest_folder_name = 'Image'
     elif ext == '.txt':
         dest_folder_name = 'Txt'
+    elif ext in ['.zip', '.tar']:
+        dest_folder_name = 'Archive'
     else:
         dest_folder_name = 'Other_Unprocessed'
     
-    user_log.info(f"Categorized '{base_name}' to '{dest_folder_name}' type.")
+    user_log.info("Categorized '%s' to '%s' type.", base_name, dest_folder_name)
     dest_folder_path = os.path.join(script_dir, dest_folder_name)
+    dest_path = None
     
     try:
-        dest_path = get_unique_filename(dest_folder_path, base_name)
-        shutil.copy2(output_path, dest_path)
-        user_log.info(f"Copied '{base_name}' to '{dest_folder_name}' folder as '{os.path.basename(dest_path)}'")
-        debug_log.debug(f"Copied {output_path} to {dest_path}")
+        dest_path = get_unique_filename(dest_folder_path, base_name, reserve=True)
+        link_strategy = link_output_file(all_path, dest_path)
+        user_log.info("Placed '%s' in '%s' folder as '%s' (strategy: %s)", base_name, dest_folder_name, os.path.basename(dest_path), link_strategy)
+        debug_log.debug("Linked %s to %s via %s", all_path, dest_path, link_strategy)
     except Exception as e:
-        user_log.error(f"Failed to copy {base_name} to '{dest_folder_name}' folder: {e}")
-        debug_log.exception(f"Error copying {output_path} to {dest_path}")
-        # If copy to specific folder fails, the 'All' copy still exists.
-        # Decide if this is a critical failure. For now, we'll let 'All' copy persist.
-        # We might not want to remove the original if this step fails.
-        # However, the function expects to return two paths.
-        # For simplicity, we'll let it proceed and the original might not be removed.
-        # A more robust solution might involve cleanup or different return values.
+        user_log.error(f"Failed to place {base_name} in '{dest_folder_name}' folder: {e}")
+        debug_log.exception(f"Error placing {all_path} at {dest_path}")
+        # The 'All' copy still exists, so the conversion result is not lost.
+        record_stage("sort", time.perf_counter() - sort_started, backend=move_strategy, bytes_in=output_size)
+        return [all_path]
 
-    try:
-        os.remove(output_path)
-        debug_log.debug(f"Removed original temporary output file: {output_path}")
-    except Exception as e:
-        user_log.warning(f"Failed to remove temporary file {output_path}: {e}") # Warning, as copies exist
-        debug_log.exception(f"Error removing temporary file {output_path}")
-        
+    # Only a copy fallback writes the data again
+    record_stage("sort", time.perf_counter() - sort_started, backend=f"{move_strategy}+{link_strategy}", bytes_in=output_size,
+                 bytes_out=output_size * ((move_strategy == "copy") + (link_strategy == "copy")))
     return [all_path, dest_path]
 
 
 def open_file(filepath):
     user_log.info(f"Attempting to open file: {filepath}")
-    debug_log.debug(f"open_file called for: {filepath}")
+    debug_log.debug("open_file called for: %s", filepath)
     system = platform.system()
     try:
-        if system == 'Darwin':       # macOS
-            subprocess.call(('open', filepath))
-        elif system == 'Windows':    # Windows
-            os.startfile(filepath)
-        else:                        # linux variants
-            subprocess.call(('xdg-open', filepath))
+        with stage("open_file", backend=system.lower()):
+            if system == 'Darwin':       # macOS
+                subprocess.call(('open', filepath))
+            elif system == 'Windows':    # Windows
+                os.startfile(filepath)
+            else:                        # linux variants
+                subprocess.call(('xdg-open', filepath))
         user_log.info(f"Successfully initiated opening of {filepath}")
     except Exception as e:
         user_log.error(f"Could not open file {filepath}: {e}")
         debug_log.exception(f"Exception in open_file for {filepath}")
 
 
-def handle_output_file(output_path, final_output, multiple_files=False):
+def handle_output_file(output_path, final_output, multiple_files=False, open_outputs=True):
     script_dir = create_folders() # Ensures folders (and Logs folder via setup_logging) exist
     sorted_files_aggregate = []
     
     operation_description = f"main output hint: {os.path.basename(output_path)}, final output(s): {final_output if isinstance(final_output, str) else [os.path.basename(f) for f in final_output]}"
     user_log.info(f"Handling output file(s). {operation_description}")
-    debug_log.debug(f"handle_output_file: output_path='{output_path}', final_output='{final_output}', multiple_files={multiple_files}")
+    debug_log.debug("handle_output_file: output_path='%s', final_output='%s', multiple_files=%s", output_path, final_output, multiple_files)
 
     if multiple_files:
         if not isinstance(final_output, list): # Ensure final_output is a list for multiple_files
@@ -224,8 +1039,8 @@ def handle_output_file(output_path, final_output, multiple_files=False):
             debug_log.warning(f"handle_output_file: multiple_files is True but final_output was not a list. Corrected.")
 
         for i, file_item in enumerate(final_output):
-            user_log.info(f"Sorting file {i+1}/{len(final_output)}: {os.path.basename(file_item)}")
-            debug_log.debug(f"Sorting multiple file item: {file_item}")
+            user_log.info("Sorting file %d/%d: %s", i + 1, len(final_output), os.path.basename(file_item))
+            debug_log.debug("Sorting multiple file item: %s", file_item)
             try:
                 sorted_paths_for_item = sort_output_file(file_item, script_dir)
                 sorted_files_aggregate.extend(sorted_paths_for_item)
@@ -235,7 +1050,7 @@ def handle_output_file(output_path, final_output, multiple_files=False):
                 # Continue with other files if one fails
     else:
         user_log.info(f"Sorting single file: {os.path.basename(final_output)}")
-        debug_log.debug(f"Sorting single file item: {final_output}")
+        debug_log.debug("Sorting single file item: %s", final_output)
         try:
             sorted_files_aggregate = sort_output_file(final_output, script_dir)
         except Exception as e:
@@ -248,7 +1063,7 @@ def handle_output_file(output_path, final_output, multiple_files=False):
     
     opened_files_log = []
     # Only open unique files from the 'All' folder
-    unique_all_files_to_open = {f for f in sorted_files_aggregate if os.path.dirname(f).endswith('All')}
+    unique_all_files_to_open = {f for f in sorted_files_aggregate if os.path.dirname(f).endswith('All')} if open_outputs else set()
 
     for file_to_open in unique_all_files_to_open:
         open_file(file_to_open) # open_file handles its own logging
@@ -256,25 +1071,253 @@ def handle_output_file(output_path, final_output, multiple_files=False):
 
     if opened_files_log:
         user_log.info(f"Automatically opened files in 'All' folder: {', '.join(opened_files_log)}")
+    elif not open_outputs:
+        debug_log.debug("Automatic opening of output files disabled for this request.")
     else:
         user_log.info("No files were automatically opened (either none in 'All' folder or opening failed).")
         
     return sorted_files_aggregate
 
+# --- LibreOffice Listener Pool ---
+SOFFICE_TIMEOUT_SECONDS = 120 # Per-document conversion timeout, for both cold-start and listener modes
+# Number of warm soffice listeners to keep; 0 keeps the classic one-process-per-document behaviour.
+SOFFICE_POOL_SIZE = int(os.environ.get("FILE_CONVERTER_SOFFICE_POOL", "0") or 0)
+SOFFICE_STARTUP_TIMEOUT_SECONDS = 60
+SOFFICE_PROFILE_PREFIX = "file_converter_soffice_" # Each pool gets a private mkdtemp() folder of listener profiles
+
+# Export filter per UNO document service; the first service the loaded document supports wins.
+SOFFICE_PDF_EXPORT_FILTERS = [
+    ("com.sun.star.text.GenericTextDocument", "writer_pdf_Export"),
+    ("com.sun.star.sheet.SpreadsheetDocument", "calc_pdf_Export"),
+    ("com.sun.star.presentation.PresentationDocument", "impress_pdf_Export"),
+    ("com.sun.star.drawing.DrawingDocument", "draw_pdf_Export"),
+]
+
+
+class SofficeListener:
+    """One headless soffice process accepting UNO connections on a local socket, with its own profile."""
+    def __init__(self, index, profile_root):
+        self.index = index
+        self.profile_dir = os.path.join(profile_root, f"profile_{index}")
+        self.port = None
+        self.process = None
+        self.desktop = None
+
+    def _find_free_port(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
+
+    def start(self):
+        import uno
+        os.makedirs(self.profile_dir, exist_ok=True)
+        self.port = self._find_free_port()
+        profile_url = uno.systemPathToFileUrl(os.path.abspath(self.profile_dir))
+        cmd = [
+            'soffice', '--headless', '--invisible', '--nologo', '--norestore', '--nodefault', '--nolockcheck',
+            f'-env:UserInstallation={profile_url}',
+            f'--accept=socket,host=127.0.0.1,port={self.port};urp;StarOffice.ComponentContext',
+        ]
+        debug_log.debug("Starting soffice listener %s: %s", self.index, cmd)
+        try:
+            self.process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except FileNotFoundError:
+            raise ValueError("LibreOffice (soffice) not found. Please ensure it is installed and in your system's PATH.")
+
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext("com.sun.star.bridge.UnoUrlResolver", local_context)
+        deadline = time.monotonic() + SOFFICE_STARTUP_TIMEOUT_SECONDS
+        while True:
+            try:
+                remote_context = resolver.resolve(f"uno:socket,host=127.0.0.1,port={self.port};urp;StarOffice.ComponentContext")
+                self.desktop = remote_context.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", remote_context)
+                break
+            except Exception as e: # NoConnectException until soffice is listening
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    self.stop()
+                    raise ValueError(f"soffice listener {self.index} failed to start: {e}")
+                time.sleep(0.25)
+        user_log.info(f"Started LibreOffice listener {self.index} on port {self.port}.")
+
+    def is_healthy(self):
+        if self.process is None or self.process.poll() is not None or self.desktop is None:
+            return False
+        try:
+            self.desktop.getComponents() # Cheap round trip over the bridge
+            return True
+        except Exception as e:
+            debug_log.warning(f"soffice listener {self.index} failed health check: {e}")
+            return False
+
+    def restart(self):
+        self.stop()
+        self.start()
+
+    def stop(self):
+        if self.desktop is not None:
+            try:
+                self.desktop.terminate()
+            except Exception:
+                pass # The process may already be gone
+            self.desktop = None
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            debug_log.debug("soffice listener %s stopped (exit code %s).", self.index, self.process.returncode)
+            self.process = None
+
+    def kill(self):
+        # Used when a conversion hangs; the UNO bridge cannot be trusted anymore
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+        self.process = None
+        self.desktop = None
+
+    def convert(self, input_path, output_path):
+        import uno
+
+        def prop(name, value):
+            p = uno.createUnoStruct("com.sun.star.beans.PropertyValue")
+            p.Name = name
+            p.Value = value
+            return p
+
+        input_url = uno.systemPathToFileUrl(os.path.abspath(input_path))
+        output_url = uno.systemPathToFileUrl(os.path.abspath(output_path))
+        document = self.desktop.loadComponentFromURL(input_url, "_blank", 0, (prop("Hidden", True), prop("ReadOnly", True)))
+        if document is None:
+            raise ValueError(f"LibreOffice could not open {os.path.basename(input_path)}.")
+        try:
+            filter_name = next((f for service, f in SOFFICE_PDF_EXPORT_FILTERS if document.supportsService(service)), "writer_pdf_Export")
+            debug_log.debug("soffice listener %s exporting %s with filter %s", self.index, input_path, filter_name)
+            document.storeToURL(output_url, (prop("FilterName", filter_name),))
+        finally:
+            document.close(True)
+
+
+class SofficeListenerPool:
+    """
+    Keeps `size` warm soffice listeners and hands each conversion to an idle one.
+    Listeners are started on first use, health-checked before every conversion and
+    restarted when they crash or exceed SOFFICE_TIMEOUT_SECONDS. Profiles live in a folder private to
+    this pool (so two app instances never share one), removed on shutdown.
+    """
+    def __init__(self, size):
+        self.size = size
+        self.profile_root = tempfile.mkdtemp(prefix=SOFFICE_PROFILE_PREFIX)
+        self.listeners = [SofficeListener(i, self.profile_root) for i in range(size)]
+        self._idle = queue.Queue()
+        for listener in self.listeners:
+            self._idle.put(listener)
+
+    def convert(self, input_path, output_path, timeout=SOFFICE_TIMEOUT_SECONDS):
+        base_name = os.path.basename(input_path)
+        deadline = time.monotonic() + timeout
+        try:
+            listener = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise ValueError(f"LibreOffice/soffice conversion timed out for {base_name}.")
+        try:
+            if not listener.is_healthy():
+                if listener.process is not None:
+                    user_log.warning(f"LibreOffice listener {listener.index} is unresponsive; restarting it.")
+                listener.restart()
+
+            outcome = {}
+            def run():
+                try:
+                    listener.convert(input_path, output_path)
+                except Exception as e:
+                    outcome['error'] = e
+            worker = threading.Thread(target=run, name=f"SofficeListener{listener.index}", daemon=True)
+            worker.start()
+            worker.join(max(0, deadline - time.monotonic()))
+
+            if worker.is_alive():
+                listener.kill() # Also unblocks the worker thread; the listener restarts on next use
+                raise ValueError(f"LibreOffice/soffice conversion timed out for {base_name}.")
+            if 'error' in outcome:
+                if not listener.is_healthy():
+                    user_log.warning(f"LibreOffice listener {listener.index} crashed while converting '{base_name}'; it will be restarted.")
+                    listener.kill()
+                raise outcome['error']
+            if not os.path.exists(output_path):
+                raise ValueError(f"soffice listener conversion seemed to succeed but expected output PDF not found: {output_path}")
+            return output_path
+        finally:
+            self._idle.put(listener)
+
+    def shutdown(self):
+        for listener in self.listeners:
+            listener.stop()
+        shutil.rmtree(self.profile_root, ignore_errors=True)
+
+
+_soffice_listener_pool = None
+_soffice_listener_pool_lock = threading.Lock()
+
+def get_soffice_listener_pool():
+    """Returns the shared listener pool, or None when pooling is disabled or UNO is not importable."""
+    global _soffice_listener_pool
+    if SOFFICE_POOL_SIZE <= 0:
+        return None
+    with _soffice_listener_pool_lock:
+        if _soffice_listener_pool is None:
+            if importlib.util.find_spec("uno") is None: # Only available in LibreOffice's Python or with the python3-uno package
+                user_log.warning("LibreOffice listener pool requested but the 'uno' module is not available; using one soffice process per document.")
+                return None
+            _soffice_listener_pool = SofficeListenerPool(SOFFICE_POOL_SIZE)
+            atexit.register(shutdown_soffice_listener_pool)
+            user_log.info(f"LibreOffice listener pool enabled with {SOFFICE_POOL_SIZE} instance(s).")
+        return _soffice_listener_pool
+
+def shutdown_soffice_listener_pool():
+    global _soffice_listener_pool
+    with _soffice_listener_pool_lock:
+        if _soffice_listener_pool is not None:
+            _soffice_listener_pool.shutdown()
+            _soffice_listener_pool = None
+            debug_log.debug("LibreOffice listener pool shut down.")
+
+
 def convert_office_to_pdf(input_path, output_path):
     user_log.info(f"Converting Office file '{os.path.basename(input_path)}' to PDF.")
-    debug_log.debug(f"Executing soffice for {input_path} to {output_path}")
+    listener_pool = get_soffice_listener_pool()
+    if listener_pool is not None:
+        debug_log.debug("Sending %s to LibreOffice listener pool for %s", input_path, output_path)
+        try:
+            with stage("convert", backend="soffice-listener", bytes_in=_path_size(input_path)) as convert_stage:
+                listener_pool.convert(input_path, output_path)
+                convert_stage.bytes_out = _path_size(output_path)
+        except ValueError as e: # Timeout, startup failure, missing output
+            user_log.error(str(e))
+            debug_log.error(f"LibreOffice listener conversion failed for {input_path}: {e}")
+            raise
+        except Exception as e: # UNO errors raised while loading or exporting the document
+            err_msg = f"An unexpected error occurred during Office to PDF conversion of {os.path.basename(input_path)}: {str(e)}"
+            user_log.error(err_msg)
+            debug_log.exception(err_msg)
+            raise ValueError(err_msg)
+        user_log.info(f"Successfully converted '{os.path.basename(input_path)}' to PDF via LibreOffice listener: '{os.path.basename(output_path)}'")
+        return output_path
+
+    debug_log.debug("Executing soffice for %s to %s", input_path, output_path)
     try:
         # Ensure output directory exists
         outdir = os.path.dirname(output_path)
         if not os.path.exists(outdir):
             os.makedirs(outdir)
-            debug_log.debug(f"Created output directory for soffice: {outdir}")
+            debug_log.debug("Created output directory for soffice: %s", outdir)
 
-        process = subprocess.run([
-            'soffice', '--headless', '--convert-to', 'pdf', f'--outdir',
-            outdir, input_path
-        ], check=True, capture_output=True, text=True, timeout=120) # Added timeout
+        with stage("convert", backend="soffice", bytes_in=_path_size(input_path)): # Includes LibreOffice start-up
+            process = subprocess.run([
+                'soffice', '--headless', '--convert-to', 'pdf', f'--outdir',
+                outdir, input_path
+            ], check=True, capture_output=True, text=True, timeout=SOFFICE_TIMEOUT_SECONDS)
         
         # soffice might create output with original name in outdir, not necessarily output_path name
         # We need to find the generated PDF.
@@ -286,9 +1329,9 @@ def convert_office_to_pdf(input_path, output_path):
             if generated_pdf_path != output_path:
                  # If soffice used a different name, rename/move it to the expected output_path
                 shutil.move(generated_pdf_path, output_path)
-                debug_log.debug(f"Moved/Renamed soffice output from {generated_pdf_path} to {output_path}")
+                debug_log.debug("Moved/Renamed soffice output from %s to %s", generated_pdf_path, output_path)
             user_log.info(f"Successfully converted '{os.path.basename(input_path)}' to PDF: '{os.path.basename(output_path)}'")
-            debug_log.debug(f"soffice output for {input_path}: STDOUT: {process.stdout}, STDERR: {process.stderr}")
+            debug_log.debug("soffice output for %s: STDOUT: %s, STDERR: %s", input_path, process.stdout, process.stderr)
             return output_path
         else:
             err_msg = f"soffice conversion seemed to succeed but expected output PDF not found: {generated_pdf_path}"
@@ -318,111 +1361,681 @@ def convert_office_to_pdf(input_path, output_path):
         raise ValueError(err_msg)
 
 
-def convert_images_to_pdf(input_paths, output_path):
+# Page geometry used when placing images on PDF pages (A4, 10 mm margins)
+A4_WIDTH_MM = 210
+A4_HEIGHT_MM = 297
+PAGE_MARGIN_MM = 10
+POINTS_PER_MM = 72 / 25.4
+
+# Optional downsampling of images larger than their placement on the page needs
+IMAGE_PDF_TARGET_DPI = int(os.environ.get("FILE_CONVERTER_IMAGE_DPI", "0") or 0) or None # None embeds images unchanged
+IMAGE_PDF_DOWNSAMPLE_MIN_RATIO = 1.5 # Only images with at least this many times the needed pixels per side are resampled
+IMAGE_PDF_JPEG_QUALITY_RANGE = (50, 90) # Re-encoded JPEGs keep the source's estimated quality, clamped to this range
+IMAGE_PDF_RESAMPLE_MODES = ('RGB', 'RGBA', 'L', 'LA')
+# TIFF tags read to copy Group 4 fax strips into the PDF unchanged
+TIFF_PHOTOMETRIC = 262
+TIFF_FILL_ORDER = 266
+TIFF_STRIP_OFFSETS = 273
+TIFF_ROWS_PER_STRIP = 278
+TIFF_STRIP_BYTE_COUNTS = 279
+# JPEG (ITU T.81 Annex K) luminance table that libjpeg scales to get quality 1-100
+_JPEG_STD_LUMINANCE_TABLE = (16, 11, 10, 16, 24, 40, 51, 61, 12, 12, 14, 19, 26, 58, 60, 55,
+                             14, 13, 16, 24, 40, 57, 69, 56, 14, 17, 22, 29, 51, 87, 80, 62,
+                             18, 22, 37, 56, 68, 109, 103, 77, 24, 35, 55, 64, 81, 104, 113, 92,
+                             49, 64, 78, 87, 103, 121, 120, 101, 72, 92, 95, 98, 112, 100, 103, 99)
+
+def _fit_image_on_a4(img_width, img_height):
+    # Fit width to A4 width minus margins; if the height then exceeds the page, scale by height instead.
+    # Only the aspect ratio of the size matters. Returns the (x, y, width, height) placement in mm.
+    available_width_mm = A4_WIDTH_MM - 2 * PAGE_MARGIN_MM
+    available_height_mm = A4_HEIGHT_MM - 2 * PAGE_MARGIN_MM
+
+    img_aspect_ratio = img_width / img_height
+    display_width_mm = available_width_mm
+    display_height_mm = display_width_mm / img_aspect_ratio
+    if display_height_mm > available_height_mm:
+        display_height_mm = available_height_mm
+        display_width_mm = display_height_mm * img_aspect_ratio
+
+    # Center the image
+    x_pos = (A4_WIDTH_MM - display_width_mm) / 2
+    y_pos = (A4_HEIGHT_MM - display_height_mm) / 2
+    if y_pos < PAGE_MARGIN_MM : y_pos = PAGE_MARGIN_MM # Ensure it's within top margin
+    return x_pos, y_pos, display_width_mm, display_height_mm
+
+def _physical_image_size(image):
+    """
+    The image's size in inches when its horizontal and vertical resolutions differ (e.g. 204x98 dpi fax TIFFs,
+    whose pixels are twice as tall as wide), otherwise its size in pixels.
+    """
+    width_px, height_px = image.size
+    try:
+        x_dpi, y_dpi = (float(value) for value in image.info.get('dpi', (0, 0)))
+    except (TypeError, ValueError):
+        return width_px, height_px
+    if x_dpi <= 0 or y_dpi <= 0 or x_dpi == y_dpi:
+        return width_px, height_px
+    return width_px / x_dpi, height_px / y_dpi
+
+def _image_source_for_pdf(image, input_path):
+    """
+    Decides how an opened PIL image is handed to fitz without temp files.
+    JPEG and PNG files are embedded from disk as they are (JPEG stays DCT-encoded, PNG stays lossless);
+    anything else is re-encoded once to an in-memory PNG. Returns kwargs for Page.insert_image.
+    """
+    if image.format in ('JPEG', 'PNG'):
+        return {'filename': input_path}
+    if image.mode not in ('RGB', 'RGBA', 'L', 'LA', '1'):
+        image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG')
+    return {'stream': buffer.getvalue()}
+
+def _image_pixels_needed(display_width_mm, display_height_mm, target_dpi):
+    # Pixel size that gives `target_dpi` at the image's printed size
+    return (max(1, math.ceil(display_width_mm / 25.4 * target_dpi)),
+            max(1, math.ceil(display_height_mm / 25.4 * target_dpi)))
+
+def estimate_jpeg_quality(image):
+    """
+    Estimates the libjpeg quality (1-100) a JPEG was saved with from its luminance quantization table,
+    or returns None for other images. Encoders that don't use scaled standard tables get a rough value.
+    """
+    tables = getattr(image, 'quantization', None)
+    if not tables or 0 not in tables:
+        return None
+    scale = sum(tables[0]) * 100 / sum(_JPEG_STD_LUMINANCE_TABLE) # Table order doesn't matter for the sum
+    quality = (200 - scale) / 2 if scale <= 100 else 5000 / scale
+    return max(1, min(100, round(quality)))
+
+def _downsampled_image_source(image, target_size):
+    """
+    Decodes `image` at (about) `target_size` and returns insert_image kwargs for the resampled copy.
+    JPEGs use draft mode, so libjpeg decodes straight to the smallest 1/2, 1/4 or 1/8 scale that is still
+    at least `target_size`; Lanczos then scales the rest of the way. JPEG sources are re-encoded as JPEG at
+    their own estimated quality, everything else as PNG so it stays lossless.
+    """
+    Image = import_backend('PIL.Image')
+    source_format = image.format
+    quality = estimate_jpeg_quality(image)
+    if source_format == 'JPEG' and image.mode in ('RGB', 'L'):
+        image.draft(image.mode, target_size)
+    if image.mode not in IMAGE_PDF_RESAMPLE_MODES:
+        image = image.convert('RGBA' if 'A' in image.getbands() or 'transparency' in image.info else 'RGB')
+    resized = image.resize(target_size, Image.LANCZOS, reducing_gap=3.0) # reducing_gap box-reduces first on non-draft images
+    buffer = io.BytesIO()
+    if source_format == 'JPEG' and resized.mode in ('RGB', 'L'):
+        low, high = IMAGE_PDF_JPEG_QUALITY_RANGE
+        resized.save(buffer, 'JPEG', quality=max(low, min(high, quality or high)))
+    else:
+        resized.save(buffer, 'PNG')
+    return {'stream': buffer.getvalue()}
+
+def _ccitt_g4_strip(image):
+    """
+    Returns `(data, black_is_1)` for the current TIFF frame if it is a single Group 4 strip that a PDF
+    CCITTFaxDecode filter can read as it is, else None.
+    """
+    tags = image.tag_v2
+    offsets, byte_counts = tags.get(TIFF_STRIP_OFFSETS), tags.get(TIFF_STRIP_BYTE_COUNTS)
+    if (image.info.get('compression') != 'group4' or tags.get(TIFF_FILL_ORDER, 1) != 1
+            or tags.get(TIFF_PHOTOMETRIC) not in (0, 1) or not offsets or len(offsets) != 1):
+        return None
+    # PIL seeks its file itself before every read, so borrowing it here is safe
+    image.fp.seek(offsets[0])
+    data = image.fp.read(byte_counts[0])
+    # The codec writes bit 0 as a white run; with BlackIsZero (1) those zero bits are meant to be black
+    return data, tags.get(TIFF_PHOTOMETRIC) == 1
+
+def _add_bilevel_image(pdf, image):
+    """
+    Adds the current 1-bit TIFF frame to `pdf` as a CCITT Group 4 image XObject. Returns its xref and size.
+    Group 4 single-strip frames are copied byte for byte; other bilevel frames are re-encoded to one
+    Group 4 strip by libtiff. The page keeps 1 bit per pixel instead of becoming an 8-bit image.
+    """
+    strip = _ccitt_g4_strip(image)
+    if strip is None:
+        Image = import_backend('PIL.Image')
+        buffer = io.BytesIO()
+        image.save(buffer, 'TIFF', compression='group4', tiffinfo={TIFF_ROWS_PER_STRIP: image.height})
+        buffer.seek(0)
+        with Image.open(buffer) as encoded:
+            strip = _ccitt_g4_strip(encoded)
+    data, black_is_1 = strip
+    width, height = image.size
+    xref = pdf.get_new_xref()
+    pdf.update_object(xref, f"<</Type/XObject/Subtype/Image/Width {width}/Height {height}/ColorSpace/DeviceGray/BitsPerComponent 1>>")
+    pdf.update_stream(xref, data, compress=False)
+    # update_stream resets /Filter, so the CCITT parameters are set afterwards
+    pdf.xref_set_key(xref, "Filter", "/CCITTFaxDecode")
+    pdf.xref_set_key(xref, "DecodeParms", f"<</K -1/Columns {width}/Rows {height}/BlackIs1 {'true' if black_is_1 else 'false'}>>")
+    return xref, len(data)
+
+def _add_image_page(pdf, image, input_path, target_dpi=None):
+    """Adds the current frame of an opened PIL image to `pdf` on a new A4 page."""
+    fitz = load_fitz()
+    img_width_px, img_height_px = image.size
+    x_pos, y_pos, display_width_mm, display_height_mm = _fit_image_on_a4(*_physical_image_size(image))
+    target_size = _image_pixels_needed(display_width_mm, display_height_mm, target_dpi) if target_dpi else None
+    if image.format == 'TIFF' and image.mode == '1':
+        with stage("decode", backend="ccitt", pages=1) as decode_stage:
+            xref, decode_stage.bytes_out = _add_bilevel_image(pdf, image)
+        image_source = {'xref': xref}
+        debug_log.debug("Embedding %s (TIFF frame %d, %dx%d) as CCITT Group 4", input_path, image.tell(), img_width_px, img_height_px)
+    elif (target_size and img_width_px >= target_size[0] * IMAGE_PDF_DOWNSAMPLE_MIN_RATIO
+          and img_height_px >= target_size[1] * IMAGE_PDF_DOWNSAMPLE_MIN_RATIO): # Both sides: pixels need not be square
+        with stage("decode", backend="pil-downsample", pages=1) as decode_stage:
+            image_source = _downsampled_image_source(image, target_size)
+            decode_stage.bytes_out = len(image_source['stream'])
+        debug_log.debug("Embedding %s (%s, %s) downsampled from %dx%d to %dx%d", input_path, image.format, image.mode,
+                        img_width_px, img_height_px, target_size[0], target_size[1])
+    else:
+        with stage("decode", backend="pil", pages=1) as decode_stage:
+            image_source = _image_source_for_pdf(image, input_path)
+            decode_stage.bytes_out = len(image_source.get('stream', b''))
+        debug_log.debug("Embedding %s (%s, %s) %s", input_path, image.format, image.mode, 'as-is' if 'filename' in image_source else 'via in-memory PNG')
+
+    with stage("convert", backend="fitz", pages=1):
+        page = pdf.new_page(width=A4_WIDTH_MM * POINTS_PER_MM, height=A4_HEIGHT_MM * POINTS_PER_MM)
+        rect = fitz.Rect(x_pos, y_pos, x_pos + display_width_mm, y_pos + display_height_mm) * POINTS_PER_MM
+        page.insert_image(rect, keep_proportion=False, **image_source) # rect already has the physical aspect ratio
+
+def convert_images_to_pdf(input_paths, output_path, progress_callback=None, target_dpi=None, to_memory=False):
+    """
+    Places each image on its own A4 page; every frame of a multi-page TIFF gets its own page. With
+    `target_dpi`, images with more than IMAGE_PDF_DOWNSAMPLE_MIN_RATIO times the pixels their placement
+    needs at that DPI are downsampled; the rest are embedded unchanged. With `to_memory` the PDF is
+    returned as bytes and `output_path` only names it in the log.
+    """
     user_log.info(f"Converting {len(input_paths)} image(s) to PDF: {os.path.basename(output_path)}")
-    debug_log.debug(f"convert_images_to_pdf called with input_paths: {input_paths}, output_path: {output_path}")
-    pdf = FPDF()
-    
+    debug_log.debug("convert_images_to_pdf called with input_paths: %s, output_path: %s, target_dpi: %s", input_paths, output_path, target_dpi)
+    fitz = load_fitz()
+    Image = import_backend('PIL.Image')
+    ImageSequence = import_backend('PIL.ImageSequence')
+    pdf = fitz.open()
+
     for i, input_path in enumerate(input_paths):
-        debug_log.debug(f"Processing image {i+1}/{len(input_paths)}: {input_path}")
+        debug_log.debug("Processing image %d/%d: %s", i + 1, len(input_paths), input_path)
         try:
-            image = Image.open(input_path)
-            if image.mode == "RGBA":
-                image = image.convert("RGB")
-                debug_log.debug(f"Converted image {input_path} from RGBA to RGB")
-            
-            # Using a temporary file for FPDF image processing can be more robust for various formats
-            # Ensure temp file has a unique name to avoid clashes if script is run concurrently (less likely for GUI app)
-            temp_filename = f"temp_image_for_pdf_{os.path.basename(input_path)}_{i}.jpg"
-            temp_path = os.path.join(os.path.dirname(output_path), temp_filename) # Place temp in output dir
-            
-            image.save(temp_path, "JPEG")
-            debug_log.debug(f"Saved temporary JPEG for PDF: {temp_path}")
-            
-            pdf.add_page()
-            # Get image dimensions to scale it appropriately for A4 (210x297 mm)
-            img_width_px, img_height_px = image.size
-            # Convert pixels to mm (assuming 72 DPI for FPDF, though it's more complex)
-            # FPDF uses points (1/72 inch), 1 inch = 25.4 mm
-            # For simplicity, fit width to A4 width (210mm) minus margins (e.g., 10mm each side)
-            available_width_mm = 210 - 20 # 10mm margin on each side
-            
-            img_aspect_ratio = img_width_px / img_height_px
-            display_width_mm = available_width_mm
-            display_height_mm = display_width_mm / img_aspect_ratio
-
-            # If height exceeds A4 height (297mm) minus margins, scale by height instead
-            available_height_mm = 297 - 20
-            if display_height_mm > available_height_mm:
-                display_height_mm = available_height_mm
-                display_width_mm = display_height_mm * img_aspect_ratio
-
-            # Center the image
-            x_pos = (210 - display_width_mm) / 2
-            y_pos = (297 - display_height_mm) / 2
-            if y_pos < 10 : y_pos = 10 # Ensure it's within top margin
-
-            pdf.image(temp_path, x=x_pos, y=y_pos, w=display_width_mm)
-            os.remove(temp_path)
-            debug_log.debug(f"Added {input_path} to PDF and removed temp file {temp_path}")
-            
+            # Image.open only parses the header; pixel data is decoded later only if re-encoding is needed
+            with stage("open", backend="pil", bytes_in=_path_size(input_path)):
+                image = Image.open(input_path)
+            with image:
+                # TIFF frames are visited by seeking, so only the current one is decoded and held in memory
+                for frame in ImageSequence.Iterator(image) if image.format == 'TIFF' else [image]:
+                    _add_image_page(pdf, frame, input_path, target_dpi)
+            debug_log.debug("Added %s to PDF", input_path)
+
         except Exception as e:
             user_log.error(f"Failed to process image {input_path}: {e}")
             debug_log.exception(f"Error processing image {input_path} for PDF conversion.")
             # Continue to next image if one fails
-            
-    if not pdf.pages: # Check if any pages were added
+        if progress_callback:
+            progress_callback(i + 1, len(input_paths))
+
+    if not pdf.page_count: # Check if any pages were added
+        pdf.close()
         err_msg = "No images were successfully processed to create the PDF."
         user_log.error(err_msg)
         debug_log.error(err_msg + f" Input images: {input_paths}")
         raise ValueError(err_msg)
 
     try:
-        pdf.output(output_path)
+        with stage("write", backend="fitz", pages=pdf.page_count) as write_stage:
+            # deflate compresses lossless image data; JPEG streams are left as they are
+            if to_memory:
+                result = pdf.tobytes(garbage=1, deflate=True)
+                write_stage.bytes_out = len(result)
+            else:
+                pdf.save(output_path, garbage=1, deflate=True)
+                write_stage.bytes_out = _path_size(output_path)
+                result = output_path
         user_log.info(f"Successfully created PDF from images: {os.path.basename(output_path)}")
     except Exception as e:
         user_log.error(f"Failed to save PDF {output_path}: {e}")
         debug_log.exception(f"Error saving PDF {output_path} from images.")
         raise
-    return output_path
+    finally:
+        pdf.close()
+    return result
+
+# Text -> PDF layout. Each page is compressed and written as soon as it is full, so memory use stays at
+# one page of text however large the input is. Fonts are either a standard PDF font (no embedding,
+# Windows-1252 characters only) or a TrueType font, embedded as a subset of the glyphs the text uses.
+TEXT_PDF_FONT_SIZE = 10
+TEXT_PDF_LINE_HEIGHT = 12 # Points from one baseline to the next
+TEXT_PDF_TAB_SIZE = 8
+TEXT_PDF_READ_CHUNK_CHARS = 1024 * 1024 # Characters read per step; a longer unbroken line is wrapped there
+TEXT_PDF_FONT_ENV = "FILE_CONVERTER_TEXT_FONT" # Default TrueType font file for text -> PDF
+TEXT_PDF_CORE_FONTS = {False: ("helv", "Helvetica"), True: ("cour", "Courier")} # monospace -> (fitz name, BaseFont)
+TEXT_PDF_COMPRESSION_LEVEL = 1 # zlib level 6 compresses ~5x slower for ~30% smaller pages
+_TEXT_CONTROL_CHARS = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]") # Shown as nothing; tabs are expanded first
+_NON_BMP_CHARS = re.compile("[\U00010000-\U0010ffff]")
+
+class TextPdfFont:
+    """
+    Glyph widths (in 1/1000 em) and content-stream encoding for the text writer. Without `font_path` a
+    standard font is used (Courier when `monospace`); characters outside Windows-1252 become '?'.
+    With `font_path` the TrueType font is embedded, cut down to the used glyphs (see subset). Its character
+    ids are the characters' UTF-16 codes, mapped to glyphs by a CIDToGIDMap, so a whole chunk is encoded by
+    `str.encode` and hexlify in C.
+    """
+    def __init__(self, font_path=None, monospace=False):
+        fitz = load_fitz()
+        self.font_data = None
+        if font_path:
+            with open(font_path, 'rb') as f:
+                self.font_data = f.read()
+            if self.font_data[:4] not in (b"\x00\x01\x00\x00", b"true"):
+                raise ValueError(f"'{os.path.basename(font_path)}' is not a TrueType (.ttf) font; only TrueType fonts can be embedded.")
+            self.font = fitz.Font(fontbuffer=self.font_data)
+            self.base_font = re.sub(r"[^A-Za-z0-9+-]", "", self.font.name) or "EmbeddedFont"
+            self.string_open, self.string_close = b"<", b">"
+        else:
+            fitz_name, self.base_font = TEXT_PDF_CORE_FONTS[bool(monospace)]
+            self.font = fitz.Font(fitz_name)
+            self.string_open, self.string_close = b"(", b")"
+        self.widths = {} # char -> advance
+        self.max_width = 1 # Widest advance seen so far
+        self.min_width = 1000 # Narrowest non-zero advance seen so far
+        self.used_chars = {} # character id -> (advance, glyph id), embedded font only
+        self.missing_chars = set()
+        self.beyond_bmp = False # Seen characters that need U+FFFD in their place (embedded font)
+        # Byte -> width in 1/100 em rounded up, to bound a line's width in C: the Windows-1252 operand bytes
+        # for a standard font, the ASCII bytes of an ASCII-only line for an embedded one
+        if self.embedded:
+            self.add_chars(bytes(range(32, 127)).decode('ascii'))
+            byte_widths = [self.widths.get(chr(code), 0xFFFF) for code in range(256)]
+        else: # Knowing every width up front also makes max_width exact
+            self.add_chars(bytes(range(32, 256)).decode('cp1252', errors='ignore'))
+            byte_widths = [self.widths.get(bytes([code]).decode('cp1252', errors='ignore'), self.max_width) for code in range(256)]
+        self.width_table = bytes(min(255, -(-width // 10)) for width in byte_widths)
+
+    @property
+    def embedded(self):
+        return self.font_data is not None
+
+    def add_chars(self, chars):
+        for char in set(chars).difference(self.widths, "\n"):
+            if self.embedded and char > "\uffff": # Beyond 2-byte ids; written as U+FFFD
+                self.missing_chars.add(char)
+                self.beyond_bmp = True
+                self.add_chars("\ufffd")
+                width = self.widths["\ufffd"]
+            elif self.embedded:
+                glyph = self.font.has_glyph(ord(char))
+                if not glyph:
+                    self.missing_chars.add(char)
+                width = round(self.font.glyph_advance(ord(char)) * 1000) if glyph else 0
+                self.used_chars[ord(char)] = (width, glyph)
+            else:
+                try:
+                    char.encode('cp1252')
+                    width = round(self.font.glyph_advance(ord(char)) * 1000)
+                except UnicodeEncodeError: # Written as '?'
+                    self.missing_chars.add(char)
+                    width = round(self.font.glyph_advance(ord("?")) * 1000)
+            self.widths[char] = width
+            self.max_width = max(self.max_width, width)
+            if width:
+                self.min_width = min(self.min_width, width)
+
+    def subset(self):
+        """
+        Returns (font data, glyph map): the embedded font reduced to .notdef and the glyphs of `used_chars`,
+        and each used glyph id's id in that subset. fontTools (installed with pdf2docx) does the subsetting;
+        without it, or for a font it can't process, this is the whole font and a None map.
+        """
+        glyphs = sorted({0} | {glyph for _, glyph in self.used_chars.values()})
+        try:
+            ttLib, fonttools_subset = import_backend('fontTools.ttLib'), import_backend('fontTools.subset')
+        except ImportError:
+            user_log.warning(f"The whole {self.base_font} font is embedded: the 'fontTools' package is not installed.")
+            return self.font_data, None
+        try:
+            with stage("font_subset", backend="fonttools", bytes_in=len(self.font_data)) as subset_stage:
+                tt_font = ttLib.TTFont(io.BytesIO(self.font_data), recalcTimestamp=False) # Same input, same bytes
+                original_order = tt_font.getGlyphOrder()
+                options = fonttools_subset.Options()
+                options.notdef_outline = True # Characters the font lacks are drawn with glyph 0
+                options.layout_features = [] # Glyphs are placed one by one; no ligatures or other substitutions
+                subsetter = fonttools_subset.Subsetter(options)
+                subsetter.populate(gids=glyphs)
+                subsetter.subset(tt_font)
+                subset_ids = {name: gid for gid, name in enumerate(tt_font.getGlyphOrder())}
+                output = io.BytesIO()
+                tt_font.save(output)
+                subset_stage.bytes_out = output.getbuffer().nbytes
+            return output.getvalue(), {glyph: subset_ids[original_order[glyph]] for glyph in glyphs}
+        except Exception as e: # fontTools rejects some malformed fonts that MuPDF still reads
+            user_log.warning(f"The whole {self.base_font} font is embedded: it could not be subset ({e}).")
+            debug_log.exception("Subsetting font %s failed.", self.base_font)
+            return self.font_data, None
+
+    def measure(self, text):
+        """Width of one line; `add_chars` must have seen its characters."""
+        return sum(map(self.widths.__getitem__, text))
+
+    def fits(self, line, operand, max_units):
+        """Whether a line fits in `max_units`, trying a cheap upper bound on its bytes before measuring it."""
+        if not self.embedded:
+            data = operand
+        elif line.isascii():
+            data = line.encode('ascii')
+        else:
+            return self.measure(line) <= max_units
+        return sum(data.translate(self.width_table)) * 10 <= max_units or self.measure(line) <= max_units
+
+    def fit(self, text, start, max_units):
+        """Number of characters of `text` from `start` on that fit in `max_units` (at least 1)."""
+        if self.min_width == self.max_width: # Monospaced (zero-width marks only make this cautious)
+            return max(1, int(max_units // self.max_width))
+        window = text[start:start + int(max_units / self.min_width) + 1]
+        return max(1, bisect.bisect_right(list(itertools.accumulate(map(self.widths.__getitem__, window))), max_units))
+
+    def slice_operand(self, line, operand, start, end):
+        """The operand for characters start:end of a line, cut from the line's operand where possible."""
+        if self.embedded:
+            return operand[4 * start:4 * end]
+        if len(operand) == len(line): # Nothing escaped: one byte per character
+            return operand[start:end]
+        return self.encode(line[start:end])[0]
+
+    def encode(self, text):
+        """String operands (without delimiters) for every line of `text`."""
+        if not self.embedded:
+            data = text.encode('cp1252', errors='replace')
+            return data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)").split(b"\n")
+        if self.beyond_bmp:
+            text = _NON_BMP_CHARS.sub("\ufffd", text)
+        # Every character is 4 hex digits, so lines are cut out of the hex by their lengths
+        data = binascii.hexlify(text.encode('utf-16-be'))
+        operands = []
+        start = 0
+        for line in text.split("\n"):
+            end = start + 4 * len(line)
+            operands.append(data[start:end])
+            start = end + 4
+        return operands
+
+class StreamingPdfWriter:
+    """
+    Minimal PDF writer for text pages. Pages are appended with `add_page(content)` and written at once;
+    only object offsets and page ids stay in memory. `close()` writes the font, page tree and xref.
+    Output has no /ID or dates, so the same input always gives the same bytes. `path` may also be a
+    binary file object, which is left open.
+    """
+    CATALOG_ID, PAGES_ID, FONT_ID = 1, 2, 3
+
+    def __init__(self, path, font, page_width, page_height):
+        self.font = font
+        self.page_width = page_width
+        self.page_height = page_height
+        self.offsets = [0] * (self.FONT_ID + 1) # Index = object number; object 0 is the free-list head
+        self.page_ids = []
+        self._owns_file = not hasattr(path, "write")
+        self.f = open(path, 'wb') if self._owns_file else path
+        self.f.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self._owns_file:
+            self.f.close()
+
+    def _new_id(self):
+        self.offsets.append(0)
+        return len(self.offsets) - 1
+
+    def _write_object(self, obj_id, body, stream=None):
+        self.offsets[obj_id] = self.f.tell()
+        self.f.write(b"%d 0 obj\n" % obj_id)
+        if stream is None:
+            self.f.write(body + b"\nendobj\n")
+        else:
+            self.f.write(body + b"\nstream\n" + stream + b"\nendstream\nendobj\n")
+
+    def _write_stream(self, obj_id, data, extra=b""):
+        data = zlib.compress(data, TEXT_PDF_COMPRESSION_LEVEL)
+        self._write_object(obj_id, b"<< /Length %d /Filter /FlateDecode%s >>" % (len(data), extra), data)
+
+    def add_page(self, content):
+        content_id, page_id = self._new_id(), self._new_id()
+        self._write_stream(content_id, content)
+        self._write_object(page_id, b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %.2f %.2f] /Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>"
+                           % (self.PAGES_ID, self.page_width, self.page_height, self.FONT_ID, content_id))
+        self.page_ids.append(page_id)
+
+    def _write_font(self):
+        font = self.font
+        if not font.embedded:
+            self._write_object(self.FONT_ID, b"<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>"
+                               % font.base_font.encode('ascii'))
+            return
+        cid_font_id, descriptor_id, font_file_id, to_unicode_id = (self._new_id() for _ in range(4))
+        font_data, glyph_map = font.subset()
+        name = font.base_font.encode('ascii')
+        if glyph_map is not None: # Subset fonts are named TAG+Name, the tag derived from the glyphs kept
+            tag = hashlib.sha256(repr(sorted(glyph_map)).encode('ascii')).digest()[:6]
+            name = bytes(65 + byte % 26 for byte in tag) + b"+" + name
+        cid_to_gid_id = self._new_id()
+        self._write_object(self.FONT_ID, b"<< /Type /Font /Subtype /Type0 /BaseFont /%s /Encoding /Identity-H /DescendantFonts [%d 0 R] /ToUnicode %d 0 R >>"
+                           % (name, cid_font_id, to_unicode_id))
+        # /W lists the advance of every character used, as runs of consecutive ids
+        runs = []
+        for cid in sorted(font.used_chars):
+            width = font.used_chars[cid][0]
+            if runs and runs[-1][0] + len(runs[-1][1]) == cid:
+                runs[-1][1].append(width)
+            else:
+                runs.append((cid, [width]))
+        widths = b" ".join(b"%d [%s]" % (start, b" ".join(b"%d" % w for w in run)) for start, run in runs)
+        self._write_object(cid_font_id, b"<< /Type /Font /Subtype /CIDFontType2 /BaseFont /%s /CIDSystemInfo << /Registry (Adobe) /Ordering (Identity) /Supplement 0 >>"
+                           b" /FontDescriptor %d 0 R /DW 1000 /W [%s] /CIDToGIDMap %d 0 R >>" % (name, descriptor_id, widths, cid_to_gid_id))
+        cid_to_gid = bytearray(2 * (max(font.used_chars, default=0) + 1))
+        for cid, (width, glyph) in font.used_chars.items():
+            glyph = glyph_map[glyph] if glyph_map is not None else glyph
+            cid_to_gid[2 * cid:2 * cid + 2] = glyph.to_bytes(2, 'big')
+        self._write_stream(cid_to_gid_id, bytes(cid_to_gid))
+        bbox = font.font.bbox
+        ascent, descent = round(font.font.ascender * 1000), round(font.font.descender * 1000)
+        self._write_object(descriptor_id, b"<< /Type /FontDescriptor /FontName /%s /Flags %d /FontBBox [%d %d %d %d] /ItalicAngle 0 /Ascent %d /Descent %d /CapHeight %d /StemV 80 /FontFile2 %d 0 R >>"
+                           % (name, 32 | (1 if font.font.is_monospaced else 0), round(bbox.x0 * 1000), round(bbox.y0 * 1000),
+                              round(bbox.x1 * 1000), round(bbox.y1 * 1000), ascent, descent, ascent, font_file_id))
+        self._write_stream(font_file_id, font_data, b" /Length1 %d" % len(font_data))
+        mappings = [b"<%04X> <%04X>" % (cid, cid) for cid in sorted(font.used_chars)]
+        blocks = b"".join(b"%d beginbfchar\n%s\nendbfchar\n" % (len(mappings[i:i + 100]), b"\n".join(mappings[i:i + 100]))
+                          for i in range(0, len(mappings), 100))
+        self._write_stream(to_unicode_id, b"/CIDInit /ProcSet findresource begin\n12 dict begin\nbegincmap\n"
+                           b"/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) /Supplement 0 >> def\n"
+                           b"/CMapName /Adobe-Identity-UCS def\n/CMapType 2 def\n1 begincodespacerange\n<0000> <FFFF>\nendcodespacerange\n"
+                           + blocks + b"endcmap\nCMapName currentdict /CMap defineresource pop\nend\nend\n")
+
+    def close(self):
+        self._write_font()
+        kids = b" ".join(b"%d 0 R" % page_id for page_id in self.page_ids)
+        self._write_object(self.PAGES_ID, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self.page_ids)))
+        self._write_object(self.CATALOG_ID, b"<< /Type /Catalog /Pages %d 0 R >>" % self.PAGES_ID)
+        xref_offset = self.f.tell()
+        self.f.write(b"xref\n0 %d\n0000000000 65535 f \n" % len(self.offsets))
+        self.f.write(b"".join(b"%010d 00000 n \n" % offset for offset in self.offsets[1:]))
+        self.f.write(b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(self.offsets), self.CATALOG_ID, xref_offset))
+        if self._owns_file:
+            self.f.close()
+
+class TextPageLayout:
+    """
+    Wraps lines to the page width and hands each full page to the writer; indentation and blank lines are kept.
+    Text arrives in chunks of whole lines. Cleaning and encoding happen once per chunk, and lines short
+    enough to fit whatever their characters are skip measuring, so the per-line work stays small.
+    """
+    def __init__(self, writer, font, font_size=TEXT_PDF_FONT_SIZE, line_height=TEXT_PDF_LINE_HEIGHT):
+        self.writer = writer
+        self.font = font
+        margin = PAGE_MARGIN_MM * POINTS_PER_MM
+        self.max_units = (writer.page_width - 2 * margin) * 1000 / font_size
+        self.lines_per_page = max(1, int((writer.page_height - 2 * margin) // line_height))
+        self.page_start = b"BT\n/F1 %d Tf\n%d TL\n%.2f %.2f Td\n" % (font_size, line_height, margin, writer.page_height - margin - font_size)
+        self.line_separator = font.string_close + b" Tj T*\n" + font.string_open
+        self.page_lines = []
+
+    def add_text(self, text):
+        """Lays out `text`, a run of complete lines without the final newline."""
+        if "\t" in text:
+            text = text.expandtabs(TEXT_PDF_TAB_SIZE)
+        text = _TEXT_CONTROL_CHARS.sub("", text)
+        font = self.font
+        if not text.isascii(): # ASCII widths are known from the start
+            font.add_chars(text)
+        lines = text.split("\n")
+        encoded = font.encode(text)
+        fast_limit = int(self.max_units // font.max_width) # Lines this short fit even if every glyph is the widest
+        max_units = self.max_units
+        page_lines = self.page_lines
+        for line, operand in zip(lines, encoded):
+            if len(line) <= fast_limit or font.fits(line, operand, max_units):
+                page_lines.append(operand)
+                if len(page_lines) >= self.lines_per_page:
+                    self.flush_page()
+                    page_lines = self.page_lines
+            else:
+                self._add_wrapped_line(line, operand)
+                page_lines = self.page_lines
 
-def convert_text_to_pdf(input_path, output_path):
+    def _add_wrapped_line(self, line, operand):
+        font = self.font
+        start = 0
+        min_break = len(line) - len(line.lstrip(" ")) + 1 # Never break inside the indentation
+        while start < len(line):
+            cut = start + font.fit(line, start, self.max_units)
+            if cut >= len(line):
+                end = next_start = len(line)
+            else:
+                space = line.rfind(" ", start + min_break, cut + 1)
+                if space >= 0: # Break at the last space that fits
+                    end, next_start = space, space + 1
+                else:
+                    end = next_start = cut
+            min_break = 1
+            self.page_lines.append(font.slice_operand(line, operand, start, end))
+            if len(self.page_lines) >= self.lines_per_page:
+                self.flush_page()
+            start = next_start
+
+    def flush_page(self):
+        font = self.font
+        content = b"".join((self.page_start, font.string_open, self.line_separator.join(self.page_lines),
+                            font.string_close, b" Tj T*\nET\n"))
+        self.writer.add_page(content)
+        self.page_lines = []
+
+    def finish(self):
+        if self.page_lines or not self.writer.page_ids: # An empty text file still gives one (blank) page
+            self.flush_page()
+
+def convert_text_to_pdf(input_path, output_path, font_path=None, monospace=False, to_memory=False):
+    """
+    Lays out a UTF-8 text file on A4 pages, reading it in chunks and writing each page as it fills.
+    `font_path` (default: $FILE_CONVERTER_TEXT_FONT) embeds a TrueType font for non-Latin text;
+    `monospace` uses Courier instead of Helvetica when no font is given. With `to_memory` the PDF is
+    returned as bytes and `output_path` only names it in the log.
+    """
     user_log.info(f"Converting text file '{os.path.basename(input_path)}' to PDF: {os.path.basename(output_path)}")
-    debug_log.debug(f"convert_text_to_pdf: {input_path} -> {output_path}")
-    pdf = FPDF()
-    pdf.add_page()
-    pdf.set_font("Arial", size=12)
-    
+    debug_log.debug("convert_text_to_pdf: %s -> %s (font=%s, monospace=%s)", input_path, output_path, font_path, monospace)
+    font_path = font_path or os.environ.get(TEXT_PDF_FONT_ENV) or None
     try:
-        with open(input_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                # Using multi_cell for better handling of long lines and newlines within the line
-                pdf.multi_cell(0, 10, txt=line.strip()) # Width 0 means full page width within margins
-            user_log.info(f"Successfully read text file '{os.path.basename(input_path)}'.")
+        font = TextPdfFont(font_path, monospace=monospace)
+        page_width, page_height = A4_WIDTH_MM * POINTS_PER_MM, A4_HEIGHT_MM * POINTS_PER_MM
+        output = io.BytesIO() if to_memory else output_path
+        with stage("render", backend="text-pdf", bytes_in=_path_size(input_path)) as render_stage:
+            with open(input_path, 'r', encoding='utf-8', errors='replace') as f, \
+                    StreamingPdfWriter(output, font, page_width, page_height) as writer:
+                layout = TextPageLayout(writer, font)
+                pending = ""
+                for chunk in iter(lambda: f.read(TEXT_PDF_READ_CHUNK_CHARS), ""):
+                    text = pending + chunk
+                    end = text.rfind("\n")
+                    if end >= 0:
+                        layout.add_text(text[:end])
+                        pending = text[end + 1:]
+                    elif len(text) > TEXT_PDF_READ_CHUNK_CHARS: # One huge line: lay out what we have rather than buffering it all
+                        layout.add_text(text)
+                        pending = ""
+                    else:
+                        pending = text
+                if pending:
+                    layout.add_text(pending)
+                layout.finish()
+            render_stage.pages = len(writer.page_ids)
+            render_stage.bytes_out = output.getbuffer().nbytes if to_memory else _path_size(output_path)
     except Exception as e:
-        user_log.error(f"Failed to read text file {input_path}: {e}")
-        debug_log.exception(f"Error reading text file {input_path} for PDF conversion.")
+        user_log.error(f"Failed to convert text file {input_path} to PDF: {e}")
+        debug_log.exception(f"Error converting text file {input_path} to PDF.")
         raise
+    if font.missing_chars:
+        sample = "".join(sorted(font.missing_chars)[:20])
+        user_log.warning(f"{len(font.missing_chars)} character(s) in '{os.path.basename(input_path)}' are not in the "
+                         f"{font.base_font} font and could not be shown: {sample!r}. Use a TrueType font that has them "
+                         f"(--font or {TEXT_PDF_FONT_ENV}).")
+    user_log.info(f"Successfully created PDF from text: {os.path.basename(output_path)} ({render_stage.pages} pages)")
+    return output.getvalue() if to_memory else output_path
+
+def open_pdf(input_path, pdf_data=None):
+    """
+    Opens `input_path` with fitz, or the in-memory PDF `pdf_data` (bytes) when given; `input_path` then only
+    names it. The from-PDF converters take `pdf_data` so chained conversions never write the PDF to disk.
+    """
+    if pdf_data is not None:
+        return load_fitz().open(stream=pdf_data, filetype="pdf")
+    return load_fitz().open(input_path)
 
+@contextlib.contextmanager
+def _pdf_path_for_workers(input_path, pdf_data=None):
+    """
+    Yields a path worker processes can open: `input_path` itself, or for an in-memory `pdf_data` a private
+    temporary copy written once (instead of pickling the bytes into every task), deleted on exit.
+    """
+    if pdf_data is None:
+        yield input_path
+        return
+    fd, temp_path = tempfile.mkstemp(prefix="file_converter_chain_", suffix=".pdf")
     try:
-        pdf.output(output_path)
-        user_log.info(f"Successfully created PDF from text: {os.path.basename(output_path)}")
-    except Exception as e:
-        user_log.error(f"Failed to save PDF {output_path} from text: {e}")
-        debug_log.exception(f"Error saving PDF {output_path} from text.")
-        raise
-    return output_path
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(pdf_data)
+        debug_log.debug("Wrote in-memory PDF for %s (%d bytes) to %s for worker processes.", input_path, len(pdf_data), temp_path)
+        yield temp_path
+    finally:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+
+def _pdf_input_size(input_path, pdf_data=None):
+    return len(pdf_data) if pdf_data is not None else _path_size(input_path)
 
-def convert_pdf_to_text(input_path, output_path):
+def convert_pdf_to_text(input_path, output_path, progress_callback=None, page_range=None, pdf_data=None):
     user_log.info(f"Converting PDF '{os.path.basename(input_path)}' to text: {os.path.basename(output_path)}")
-    debug_log.debug(f"convert_pdf_to_text: {input_path} -> {output_path}")
+    debug_log.debug("convert_pdf_to_text: %s -> %s", input_path, output_path)
     try:
-        doc = fitz.open(input_path)
+        with stage("open", backend="fitz", bytes_in=_pdf_input_size(input_path, pdf_data)):
+            doc = open_pdf(input_path, pdf_data)
+        page_indexes = parse_page_range(page_range, len(doc))
+        extract_seconds = write_seconds = 0.0
         with open(output_path, 'w', encoding='utf-8') as f:
-            for i, page in enumerate(doc):
-                f.write(page.get_text())
-                debug_log.debug(f"Extracted text from page {i+1} of {input_path}")
+            for done, page_index in enumerate(page_indexes, start=1):
+                started = time.perf_counter()
+                text = doc[page_index].get_text()
+                extracted = time.perf_counter()
+                f.write(text)
+                extract_seconds += extracted - started
+                write_seconds += time.perf_counter() - extracted
+                debug_log.debug("Extracted text from page %d of %s", page_index + 1, input_path)
+                if progress_callback:
+                    progress_callback(done, len(page_indexes))
         doc.close()
+        record_stage("render", extract_seconds, backend="fitz", pages=len(page_indexes), calls=len(page_indexes))
+        record_stage("write", write_seconds, backend="file", bytes_out=_path_size(output_path), pages=len(page_indexes), calls=len(page_indexes))
         user_log.info(f"Successfully converted PDF to text: {os.path.basename(output_path)}")
     except Exception as e:
         user_log.error(f"Failed to convert PDF {input_path} to text: {e}")
@@ -430,39 +2043,499 @@ def convert_pdf_to_text(input_path, output_path):
         raise
     return output_path
 
-def convert_pdf_to_images(input_path, output_path):
+# --- PDF Page Rendering ---
+RENDER_WORKER_COUNT = os.cpu_count() or 1 # Size of the shared render pool; a job's `workers` caps its share of it
+PARALLEL_RENDER_MIN_PAGES = 8 # Below this, starting worker processes costs more than it saves
+RENDER_COLORSPACES = {"rgb": "csRGB", "gray": "csGRAY", "cmyk": "csCMYK"}
+NATIVE_PIXMAP_FORMATS = ['png', 'jpg', 'jpeg'] # Other image formats are written through PIL
+RENDER_COMPONENTS = {"rgb": 3, "gray": 1, "cmyk": 4}
+# Largest pixmap one page may allocate per render process. Pages that would need more (posters, drawings
+# at high DPI) are rendered in full-width strips streamed into a PNG encoder instead.
+RENDER_MEMORY_LIMIT_MB = int(os.environ.get("FILE_CONVERTER_RENDER_MEMORY_MB", "256") or 256)
+PNG_COMPRESSION_LEVEL = 6
+PNG_WRITE_BATCH_BYTES = 4 * 1024 * 1024 # Rows are filtered and compressed in batches of about this size
+# From-PDF formats that put every page image into one archive instead of one file per page
+ARCHIVE_FORMATS = {"png.zip": ("png", "zip"), "jpg.zip": ("jpg", "zip"), "png.tar": ("png", "tar"), "jpg.tar": ("jpg", "tar")}
+ARCHIVE_SLICE_PAGES = 4 # Pages per worker task; encoded pages travel back to the main process in memory
+ARCHIVE_PENDING_SLICES_PER_WORKER = 2 # Slices rendered ahead of the archive writer; bounds the pages held in memory
+
+_render_process_pool = None
+_render_process_pool_lock = threading.Lock()
+
+def parse_page_range(page_range, page_count):
+    """
+    Turns a page range such as "1-3, 7, 10-" (1-based, inclusive) into a sorted list of 0-based page indexes.
+    None or an empty string selects every page.
+    """
+    if not page_range or not str(page_range).strip():
+        return list(range(page_count))
+    selected = set()
+    for part in str(page_range).split(','):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            if '-' in part:
+                first, last = part.split('-', 1)
+                first = int(first) if first.strip() else 1
+                last = int(last) if last.strip() else page_count
+            else:
+                first = last = int(part)
+        except ValueError:
+            raise ValueError(f"Invalid page range '{page_range}'. Use e.g. '1-3, 7, 10-'.")
+        if first < 1 or last < first:
+            raise ValueError(f"Invalid page range '{part}' in '{page_range}'.")
+        selected.update(range(first - 1, min(last, page_count)))
+    if not selected:
+        raise ValueError(f"Page range '{page_range}' selects no pages (document has {page_count} page(s)).")
+    return sorted(selected)
+
+class StreamingPngWriter:
+    """
+    Writes an 8-bit gray or RGB PNG one band of rows at a time, so the whole image is never in memory.
+    `path` may also be a binary file object, which is left open.
+    """
+    def __init__(self, path, width, height, components, dpi=None):
+        self.stride = width * components
+        self._owns_file = not hasattr(path, "write")
+        self.f = open(path, 'wb') if self._owns_file else path
+        self.f.write(b"\x89PNG\r\n\x1a\n")
+        self._chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, {1: 0, 3: 2}[components], 0, 0, 0))
+        if dpi:
+            pixels_per_meter = round(dpi / 0.0254)
+            self._chunk(b"pHYs", struct.pack(">IIB", pixels_per_meter, pixels_per_meter, 1))
+        self.compressor = zlib.compressobj(PNG_COMPRESSION_LEVEL)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self._owns_file:
+            self.f.close()
+
+    def _chunk(self, kind, data):
+        self.f.write(struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data)))
+
+    def write_rows(self, samples):
+        stride = self.stride
+        batch = max(1, PNG_WRITE_BATCH_BYTES // stride) * stride
+        for start in range(0, len(samples), batch):
+            # Every row starts with its filter type; 0 (none) needs no previous row
+            rows = samples[start:start + batch]
+            data = self.compressor.compress(b"".join(b"\x00" + rows[i:i + stride] for i in range(0, len(rows), stride)))
+            if data:
+                self._chunk(b"IDAT", data)
+
+    def close(self):
+        self._chunk(b"IDAT", self.compressor.flush())
+        self._chunk(b"IEND", b"")
+        if self._owns_file:
+            self.f.close()
+
+def _plan_render_strips(page, dpi, colorspace, max_pixmap_bytes):
+    """
+    Returns `(width, height, rows_per_strip)` for a page whose full pixmap would exceed `max_pixmap_bytes`,
+    or None when it fits. Each strip's pixmap stays under the limit; the PNG encoder adds a few MB.
+    """
+    fitz = load_fitz()
+    scale = (dpi or 72) / 72
+    size = (page.rect * fitz.Matrix(scale, scale)).irect
+    if size.width * size.height * RENDER_COMPONENTS[colorspace] <= max_pixmap_bytes:
+        return None
+    row_bytes = size.width * (1 if colorspace == "gray" else 3) # Tiled output is gray or RGB PNG
+    rows = max_pixmap_bytes // row_bytes
+    if rows < 1:
+        raise ValueError(f"Page {page.number + 1} is {size.width} pixels wide at {dpi or 72} DPI, too wide for the "
+                         f"{max_pixmap_bytes // (1024 * 1024)} MB render memory limit. Lower the DPI or raise the limit.")
+    return size.width, size.height, rows
+
+def _render_page_in_strips(page, output_path, dpi, colorspace, width, height, rows_per_strip):
+    """Renders a page strip by strip into a PNG (path or file object). Returns (render seconds, write seconds)."""
+    fitz = load_fitz()
+    scale = (dpi or 72) / 72
+    matrix = fitz.Matrix(scale, scale)
+    cs, components = (fitz.csGRAY, 1) if colorspace == "gray" else (fitz.csRGB, 3)
+    rect = page.rect
+    render_seconds = write_seconds = 0.0
+    started = time.perf_counter()
+    display_list = page.get_displaylist() # Interpret the page once, rasterize it per strip
+    with StreamingPngWriter(output_path, width, height, components, dpi=dpi) as png:
+        for top in range(0, height, rows_per_strip):
+            bottom = min(height, top + rows_per_strip)
+            clip = fitz.Rect(rect.x0, rect.y0 + top / scale, rect.x1, rect.y0 + bottom / scale)
+            pix = display_list.get_pixmap(matrix=matrix, colorspace=cs, alpha=False, clip=clip)
+            if (pix.width, pix.height) != (width, bottom - top):
+                raise RuntimeError(f"Strip rows {top}-{bottom} of page {page.number + 1} rendered as {pix.width}x{pix.height}.")
+            rendered = time.perf_counter()
+            render_seconds += rendered - started
+            png.write_rows(pix.samples_mv)
+            pix = None
+            started = time.perf_counter()
+            write_seconds += started - rendered
+    write_seconds += time.perf_counter() - started
+    return render_seconds, write_seconds
+
+def _render_pdf_page_slice(input_path, page_jobs, dpi=None, colorspace="rgb", max_pixmap_bytes=None, pdf_data=None):
+    # Runs in a worker process (or inline for small jobs): opens its own document (from `pdf_data` if given)
+    # and renders each (page_index, output_path) pair. Returns the written paths and
+    # stage timings, since metrics recorded inside a worker process would be lost.
+    # A page over `max_pixmap_bytes` is tiled into a PNG; a JPEG page's path then changes to .png.
+    fitz = load_fitz()
+    started = time.perf_counter()
+    doc = open_pdf(input_path, pdf_data)
+    timings = {"open": time.perf_counter() - started, "render": 0.0, "write": 0.0, "bytes_out": 0, "tiled": 0}
+    max_pixmap_bytes = max_pixmap_bytes or RENDER_MEMORY_LIMIT_MB * 1024 * 1024
+    try:
+        cs = getattr(fitz, RENDER_COLORSPACES[colorspace])
+        written = []
+        for page_index, page_output_path in page_jobs:
+            page = doc[page_index]
+            strips = _plan_render_strips(page, dpi, colorspace, max_pixmap_bytes)
+            if strips is not None:
+                if os.path.splitext(page_output_path)[1].lower() != '.png':
+                    placeholder = page_output_path
+                    base = os.path.splitext(os.path.basename(placeholder))[0]
+                    page_output_path = get_unique_filename(os.path.dirname(placeholder), base + ".png", reserve=True)
+                    os.remove(placeholder)
+                render_seconds, write_seconds = _render_page_in_strips(page, page_output_path, dpi, colorspace, *strips)
+                timings["render"] += render_seconds
+                timings["write"] += write_seconds
+                timings["tiled"] += 1
+                debug_log.debug("Rendered page %d of %s in %d-row strips (%dx%d px)", page_index + 1, input_path, strips[2], strips[0], strips[1])
+            else:
+                started = time.perf_counter()
+                pix = page.get_pixmap(dpi=dpi, colorspace=cs)
+                rendered = time.perf_counter()
+                if os.path.splitext(page_output_path)[1].lower().lstrip('.') in NATIVE_PIXMAP_FORMATS:
+                    pix.save(page_output_path)
+                else:
+                    pix.pil_save(page_output_path)
+                timings["render"] += rendered - started
+                timings["write"] += time.perf_counter() - rendered
+            timings["bytes_out"] += _path_size(page_output_path)
+            written.append(page_output_path)
+        return written, timings
+    finally:
+        doc.close()
+
+def _record_render_slice_timings(page_count, timings, image_ext):
+    record_stage("open", timings["open"], backend="fitz")
+    record_stage("render", timings["render"], backend="fitz-tiled" if timings["tiled"] else "fitz", pages=page_count, calls=page_count)
+    writer = "fitz" if image_ext in NATIVE_PIXMAP_FORMATS else "pil"
+    if timings["tiled"]:
+        writer = "png-stream"
+    record_stage("write", timings["write"], backend=writer, bytes_out=timings["bytes_out"], pages=page_count, calls=page_count)
+
+def _encode_pdf_page_slice(input_path, page_indexes, image_ext, dpi=None, colorspace="rgb", max_pixmap_bytes=None, pdf_data=None):
+    # Archive counterpart of _render_pdf_page_slice: returns each page encoded in memory as
+    # (page_index, ext, data) instead of writing files. Pages over `max_pixmap_bytes` are still tiled into PNG.
+    fitz = load_fitz()
+    started = time.perf_counter()
+    doc = open_pdf(input_path, pdf_data)
+    timings = {"open": time.perf_counter() - started, "render": 0.0, "write": 0.0, "bytes_out": 0, "tiled": 0}
+    max_pixmap_bytes = max_pixmap_bytes or RENDER_MEMORY_LIMIT_MB * 1024 * 1024
+    try:
+        cs = getattr(fitz, RENDER_COLORSPACES[colorspace])
+        encoded = []
+        for page_index in page_indexes:
+            page = doc[page_index]
+            strips = _plan_render_strips(page, dpi, colorspace, max_pixmap_bytes)
+            if strips is not None:
+                buffer = io.BytesIO()
+                render_seconds, write_seconds = _render_page_in_strips(page, buffer, dpi, colorspace, *strips)
+                timings["render"] += render_seconds
+                timings["write"] += write_seconds
+                timings["tiled"] += 1
+                page_ext, data = "png", buffer.getvalue()
+            else:
+                started = time.perf_counter()
+                pix = page.get_pixmap(dpi=dpi, colorspace=cs)
+                rendered = time.perf_counter()
+                page_ext, data = image_ext, pix.tobytes("jpeg" if image_ext == "jpg" else image_ext)
+                pix = None
+                timings["render"] += rendered - started
+                timings["write"] += time.perf_counter() - rendered
+            timings["bytes_out"] += len(data)
+            encoded.append((page_index, page_ext, data))
+        return encoded, timings
+    finally:
+        doc.close()
+
+class PageArchiveWriter:
+    """
+    Appends in-memory files to a new .zip or .tar. Page images are already compressed, so ZIP entries are
+    stored, not deflated; ZIP64 is enabled for archives over 4 GB.
+    """
+    def __init__(self, path, kind):
+        self.kind = kind
+        if kind == "zip":
+            self.archive = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_STORED, allowZip64=True)
+        else:
+            self.archive = tarfile.open(path, 'w', format=tarfile.PAX_FORMAT)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.archive.close()
+
+    def add(self, name, data):
+        now = time.time()
+        if self.kind == "zip":
+            self.archive.writestr(zipfile.ZipInfo(name, date_time=time.localtime(now)[:6]), data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size, info.mtime, info.mode = len(data), now, 0o644
+            self.archive.addfile(info, io.BytesIO(data))
+
+def convert_pdf_to_archive(input_path, output_path, progress_callback=None, page_range=None, dpi=None,
+                           colorspace="rgb", archive_format="png.zip", workers=None, memory_limit_mb=None, pdf_data=None):
+    """
+    Renders PDF pages straight into one archive (`archive_format` is one of ARCHIVE_FORMATS), as
+    `<name>_<page>.<ext>` entries in page order. No per-page files are written: pages are encoded in
+    memory, by at most `workers` pool processes for large jobs, and at most ARCHIVE_PENDING_SLICES_PER_WORKER
+    slices per worker wait for the writer. Other options are those of convert_pdf_to_images.
+    """
+    user_log.info(f"Converting PDF '{os.path.basename(input_path)}' to a {archive_format} archive: {os.path.basename(output_path)}")
+    debug_log.debug("convert_pdf_to_archive: %s -> %s, page_range=%s, dpi=%s, colorspace=%s, workers=%s", input_path, output_path, page_range, dpi, colorspace, workers)
+    if archive_format not in ARCHIVE_FORMATS:
+        raise ValueError(f"Unsupported archive format '{archive_format}'. Choose one of: {', '.join(ARCHIVE_FORMATS)}.")
+    image_ext, archive_kind = ARCHIVE_FORMATS[archive_format]
+    colorspace = (colorspace or "rgb").lower()
+    if colorspace not in RENDER_COLORSPACES:
+        raise ValueError(f"Unsupported colorspace '{colorspace}'. Choose one of: {', '.join(RENDER_COLORSPACES)}.")
+    if colorspace == "cmyk" and image_ext != "jpg":
+        raise ValueError("CMYK rendering is only supported for JPEG output.")
+
+    archive_path = None
+    try:
+        with open_pdf(input_path, pdf_data) as doc:
+            page_indexes = parse_page_range(page_range, len(doc))
+        name_base = os.path.basename(output_path)
+        if name_base.lower().endswith('.' + archive_format):
+            name_base = name_base[:-len(archive_format) - 1]
+        archive_path = get_unique_filename(os.path.dirname(output_path), os.path.basename(output_path), reserve=True)
+
+        workers = RENDER_WORKER_COUNT if workers is None else max(1, workers)
+        max_pixmap_bytes = int((memory_limit_mb or RENDER_MEMORY_LIMIT_MB) * 1024 * 1024)
+        slices = [page_indexes[i:i + ARCHIVE_SLICE_PAGES] for i in range(0, len(page_indexes), ARCHIVE_SLICE_PAGES)]
+        parallel = workers > 1 and len(page_indexes) >= PARALLEL_RENDER_MIN_PAGES
+        pool = _get_render_process_pool() if parallel else None
+        max_pending = workers * ARCHIVE_PENDING_SLICES_PER_WORKER
+        pending = {} # Slice number -> future; results are written strictly in page order
+        next_submit = done = tiled = 0
+        write_seconds = 0.0
+        with PageArchiveWriter(archive_path, archive_kind) as archive, \
+             _pdf_path_for_workers(input_path, pdf_data if parallel else None) as worker_input:
+            try:
+                for slice_number, page_slice in enumerate(slices):
+                    if pool is None:
+                        encoded, timings = _encode_pdf_page_slice(input_path, page_slice, image_ext, dpi, colorspace, max_pixmap_bytes, pdf_data)
+                    else:
+                        while True:
+                            # At most `workers` slices run at once; finished ones wait (up to max_pending) for the writer
+                            running = [future for future in pending.values() if not future.done()]
+                            while next_submit < len(slices) and len(pending) < max_pending and len(running) < workers:
+                                running.append(pool.submit(_encode_pdf_page_slice, worker_input, slices[next_submit], image_ext,
+                                                           dpi, colorspace, max_pixmap_bytes))
+                                pending[next_submit] = running[-1]
+                                next_submit += 1
+                            if pending[slice_number].done():
+                                break
+                            wait(running, return_when=FIRST_COMPLETED)
+                        encoded, timings = pending.pop(slice_number).result()
+                    _record_render_slice_timings(len(page_slice), timings, image_ext)
+                    started = time.perf_counter()
+                    for page_index, page_ext, data in encoded:
+                        archive.add(f"{name_base}_{page_index + 1}.{page_ext}", data)
+                        if page_ext != image_ext:
+                            tiled += 1
+                    write_seconds += time.perf_counter() - started
+                    encoded = None
+                    done += len(page_slice)
+                    debug_log.debug("Archived pages %d-%d of %s", page_slice[0] + 1, page_slice[-1] + 1, input_path)
+                    if progress_callback:
+                        progress_callback(done, len(page_indexes))
+            except Exception:
+                for future in pending.values():
+                    future.cancel()
+                raise
+        record_stage("write", write_seconds, backend=archive_kind, bytes_out=_path_size(archive_path), pages=done, calls=len(slices))
+        if tiled:
+            user_log.warning(f"{tiled} page(s) of '{os.path.basename(input_path)}' are too large to render as {image_ext.upper()} within "
+                             f"the {max_pixmap_bytes // (1024 * 1024)} MB render memory limit; they were archived as PNG instead.")
+        user_log.info(f"Successfully archived {done} page image(s) in {os.path.basename(archive_path)}.")
+    except Exception as e:
+        if archive_path and os.path.exists(archive_path):
+            os.remove(archive_path)
+            release_filename(archive_path)
+        user_log.error(f"Failed to convert PDF {input_path} to a {archive_format} archive: {e}")
+        debug_log.exception(f"Error during PDF to archive conversion for {input_path}.")
+        raise
+    return archive_path
+
+def _get_render_process_pool():
+    # One pool shared by all conversions so worker start-up is paid once per session
+    global _render_process_pool
+    with _render_process_pool_lock:
+        if _render_process_pool is None:
+            # 'spawn' everywhere: forking a process that runs GUI/worker threads is not safe
+            _render_process_pool = ProcessPoolExecutor(max_workers=RENDER_WORKER_COUNT, mp_context=multiprocessing.get_context("spawn"),
+                                                       initializer=init_worker_logging, initargs=(get_worker_log_queue(),))
+            atexit.register(shutdown_render_process_pool)
+            debug_log.debug("Started render process pool with %d worker(s).", RENDER_WORKER_COUNT)
+        return _render_process_pool
+
+def shutdown_render_process_pool(wait=False):
+    """Stops the shared render pool; with `wait`, also until its worker processes have exited and been reaped."""
+    global _render_process_pool
+    with _render_process_pool_lock:
+        if _render_process_pool is not None:
+            _render_process_pool.shutdown(wait=wait, cancel_futures=True)
+            _render_process_pool = None
+
+def convert_pdf_to_images(input_path, output_path, progress_callback=None, page_range=None, dpi=None,
+                          colorspace="rgb", image_format=None, workers=None, memory_limit_mb=None, pdf_data=None):
+    """
+    Renders PDF pages to `<name>_<page>.<ext>` files next to `output_path` (a naming template).
+    `page_range` uses parse_page_range syntax, `dpi` defaults to 72, `colorspace` is one of
+    RENDER_COLORSPACES and `image_format` overrides the template's extension. Large jobs are split into
+    page slices rendered by the shared worker pool, with at most `workers` (default RENDER_WORKER_COUNT)
+    slices in flight, so `workers` caps the processes the job uses; page numbering stays that of the source.
+    A page whose pixmap would exceed `memory_limit_mb` (default RENDER_MEMORY_LIMIT_MB) is rendered in
+    strips into a PNG, also when JPEG was asked for. Workers read an in-memory `pdf_data` (see open_pdf)
+    from one temporary copy (_pdf_path_for_workers).
+    """
     user_log.info(f"Converting PDF '{os.path.basename(input_path)}' to images (e.g., {os.path.basename(output_path)}).")
-    debug_log.debug(f"convert_pdf_to_images: {input_path} -> {output_path} (base name)")
+    debug_log.debug("convert_pdf_to_images: %s -> %s (base name), page_range=%s, dpi=%s, colorspace=%s, image_format=%s, workers=%s", input_path, output_path, page_range, dpi, colorspace, image_format, workers)
     output_files = []
+    page_jobs = []
     try:
-        doc = fitz.open(input_path)
         base_name_template, ext = os.path.splitext(output_path) # output_path is a template like 'filename.jpg'
-        
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            pix = page.get_pixmap()
-            # Use get_unique_filename for each page's output
-            page_output_filename_base = f"{os.path.basename(base_name_template)}_{page_num+1}"
-            page_output_path = get_unique_filename(os.path.dirname(output_path), f"{page_output_filename_base}{ext}")
-            
-            pix.save(page_output_path)
-            output_files.append(page_output_path)
-            user_log.info(f"Saved page {page_num+1} from '{os.path.basename(input_path)}' as '{os.path.basename(page_output_path)}'")
-            debug_log.debug(f"Saved page {page_num+1} of {input_path} to {page_output_path}")
-            
+        if image_format:
+            ext = '.' + image_format.lower().lstrip('.')
+        colorspace = (colorspace or "rgb").lower()
+        if colorspace not in RENDER_COLORSPACES:
+            raise ValueError(f"Unsupported colorspace '{colorspace}'. Choose one of: {', '.join(RENDER_COLORSPACES)}.")
+        if colorspace == "cmyk" and ext.lower() != '.jpg' and ext.lower() != '.jpeg':
+            raise ValueError("CMYK rendering is only supported for JPEG output.")
+
+        doc = open_pdf(input_path, pdf_data)
+        page_count = len(doc)
         doc.close()
+        page_indexes = parse_page_range(page_range, page_count)
+
+        # Reserve every page's name up front, in page order, so naming is deterministic
+        # no matter which worker finishes first.
+        for page_index in page_indexes:
+            page_output_filename_base = f"{os.path.basename(base_name_template)}_{page_index+1}"
+            page_output_path = get_unique_filename(os.path.dirname(output_path), f"{page_output_filename_base}{ext}", reserve=True)
+            page_jobs.append((page_index, page_output_path))
+
+        workers = RENDER_WORKER_COUNT if workers is None else max(1, workers)
+        max_pixmap_bytes = int((memory_limit_mb or RENDER_MEMORY_LIMIT_MB) * 1024 * 1024)
+        written_by_job = {} # Reserved path -> path actually written (differs for JPEG pages tiled into PNG)
+        total = len(page_jobs)
+        done = 0
+        if workers > 1 and total >= PARALLEL_RENDER_MIN_PAGES:
+            # Several slices per worker keeps cores busy when pages differ in cost
+            slice_count = min(total, workers * 4)
+            slice_size = -(-total // slice_count)
+            slices = [page_jobs[i:i + slice_size] for i in range(0, total, slice_size)]
+            debug_log.debug("Rendering %d page(s) of %s in %d slice(s) on up to %d worker process(es).", total, input_path, len(slices), workers)
+            pool = _get_render_process_pool()
+            with _pdf_path_for_workers(input_path, pdf_data) as worker_input:
+                unsubmitted = iter(slices)
+                futures = {} # In-flight future -> page slice; never more than `workers`, so `workers` caps the processes used
+                try:
+                    while True:
+                        for page_slice in itertools.islice(unsubmitted, workers - len(futures)):
+                            futures[pool.submit(_render_pdf_page_slice, worker_input, page_slice, dpi, colorspace, max_pixmap_bytes)] = page_slice
+                        if not futures:
+                            break
+                        finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            page_slice = futures.pop(future)
+                            written, timings = future.result()
+                            written_by_job.update(zip((path for _, path in page_slice), written))
+                            _record_render_slice_timings(len(page_slice), timings, ext.lower().lstrip('.'))
+                            done += len(page_slice)
+                            debug_log.debug("Rendered pages %d-%d of %s", page_slice[0][0] + 1, page_slice[-1][0] + 1, input_path)
+                            if progress_callback:
+                                progress_callback(done, total)
+                except Exception:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        else:
+            for page_job in page_jobs:
+                written, timings = _render_pdf_page_slice(input_path, [page_job], dpi, colorspace, max_pixmap_bytes, pdf_data)
+                written_by_job[page_job[1]] = written[0]
+                _record_render_slice_timings(1, timings, ext.lower().lstrip('.'))
+                done += 1
+                debug_log.debug("Saved page %d of %s to %s", page_job[0] + 1, input_path, page_job[1])
+                if progress_callback:
+                    progress_callback(done, total)
+
+        for page_index, reserved_path in page_jobs:
+            page_output_path = written_by_job[reserved_path]
+            if page_output_path != reserved_path:
+                release_filename(reserved_path)
+                user_log.warning(f"Page {page_index + 1} of '{os.path.basename(input_path)}' is too large to render as "
+                                 f"{ext.lstrip('.').upper()} within the {max_pixmap_bytes // (1024 * 1024)} MB render memory limit; saved as PNG instead.")
+            output_files.append(page_output_path)
+            user_log.info("Saved page %d from '%s' as '%s'", page_index + 1, os.path.basename(input_path), os.path.basename(page_output_path))
+
         if not output_files:
             raise ValueError("No pages found or converted from PDF.")
         user_log.info(f"Successfully converted PDF to {len(output_files)} image(s).")
     except Exception as e:
+        for _, page_output_path in page_jobs: # Drop names reserved for pages that were never written
+            if os.path.exists(page_output_path) and os.path.getsize(page_output_path) == 0:
+                os.remove(page_output_path)
+                release_filename(page_output_path)
         user_log.error(f"Failed to convert PDF {input_path} to images: {e}")
         debug_log.exception(f"Error during PDF to images conversion for {input_path}.")
         raise
     return output_files
 
-def convert_pdf_to_office(input_path, output_path):
+PDF2DOCX_WORKER_COUNT = os.cpu_count() or 1
+PDF2DOCX_PARALLEL_MIN_PAGES = 16 # Below this, pdf2docx's worker start-up costs more than it saves
+PDF2DOCX_SCRATCH_PREFIX = "file_converter_pdf2docx_" # Private working directory of one parallel pdf2docx run
+
+def _run_pdf2docx(input_path, output_path, pdf_data=None, **convert_kwargs):
+    Converter = import_backend('pdf2docx').Converter # pdf2docx pulls in OpenCV, numpy and python-docx
+    cv = Converter(stream=pdf_data) if pdf_data is not None else Converter(input_path)
+    try:
+        cv.convert(output_path, **convert_kwargs) # This can take time
+    finally:
+        cv.close()
+
+def _init_pdf2docx_worker(scratch_dir, log_queue):
+    os.chdir(scratch_dir)
+    init_worker_logging(log_queue)
+
+def _run_pdf2docx_parallel(input_path, output_path, workers, page_kwargs):
+    """
+    Body of a parallel pdf2docx run. It executes in a spawned process whose working directory is a private
+    scratch directory, because pdf2docx exchanges results through fixed 'pages-<n>.json' files in the cwd.
+    pdf2docx's own Pool() would fork `cpu_count()` processes; it is swapped for a spawn pool of `workers`.
+    """
+    converter_module = import_backend('pdf2docx.converter')
+    converter_module.Pool = functools.partial(multiprocessing.get_context('spawn').Pool, workers)
+    _run_pdf2docx(input_path, output_path, multi_processing=True, cpu_count=workers, **page_kwargs)
+
+def convert_pdf_to_office(input_path, output_path, page_range=None, workers=None, pdf_data=None):
+    """
+    Converts a PDF to DOCX with pdf2docx. `page_range` uses parse_page_range syntax ("10-20"); `workers`
+    (default PDF2DOCX_WORKER_COUNT) enables pdf2docx's multi-process parsing for long, contiguous ranges.
+    If the parallel run fails, the conversion is retried serially. An in-memory `pdf_data` is always
+    parsed in one process, since pdf2docx's workers re-open the PDF by file name.
+    """
     user_log.info(f"Converting PDF '{os.path.basename(input_path)}' to DOCX: {os.path.basename(output_path)}")
-    debug_log.debug(f"convert_pdf_to_office: {input_path} -> {output_path}")
+    debug_log.debug("convert_pdf_to_office: %s -> %s, pages=%s, workers=%s", input_path, output_path, page_range, workers)
     if not output_path.endswith('.docx'):
         msg = "Only .docx conversion is supported for office files from PDF."
         user_log.error(msg)
@@ -470,10 +2543,44 @@ def convert_pdf_to_office(input_path, output_path):
         raise ValueError(msg)
         
     try:
-        cv = Converter(input_path)
-        cv.convert(output_path) # This can take time
-        cv.close()
-        user_log.info(f"Successfully converted PDF to DOCX: {os.path.basename(output_path)}")
+        fitz = load_fitz() # Configure PyMuPDF before pdf2docx imports it
+        with stage("open", backend="fitz", bytes_in=_pdf_input_size(input_path, pdf_data)), open_pdf(input_path, pdf_data) as doc:
+            page_count = doc.page_count
+        page_indexes = parse_page_range(page_range, page_count)
+        if not page_indexes:
+            raise ValueError(f"PDF '{os.path.basename(input_path)}' has no pages to convert.")
+        workers = max(1, min(workers or PDF2DOCX_WORKER_COUNT, len(page_indexes)))
+
+        is_contiguous = page_indexes == list(range(page_indexes[0], page_indexes[-1] + 1))
+        if is_contiguous:
+            # pdf2docx's multi-processing only accepts a start/end range (end exclusive)
+            page_kwargs = {"start": page_indexes[0], "end": page_indexes[-1] + 1}
+        else:
+            page_kwargs = {"pages": page_indexes}
+
+        converted = False
+        if workers > 1 and is_contiguous and len(page_indexes) >= PDF2DOCX_PARALLEL_MIN_PAGES and pdf_data is None:
+            try:
+                scratch_dir = tempfile.mkdtemp(prefix=PDF2DOCX_SCRATCH_PREFIX)
+                try:
+                    with stage("convert", backend="pdf2docx-parallel", pages=len(page_indexes)) as convert_stage, \
+                         ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'),
+                                             initializer=_init_pdf2docx_worker, initargs=(scratch_dir, get_worker_log_queue())) as executor:
+                        executor.submit(_run_pdf2docx_parallel, os.path.abspath(input_path), os.path.abspath(output_path),
+                                        workers, page_kwargs).result()
+                        convert_stage.bytes_out = _path_size(output_path) # pdf2docx writes the file itself
+                finally:
+                    shutil.rmtree(scratch_dir, ignore_errors=True) # Also drops partial results of a failed run
+                converted = True
+                debug_log.debug("pdf2docx converted %d page(s) of %s with %d processes.", len(page_indexes), input_path, workers)
+            except Exception as e:
+                user_log.warning(f"Parallel DOCX conversion failed ({e}); retrying with a single process.")
+                debug_log.exception(f"pdf2docx multi-processing failed for {input_path}; falling back to serial.")
+        if not converted:
+            with stage("convert", backend="pdf2docx", pages=len(page_indexes)) as convert_stage:
+                _run_pdf2docx(input_path, output_path, pdf_data=pdf_data, **page_kwargs)
+                convert_stage.bytes_out = _path_size(output_path)
+        user_log.info(f"Successfully converted PDF to DOCX ({len(page_indexes)} of {page_count} page(s)): {os.path.basename(output_path)}")
     except Exception as e: # pdf2docx can raise various errors
         user_log.error(f"Failed to convert PDF {input_path} to DOCX: {e}")
         debug_log.exception(f"Error during PDF to DOCX conversion for {input_path}.")
@@ -505,27 +2612,449 @@ def handle_unsupported_file(input_path):
     raise ValueError(f"Unsupported file type: {os.path.splitext(input_path)[1]} for the selected operation.")
 
 
-def convert_to_pdf(input_paths_raw):
+# --- PDF Optimization ---
+PDF_OPTIMIZE_ENABLED = os.environ.get("FILE_CONVERTER_OPTIMIZE_PDF", "0") == "1" # Default for convert_to_pdf(optimize=None)
+PDF_OPTIMIZE_DPI_THRESHOLD = 225 # Images shown at more than this resolution are downsampled...
+PDF_OPTIMIZE_DPI_TARGET = 150 # ...to this resolution
+PDF_OPTIMIZE_JPEG_QUALITY = 75 # JPEG images are re-encoded at this quality when that makes them smaller
+
+def _pdf_image_rewrite_options():
+    """
+    MuPDF image rewriting options: JPEG images are downsampled above PDF_OPTIMIZE_DPI_THRESHOLD and re-encoded,
+    lossless images are downsampled but stay lossless, and 1-bit (fax) images are left alone. An image is
+    only replaced if the new one is smaller.
+    """
+    mupdf = import_backend('pymupdf').mupdf
+    options = mupdf.PdfImageRewriterOptions()
+    options.recompress_when = mupdf.FZ_RECOMPRESS_WHEN_SMALLER
+    for kind in ("color", "gray"):
+        for compression, method in (("lossy", mupdf.FZ_RECOMPRESS_JPEG), ("lossless", mupdf.FZ_RECOMPRESS_LOSSLESS)):
+            prefix = f"{kind}_{compression}_image_"
+            setattr(options, prefix + "subsample_method", mupdf.FZ_SUBSAMPLE_BICUBIC) # AVERAGE only divides by whole factors
+            setattr(options, prefix + "subsample_threshold", PDF_OPTIMIZE_DPI_THRESHOLD)
+            setattr(options, prefix + "subsample_to", PDF_OPTIMIZE_DPI_TARGET)
+            setattr(options, prefix + "recompress_method", method)
+            setattr(options, prefix + "recompress_quality", str(PDF_OPTIMIZE_JPEG_QUALITY))
+    return options
+
+def _linearize_pdf(pdf_path):
+    # MuPDF 1.24+ can no longer write linearized files, so this needs the optional pikepdf (qpdf) package
+    try:
+        pikepdf = import_backend('pikepdf')
+    except ImportError:
+        user_log.warning("Fast web view (linearization) skipped: the optional 'pikepdf' package is not installed.")
+        return False
+    tmp_path = f"{pdf_path}.{os.getpid()}.linear.tmp"
+    try:
+        with pikepdf.open(pdf_path) as pdf:
+            pdf.save(tmp_path, linearize=True)
+        os.replace(tmp_path, pdf_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return True
+
+def optimize_pdf(pdf_path, linearize=False):
+    """
+    Shrinks a finished PDF in place: image downsampling/re-compression (see _pdf_image_rewrite_options),
+    then a rewrite with unused and duplicate objects removed (garbage=4), content streams cleaned, streams
+    deflated and objects packed into object streams. The original is kept if the rewrite is not smaller.
+    With `linearize`, the result is also linearized for fast web view. Returns a report dict with the
+    sizes before and after and the time taken. Errors are raised; the file at `pdf_path` is then left as the
+    last step that succeeded wrote it.
+    """
+    started = time.perf_counter()
+    bytes_before = _path_size(pdf_path)
+    tmp_path = f"{pdf_path}.{os.getpid()}.tmp"
+    try:
+        with stage("optimize", backend="fitz", bytes_in=bytes_before) as optimize_stage:
+            with load_fitz().open(pdf_path) as doc:
+                optimize_stage.pages = doc.page_count
+                doc.rewrite_images(options=_pdf_image_rewrite_options())
+                doc.save(tmp_path, garbage=4, clean=True, deflate=True, deflate_images=True, deflate_fonts=True, use_objstms=1)
+            if _path_size(tmp_path) < bytes_before:
+                os.replace(tmp_path, pdf_path)
+            optimize_stage.bytes_out = _path_size(pdf_path)
+        linearized = False
+        if linearize:
+            with stage("optimize", backend="pikepdf"):
+                linearized = _linearize_pdf(pdf_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    report = {"bytes_before": bytes_before, "bytes_after": _path_size(pdf_path),
+              "seconds": round(time.perf_counter() - started, 3), "linearized": linearized}
+    saved = 1 - report["bytes_after"] / bytes_before if bytes_before else 0
+    user_log.info(f"Optimized {os.path.basename(pdf_path)}: {bytes_before:,} -> {report['bytes_after']:,} bytes "
+                  f"({saved:.0%} smaller) in {report['seconds']:.2f} s{', linearized' if linearized else ''}")
+    return report
+
+# --- Conversion Cache ---
+CACHE_DIR = os.path.join(SCRIPT_DIR, "Cache")
+CACHE_MAX_BYTES = 1024 * 1024 * 1024 # 1 GB of cached outputs
+CACHE_MAX_AGE_SECONDS = 30 * 24 * 3600 # Entries older than 30 days are dropped
+CACHE_ENABLED = os.environ.get("FILE_CONVERTER_CACHE", "1") != "0"
+CACHE_FORMAT_VERSION = 1 # Bump when a converter's output changes for the same input and parameters
+HASH_CHUNK_SIZE = 1024 * 1024
+CACHE_BUSY_TIMEOUT_SECONDS = 10 # Several processes (GUI, CLI runs) may update the index at once
+CACHE_ORPHAN_GRACE_SECONDS = 3600 # Object folders without an index row are removed once this old
+CACHE_SCHEMA_VERSION = 1
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    files TEXT NOT NULL, -- JSON list of [stored name, name suffix]
+    multiple INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL, -- Unix time
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Distribution names whose versions go into the cache key, per backend
+BACKEND_DISTRIBUTIONS = {
+    "fitz": ["PyMuPDF"],
+    "pdf2docx": ["pdf2docx", "PyMuPDF"],
+    "images": ["PyMuPDF", "Pillow"],
+    "text": ["PyMuPDF"], # Font metrics; the PDF itself is written by StreamingPdfWriter
+    "soffice": [],
+}
+# Backends that are external programs: the first line of this command's output goes into the cache key
+BACKEND_VERSION_COMMANDS = {"soffice": ["soffice", "--version"]}
+BACKEND_VERSION_TIMEOUT_SECONDS = 30
+
+def file_sha256(path):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            sha.update(chunk)
+    digest = sha.hexdigest()
+    conversion = getattr(_metrics_local, "conversion", None)
+    if conversion is not None: # Lets the job journal reuse the cache key's hashes
+        conversion["hashes"][str(path)] = digest
+    return digest
+
+@functools.lru_cache(maxsize=None)
+def _command_version(backend):
+    # Runs once per process; LibreOffice prints e.g. "LibreOffice 7.6.4.1 e19e193f88cd..."
+    try:
+        result = subprocess.run(BACKEND_VERSION_COMMANDS[backend], capture_output=True, text=True, timeout=BACKEND_VERSION_TIMEOUT_SECONDS)
+        output = result.stdout.strip()
+        return output.splitlines()[0] if output else "unknown"
+    except (OSError, subprocess.SubprocessError) as e:
+        debug_log.debug("Could not read the %s version: %s", backend, e)
+        return "unknown"
+
+def backend_version(backend):
+    # Reads installed package versions from metadata, which is cheap and does not import the backend
+    from importlib import metadata
+    versions = [_command_version(backend)] if backend in BACKEND_VERSION_COMMANDS else []
+    for dist in BACKEND_DISTRIBUTIONS.get(backend, []):
+        try:
+            versions.append(f"{dist}=={metadata.version(dist)}")
+        except metadata.PackageNotFoundError: # e.g. metadata not bundled in the frozen .exe
+            versions.append(f"{dist}==unknown")
+    return ";".join([backend] + versions)
+
+
+class ConversionCache:
+    """
+    Content-addressed store of conversion outputs under CACHE_DIR.
+    The key is a SHA-256 over the input file contents, the conversion parameters and the backend versions.
+    An entry's files live in `objects/<key>/`. `index.sqlite3` has one row per entry (files, size, creation
+    and last-access time, for age limits and LRU eviction) plus hit/miss counters, so the GUI and CLI runs
+    can share the cache. Files are copied outside the lock; only index updates are serialized.
+    """
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES, max_age_seconds=CACHE_MAX_AGE_SECONDS):
+        self.cache_dir = cache_dir
+        self.objects_dir = os.path.join(cache_dir, "objects")
+        self.index_path = os.path.join(cache_dir, "index.sqlite3")
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self._conn = sqlite3.connect(self.index_path, timeout=CACHE_BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL") # A crash may lose the last index updates; eviction then removes their folders
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] < CACHE_SCHEMA_VERSION:
+                self._conn.executescript(CACHE_SCHEMA)
+                self._conn.execute(f"PRAGMA user_version={CACHE_SCHEMA_VERSION}")
+        with contextlib.suppress(OSError): # Index of older versions; its object folders are swept up as orphans
+            os.remove(os.path.join(cache_dir, "index.json"))
+
+    def make_key(self, input_paths, params):
+        sha = hashlib.sha256()
+        sha.update(json.dumps({"format": CACHE_FORMAT_VERSION, "params": params}, sort_keys=True).encode('utf-8'))
+        for path in input_paths:
+            sha.update(file_sha256(path).encode('ascii'))
+        return sha.hexdigest()
+
+    def _count(self, counter):
+        self._conn.execute("INSERT INTO counters (name, value) VALUES (?, 1) ON CONFLICT(name) DO UPDATE SET value = value + 1", (counter,))
+
+    def _remove_entries(self, keys):
+        if not keys:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in keys])
+        for key in keys:
+            shutil.rmtree(os.path.join(self.objects_dir, key), ignore_errors=True)
+
+    def lookup(self, key, output_template):
+        """
+        Restores a cached result next to `output_template` and returns it in the converter's shape
+        (a path, or a list of paths for multi-file outputs). Returns None on a miss, which writes nothing:
+        misses are counted by store() once the conversion has run.
+        """
+        with self._lock:
+            entry = self._conn.execute("SELECT * FROM entries WHERE key = ?", (key,)).fetchone()
+        if entry is None:
+            return None
+        if time.time() - entry["created"] > self.max_age_seconds:
+            debug_log.debug("Cache entry %s expired.", key)
+            self._remove_entries([key])
+            return None
+
+        entry_dir = os.path.join(self.objects_dir, key)
+        output_dir = os.path.dirname(output_template)
+        new_base = os.path.splitext(os.path.basename(output_template))[0]
+        restored = []
+        try:
+            for name, suffix in json.loads(entry["files"]):
+                # Claimed like a converter claims its outputs, so a hit never overwrites a file that is already there
+                target_name = f"{new_base}{suffix}" if entry["multiple"] else os.path.basename(output_template)
+                target = get_unique_filename(output_dir, target_name, reserve=True)
+                restored.append(target)
+                shutil.copyfile(os.path.join(entry_dir, name), target)
+        except FileNotFoundError: # Removed by hand, or evicted by another process while we were copying
+            debug_log.warning(f"Cache entry {key} is missing files; dropping it.")
+            for target in restored:
+                with contextlib.suppress(OSError):
+                    os.remove(target)
+                release_filename(target)
+            self._remove_entries([key])
+            return None
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._count("hits")
+        user_log.info(f"Conversion cache hit: restored {len(restored)} file(s) without converting.")
+        return restored if entry["multiple"] else restored[0]
+
+    def store(self, key, result, output_template):
+        outputs = result if isinstance(result, list) else [result]
+        template_base = os.path.splitext(os.path.basename(output_template))[0]
+        entry_dir = os.path.join(self.objects_dir, key)
+        # Files are copied into a private folder first and renamed into place, so no lock is held while copying
+        staging_dir = tempfile.mkdtemp(prefix=f"{key}.", suffix=".tmp", dir=self.objects_dir)
+        try:
+            files = []
+            size = 0
+            for i, path in enumerate(outputs):
+                name = os.path.basename(path)
+                # Remember the part after the input's base name so a hit can rebuild names for a renamed input
+                suffix = name[len(template_base):] if name.startswith(template_base) else f"_{i+1}{os.path.splitext(name)[1]}"
+                stored_name = f"{i:06d}{os.path.splitext(name)[1]}"
+                shutil.copyfile(path, os.path.join(staging_dir, stored_name))
+                size += os.path.getsize(path)
+                files.append([stored_name, suffix])
+            shutil.rmtree(entry_dir, ignore_errors=True) # Left over from an entry whose index row is gone
+            try:
+                os.rename(staging_dir, entry_dir)
+            except OSError:
+                if not os.path.isdir(entry_dir):
+                    raise
+                debug_log.debug("Cache entry %s was stored by another process first.", key) # Same key, same files
+            now = time.time()
+            with self._lock, self._conn:
+                self._conn.execute("INSERT OR REPLACE INTO entries (key, files, multiple, size, created, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                                   (key, json.dumps(files), isinstance(result, list), size, now, now))
+                self._count("misses")
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        debug_log.debug("Stored %d output file(s) (%d bytes) in conversion cache entry %s", len(outputs), size, key)
+        self._evict()
+
+    def _evict(self):
+        """
+        Drops expired entries, then least recently used ones until CACHE_MAX_BYTES is met, then object
+        folders without an index row (older than CACHE_ORPHAN_GRACE_SECONDS, so stores in progress are kept).
+        """
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute("SELECT key, size, created FROM entries ORDER BY last_access").fetchall()
+        known = {row["key"] for row in rows}
+        removed = [row["key"] for row in rows if now - row["created"] > self.max_age_seconds]
+        live = [row for row in rows if now - row["created"] <= self.max_age_seconds]
+        total = sum(row["size"] for row in live)
+        for row in live: # Least recently used first
+            if total <= self.max_bytes:
+                break
+            total -= row["size"]
+            debug_log.debug("Evicting cache entry %s (%d bytes)", row['key'], row['size'])
+            removed.append(row["key"])
+        self._remove_entries(removed)
+
+        with os.scandir(self.objects_dir) as dir_entries:
+            for dir_entry in dir_entries:
+                try:
+                    if dir_entry.name in known or now - dir_entry.stat(follow_symlinks=False).st_mtime < CACHE_ORPHAN_GRACE_SECONDS:
+                        continue
+                    debug_log.debug("Removing orphaned cache object %s", dir_entry.name)
+                    if dir_entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(dir_entry.path)
+                    else:
+                        os.remove(dir_entry.path)
+                except OSError as e:
+                    debug_log.warning(f"Could not remove orphaned cache object {dir_entry.path}: {e}")
+
+    def stats(self):
+        with self._lock:
+            entries, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            counters = {row["name"]: row["value"] for row in self._conn.execute("SELECT name, value FROM counters")}
+        hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+        return {
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 3) if hits + misses else None,
+        }
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute("DELETE FROM counters")
+        with os.scandir(self.objects_dir) as dir_entries:
+            for dir_entry in dir_entries:
+                shutil.rmtree(dir_entry.path, ignore_errors=True)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_conversion_cache = None
+_conversion_cache_lock = threading.Lock()
+
+def get_conversion_cache():
+    """Returns the shared ConversionCache, or None when caching is disabled or the cache folder is unusable."""
+    global _conversion_cache
+    if not CACHE_ENABLED or CACHE_MAX_BYTES <= 0:
+        return None
+    with _conversion_cache_lock:
+        if _conversion_cache is None:
+            try:
+                _conversion_cache = ConversionCache()
+            except (sqlite3.Error, OSError) as e:
+                user_log.warning(f"Conversion cache disabled, could not create {CACHE_DIR}: {e}")
+                return None
+        return _conversion_cache
+
+def run_cached_conversion(input_paths, params, output_template, convert, use_cache=True):
+    """
+    Runs `convert()` unless the conversion cache already holds its result for these inputs and parameters.
+    `output_template` is the converter's output path (or naming template for multi-file outputs).
+    """
+    cache = get_conversion_cache() if use_cache else None
+    if cache is None:
+        return convert()
+    try:
+        with stage("cache_lookup", backend="bypass", bytes_in=sum(_path_size(p) for p in input_paths)) as lookup_stage:
+            key = cache.make_key(input_paths, params)
+            cached = cache.lookup(key, output_template)
+            lookup_stage.backend = "miss" if cached is None else "hit"
+    except (sqlite3.Error, OSError) as e: # Unreadable input or cache trouble: let the converter run (and report input errors)
+        debug_log.warning(f"Conversion cache bypassed for {input_paths}: {e}")
+        return convert()
+    if cached is not None:
+        return cached
+
+    result = convert()
+    try:
+        with stage("cache_store"):
+            cache.store(key, result, output_template)
+    except (sqlite3.Error, OSError) as e:
+        user_log.warning(f"Could not store conversion result in cache: {e}")
+        debug_log.exception("Error storing conversion cache entry")
+    return result
+
+
+TO_PDF_IMAGE_EXTS = ['.jpg', '.jpeg', '.png', '.bmp', '.tiff']
+TO_PDF_OFFICE_EXTS = ['.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx']
+
+def _split_input_paths(input_paths_raw):
+    # Inputs arrive as a list or as one ';'-separated string (the GUI's selection)
+    if isinstance(input_paths_raw, list):
+        return input_paths_raw
+    if isinstance(input_paths_raw, str) and ';' in input_paths_raw:
+        return input_paths_raw.split(';')
+    return [input_paths_raw]
+
+def classify_to_pdf_inputs(input_paths):
+    """
+    Returns "images", "office" or "text": which converter turns `input_paths` into one PDF. Several files
+    are only accepted if they are all images; unsupported files go to handle_unsupported_file (which raises).
+    """
+    exts = [os.path.splitext(path)[1].lower() for path in input_paths]
+    if all(ext in TO_PDF_IMAGE_EXTS for ext in exts):
+        return "images"
+    if len(input_paths) > 1:
+        msg = "Multiple files are only merged into one PDF if they are all images; convert other files one job per file (see convert_batch)."
+        user_log.error(msg + f" Received: {len(input_paths)} files.")
+        debug_log.error(msg + f" Files: {input_paths}")
+        raise ValueError(msg)
+    if exts[0] in TO_PDF_OFFICE_EXTS:
+        return "office"
+    if exts[0] == '.txt':
+        return "text"
+    handle_unsupported_file(input_paths[0]) # Logs, copies the file to 'Other_Unprocessed' and raises
+
+def _resolve_image_dpi(image_dpi):
+    if image_dpi is None: # Only a missing value falls back to the default; 0 is an error, not "unset"
+        image_dpi = IMAGE_PDF_TARGET_DPI
+    if image_dpi is not None and image_dpi <= 0:
+        raise ValueError(f"Image DPI must be a positive number, got {image_dpi}.")
+    return image_dpi
+
+def _resolve_text_font(text_font):
+    text_font = text_font or os.environ.get(TEXT_PDF_FONT_ENV) or None
+    if text_font and not os.path.isfile(text_font):
+        raise ValueError(f"Font file not found: {text_font}")
+    return text_font
+
+def _to_pdf_params(kind, image_dpi=None, text_font=None, monospace=False):
+    # Cache parameters of the to-PDF step, for the resolved `image_dpi` / `text_font`
+    if kind == "images":
+        return {"output": "pdf", "backend": backend_version("images"), "dpi": image_dpi}
+    if kind == "office":
+        return {"output": "pdf", "backend": backend_version("soffice")}
+    return {"output": "pdf", "backend": backend_version("text"), "monospace": bool(monospace),
+            "font": file_sha256(text_font) if text_font else None}
+
+@track_conversion("to-pdf")
+def convert_to_pdf(input_paths_raw, progress_callback=None, open_outputs=True, use_cache=True, work_dir=None,
+                   text_font=None, monospace=False, image_dpi=None, optimize=None, linearize=False):
     user_log.info(f"Request to convert to PDF: {input_paths_raw}")
-    debug_log.debug(f"convert_to_pdf called with input_paths_raw: {input_paths_raw}")
+    debug_log.debug("convert_to_pdf called with input_paths_raw: %s", input_paths_raw)
 
-    if not isinstance(input_paths_raw, list):
-        if isinstance(input_paths_raw, str) and ';' in input_paths_raw:
-            input_paths = input_paths_raw.split(';')
-            debug_log.debug(f"Split input string into multiple paths: {input_paths}")
-        else:
-            input_paths = [input_paths_raw]
-    else: # Already a list
-        input_paths = input_paths_raw
-    
+    input_paths = _split_input_paths(input_paths_raw)
     if not input_paths or not input_paths[0]: # Check for empty list or empty first path
         msg = "No input file provided for PDF conversion."
         user_log.error(msg)
         debug_log.error(msg)
         raise ValueError(msg)
 
-    # Use the directory of the first input file for the output, or script_dir if path is relative
-    first_input_dir = os.path.dirname(input_paths[0])
+    # Use the directory of the first input file for the output, or script_dir if path is relative.
+    # `work_dir` overrides this, e.g. so a watched inbox never sees intermediate outputs.
+    first_input_dir = work_dir or os.path.dirname(input_paths[0])
     if not first_input_dir: # If input is just a filename, assume it's in script_dir or CWD
         first_input_dir = SCRIPT_DIR 
     
@@ -533,36 +3062,50 @@ def convert_to_pdf(input_paths_raw):
     output_path_template = os.path.join(first_input_dir, output_base_name + ".pdf")
     # Ensure output path is unique before passing to conversion functions
     output_path = get_unique_filename(first_input_dir, os.path.basename(output_path_template))
-    debug_log.debug(f"Determined output PDF path: {output_path}")
+    debug_log.debug("Determined output PDF path: %s", output_path)
+
+    # The optional optimize stage runs inside the cached step, so a cache hit returns the optimized file.
+    # Only options that are switched on go into the cache key, so plain conversions keep their existing entries.
+    optimize = PDF_OPTIMIZE_ENABLED if optimize is None else bool(optimize)
+    optimize_params = {name: True for name, enabled in (("optimize", optimize), ("linearize", linearize)) if enabled}
+    def optimized(convert):
+        def run():
+            result = convert()
+            try:
+                if optimize:
+                    optimize_pdf(result, linearize=linearize)
+                elif linearize:
+                    _linearize_pdf(result)
+            except Exception as e: # optimize_pdf and _linearize_pdf only replace the file once a rewrite succeeded
+                user_log.warning(f"Could not optimize {os.path.basename(result)}, keeping it unoptimized: {e}")
+                debug_log.exception(f"Error optimizing {result}")
+            return result
+        return run
 
-    exts = [os.path.splitext(path)[1].lower() for path in input_paths]
-    image_exts = ['.jpg', '.jpeg', '.png', '.bmp', '.tiff']
-    office_exts = ['.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx']
-    
     final_output = None
     # Determine file type and validate inputs
-    if all(ext in image_exts for ext in exts):
+    kind = classify_to_pdf_inputs(input_paths)
+    if kind == "images":
         user_log.info(f"Identified input as image(s) for PDF conversion: {[os.path.basename(p) for p in input_paths]}")
-        final_output = convert_images_to_pdf(input_paths, output_path)
-    elif len(input_paths) > 1:
-        msg = "Multiple files are only supported for image-to-PDF conversion."
-        user_log.error(msg + f" Received: {len(input_paths)} files.")
-        debug_log.error(msg + f" Files: {input_paths}")
-        raise ValueError(msg)
-    elif exts[0] in office_exts:
+        image_dpi = _resolve_image_dpi(image_dpi)
+        final_output = run_cached_conversion(
+            input_paths, {**_to_pdf_params(kind, image_dpi=image_dpi), **optimize_params}, output_path,
+            optimized(lambda: convert_images_to_pdf(input_paths, output_path, progress_callback=progress_callback, target_dpi=image_dpi)),
+            use_cache=use_cache)
+    elif kind == "office":
         user_log.info(f"Identified input as Office file for PDF conversion: {os.path.basename(input_paths[0])}")
-        final_output = convert_office_to_pdf(input_paths[0], output_path)
-    elif exts[0] == '.txt':
-        user_log.info(f"Identified input as text file for PDF conversion: {os.path.basename(input_paths[0])}")
-        final_output = convert_text_to_pdf(input_paths[0], output_path)
+        final_output = run_cached_conversion(
+            input_paths, {**_to_pdf_params(kind), **optimize_params}, output_path,
+            optimized(lambda: convert_office_to_pdf(input_paths[0], output_path)), use_cache=use_cache)
     else:
-        # Let handle_unsupported_file log and raise the error
-        handle_unsupported_file(input_paths[0]) 
-        # Should not be reached due to raise in handle_unsupported_file
-        return [] 
-        
+        user_log.info(f"Identified input as text file for PDF conversion: {os.path.basename(input_paths[0])}")
+        text_font = _resolve_text_font(text_font)
+        final_output = run_cached_conversion(
+            input_paths, {**_to_pdf_params(kind, text_font=text_font, monospace=monospace), **optimize_params}, output_path,
+            optimized(lambda: convert_text_to_pdf(input_paths[0], output_path, font_path=text_font, monospace=monospace)), use_cache=use_cache)
+
     if final_output:
-        sorted_files = handle_output_file(output_path, final_output) # handle_output_file logs success of sorting
+        sorted_files = handle_output_file(output_path, final_output, open_outputs=open_outputs) # handle_output_file logs success of sorting
         user_log.info(f"Successfully converted {input_paths_raw} to PDF. Final sorted output(s): {sorted_files}")
         return sorted_files
     else:
@@ -572,9 +3115,45 @@ def convert_to_pdf(input_paths_raw):
         debug_log.error(msg)
         raise RuntimeError(msg) # Or a more specific error
 
-def convert_from_pdf(input_path, output_type):
+FROM_PDF_IMAGE_TYPES = ['jpg', 'jpeg', 'png']
+
+def _from_pdf_target(output_dir, filename_base, output_type, page_range=None, dpi=None, colorspace="rgb", memory_limit_mb=None):
+    """
+    Returns `(output path or naming template, cache params, multiple outputs?)` for converting a PDF named
+    `filename_base` to `output_type`, or None if that type is not supported.
+    """
+    if output_type == 'txt':
+        params = {"output": "txt", "page_range": page_range, "backend": backend_version("fitz")}
+        return os.path.join(output_dir, f"{filename_base}.txt"), params, False
+    if output_type in FROM_PDF_IMAGE_TYPES or output_type in ARCHIVE_FORMATS:
+        # Page images are one file each; an archive is a single .zip/.tar holding them all
+        params = {"output": output_type, "page_range": page_range, "dpi": dpi, "colorspace": colorspace,
+                  "memory_limit_mb": memory_limit_mb or RENDER_MEMORY_LIMIT_MB, "backend": backend_version("fitz")}
+        return os.path.join(output_dir, f"{filename_base}.{output_type}"), params, output_type in FROM_PDF_IMAGE_TYPES
+    if output_type in ['doc', 'docx']: # Only .docx is written, also when 'doc' is selected
+        params = {"output": "docx", "page_range": page_range, "backend": backend_version("pdf2docx")}
+        return os.path.join(output_dir, f"{filename_base}.docx"), params, False
+    return None
+
+def _run_from_pdf_converter(input_path, output_type, output_path, progress_callback=None, page_range=None, dpi=None, colorspace="rgb",
+                            workers=None, memory_limit_mb=None, pdf_data=None):
+    # Runs the converter for an `output_type` accepted by _from_pdf_target; `pdf_data` as in open_pdf
+    if output_type == 'txt':
+        return convert_pdf_to_text(input_path, output_path, progress_callback=progress_callback, page_range=page_range, pdf_data=pdf_data)
+    if output_type in FROM_PDF_IMAGE_TYPES:
+        return convert_pdf_to_images(input_path, output_path, progress_callback=progress_callback, page_range=page_range, dpi=dpi,
+                                     colorspace=colorspace, workers=workers, memory_limit_mb=memory_limit_mb, pdf_data=pdf_data)
+    if output_type in ARCHIVE_FORMATS:
+        return convert_pdf_to_archive(input_path, output_path, progress_callback=progress_callback, page_range=page_range, dpi=dpi,
+                                      colorspace=colorspace, archive_format=output_type, workers=workers,
+                                      memory_limit_mb=memory_limit_mb, pdf_data=pdf_data)
+    return convert_pdf_to_office(input_path, output_path, page_range=page_range, workers=workers, pdf_data=pdf_data)
+
+@track_conversion("from-pdf")
+def convert_from_pdf(input_path, output_type, progress_callback=None, page_range=None, dpi=None, colorspace="rgb", open_outputs=True,
+                     use_cache=True, work_dir=None, workers=None, memory_limit_mb=None):
     user_log.info(f"Request to convert from PDF '{os.path.basename(input_path)}' to '{output_type}'")
-    debug_log.debug(f"convert_from_pdf called with input_path: {input_path}, output_type: {output_type}")
+    debug_log.debug("convert_from_pdf called with input_path: %s, output_type: %s", input_path, output_type)
 
     if not input_path:
         msg = "No input PDF file provided for conversion."
@@ -582,38 +3161,30 @@ def convert_from_pdf(input_path, output_type):
         debug_log.error(msg)
         raise ValueError(msg)
 
-    # Use the directory of the input file for the output, or script_dir
-    input_dir = os.path.dirname(input_path)
+    # Use the directory of the input file (or `work_dir`) for the output, or script_dir
+    input_dir = work_dir or os.path.dirname(input_path)
     if not input_dir:
         input_dir = SCRIPT_DIR
 
     filename_base = os.path.splitext(os.path.basename(input_path))[0]
-    # Output path here is a template, actual unique names handled by conversion or get_unique_filename
-    output_path_template = os.path.join(input_dir, f"{filename_base}.{output_type}")
-    # For PDF to images, output_path_template is more of a naming hint for the series of images.
-    # For others, it's the direct output file. We'll let conversion functions use get_unique_filename if needed.
-    
-    final_output_or_list = None
-    is_multiple_output = False
-
-    if output_type == 'txt':
-        final_output_or_list = convert_pdf_to_text(input_path, output_path_template)
-    elif output_type in ['jpg', 'jpeg', 'png']: # Assuming these are image extensions
-        # convert_pdf_to_images handles unique naming for each page
-        final_output_or_list = convert_pdf_to_images(input_path, output_path_template)
-        is_multiple_output = True
-    elif output_type in ['doc', 'docx']:
-        # Ensure output_path_template is .docx if 'doc' is selected, as we only support .docx
-        actual_output_path = os.path.join(input_dir, f"{filename_base}.docx")
-        final_output_or_list = convert_pdf_to_office(input_path, actual_output_path)
-    else:
+    # For PDF to images, the output path is a naming template for the series of images; for others it's the
+    # direct output file. The converters reserve unique names themselves where needed.
+    target = _from_pdf_target(input_dir, filename_base, output_type, page_range=page_range, dpi=dpi, colorspace=colorspace,
+                              memory_limit_mb=memory_limit_mb)
+    if target is None:
         # Let handle_unsupported_file log and raise the error
         handle_unsupported_file(input_path) # Will use input_path to determine unsupported type
         return [] # Should not be reached
+    output_path_template, params, is_multiple_output = target
+    final_output_or_list = run_cached_conversion(
+        [input_path], params, output_path_template,
+        lambda: _run_from_pdf_converter(input_path, output_type, output_path_template, progress_callback=progress_callback,
+                                        page_range=page_range, dpi=dpi, colorspace=colorspace, workers=workers,
+                                        memory_limit_mb=memory_limit_mb), use_cache=use_cache)
 
     if final_output_or_list:
         # output_path_template is used as a hint for handle_output_file's logging
-        sorted_files = handle_output_file(output_path_template, final_output_or_list, multiple_files=is_multiple_output)
+        sorted_files = handle_output_file(output_path_template, final_output_or_list, multiple_files=is_multiple_output, open_outputs=open_outputs)
         user_log.info(f"Successfully converted PDF '{os.path.basename(input_path)}' to '{output_type}'. Final sorted output(s): {sorted_files}")
         return sorted_files
     else:
@@ -623,6 +3194,1010 @@ def convert_from_pdf(input_path, output_type):
         raise RuntimeError(msg)
 
 
+# --- Chained Conversions ---
+# Images / Office / text -> PDF -> any FROM_PDF_FORMATS output in one job. The PDF in between is only held
+# in memory and handed to the from-PDF converter as `pdf_data`; it is never sorted, cached or opened.
+
+def _convert_to_pdf_data(input_paths, kind, pdf_name, progress_callback=None, image_dpi=None, text_font=None, monospace=False):
+    # Returns the PDF for `input_paths` as bytes; `pdf_name` only names it in the log
+    if kind == "images":
+        return convert_images_to_pdf(input_paths, pdf_name, progress_callback=progress_callback, target_dpi=image_dpi, to_memory=True)
+    if kind == "text":
+        return convert_text_to_pdf(input_paths[0], pdf_name, font_path=text_font, monospace=monospace, to_memory=True)
+    # LibreOffice can only export to a file: it goes to a private temporary folder and is read back
+    with tempfile.TemporaryDirectory(prefix="file-converter-") as temp_dir:
+        pdf_path = convert_office_to_pdf(input_paths[0], os.path.join(temp_dir, os.path.basename(pdf_name)))
+        with open(pdf_path, 'rb') as f:
+            return f.read()
+
+@track_conversion("chain")
+def convert_chain(input_paths_raw, output_type, progress_callback=None, page_range=None, dpi=None, colorspace="rgb", open_outputs=True,
+                  use_cache=True, work_dir=None, workers=None, memory_limit_mb=None, text_font=None, monospace=False, image_dpi=None):
+    """
+    Converts images, an Office document or a text file to PDF and that PDF on to `output_type` (one of
+    FROM_PDF_FORMATS), e.g. DOCX -> PDF -> PNG pages. Options are those of convert_to_pdf and
+    convert_from_pdf. Only the final output(s) are written, cached and sorted; outputs are named after
+    the first input.
+    """
+    user_log.info(f"Request to convert {input_paths_raw} via PDF to '{output_type}'")
+    input_paths = _split_input_paths(input_paths_raw)
+    if not input_paths or not input_paths[0]:
+        raise ValueError("No input file provided for conversion.")
+    kind = classify_to_pdf_inputs(input_paths)
+    image_dpi = _resolve_image_dpi(image_dpi) if kind == "images" else None
+    text_font = _resolve_text_font(text_font) if kind == "text" else None
+
+    output_dir = work_dir or os.path.dirname(input_paths[0]) or SCRIPT_DIR
+    filename_base = os.path.splitext(os.path.basename(input_paths[0]))[0]
+    target = _from_pdf_target(output_dir, filename_base, output_type, page_range=page_range, dpi=dpi, colorspace=colorspace,
+                              memory_limit_mb=memory_limit_mb)
+    if target is None:
+        raise ValueError(f"Unsupported output format '{output_type}'. Choose one of: {', '.join(FROM_PDF_FORMATS)}.")
+    output_path, from_pdf_params, is_multiple_output = target
+    reserved_path = None
+    if not is_multiple_output and output_type not in ARCHIVE_FORMATS:
+        # A .txt or .docx output could have the input's own name (notes.txt -> PDF -> notes.txt)
+        output_path = reserved_path = get_unique_filename(output_dir, os.path.basename(output_path), reserve=True)
+    params = {"to_pdf": _to_pdf_params(kind, image_dpi=image_dpi, text_font=text_font, monospace=monospace), **from_pdf_params}
+    pdf_name = os.path.join(output_dir, filename_base + ".pdf")
+
+    def convert():
+        pdf_data = _convert_to_pdf_data(input_paths, kind, pdf_name, progress_callback=progress_callback, image_dpi=image_dpi,
+                                        text_font=text_font, monospace=monospace)
+        debug_log.debug("Chained conversion of %s: intermediate PDF is %d bytes in memory.", input_paths, len(pdf_data))
+        return _run_from_pdf_converter(input_paths[0], output_type, output_path, progress_callback=progress_callback,
+                                       page_range=page_range, dpi=dpi, colorspace=colorspace, workers=workers,
+                                       memory_limit_mb=memory_limit_mb, pdf_data=pdf_data)
+
+    try:
+        final_output_or_list = run_cached_conversion(input_paths, params, output_path, convert, use_cache=use_cache)
+    except Exception:
+        if reserved_path and os.path.exists(reserved_path) and os.path.getsize(reserved_path) == 0:
+            os.remove(reserved_path) # Drop the empty reserved name
+            release_filename(reserved_path)
+        raise
+    sorted_files = handle_output_file(output_path, final_output_or_list, multiple_files=is_multiple_output, open_outputs=open_outputs)
+    user_log.info(f"Successfully converted {input_paths_raw} via PDF to '{output_type}'. Final sorted output(s): {sorted_files}")
+    return sorted_files
+
+
+# --- PDF Page Tools ---
+# Merge, split and extract copy page objects (contents, fonts, images) with Document.insert_pdf. Nothing is
+# rendered or re-encoded, so vector content is kept exactly and the cost is mostly reading and writing.
+PDF_TOOLS = ["merge", "split", "extract"]
+
+def parse_page_groups(page_groups, page_count):
+    """
+    Turns "1-3; 4-10; 11-" into one list of 0-based page indexes per ';'-separated group, each parsed by
+    parse_page_range. None or an empty string gives one group per page.
+    """
+    if not page_groups or not str(page_groups).strip():
+        return [[page_index] for page_index in range(page_count)]
+    return [parse_page_range(group, page_count) for group in str(page_groups).split(';') if group.strip()]
+
+def _page_runs(page_indexes):
+    # Sorted page indexes -> (first, last) runs of consecutive pages, so each run is one insert_pdf call
+    runs = []
+    for page_index in page_indexes:
+        if runs and runs[-1][1] == page_index - 1:
+            runs[-1][1] = page_index
+        else:
+            runs.append([page_index, page_index])
+    return runs
+
+def _open_source_pdf(input_path):
+    with stage("open", backend="fitz", bytes_in=_path_size(input_path)):
+        doc = load_fitz().open(input_path)
+    if doc.needs_pass:
+        doc.close()
+        raise ValueError(f"'{os.path.basename(input_path)}' is password protected; its pages cannot be copied.")
+    return doc
+
+def copy_pdf_pages(parts, output_path):
+    """
+    Writes a new PDF made of the given pages. `parts` is a list of `(document, page indexes)` pairs, copied
+    in order. Runs from one document share a graft map, so fonts and images they have in common are
+    copied once.
+    """
+    fitz = load_fitz()
+    page_count = sum(len(page_indexes) for _, page_indexes in parts)
+    with fitz.open() as out:
+        with stage("convert", backend="fitz-copy", pages=page_count):
+            for doc, page_indexes in parts:
+                runs = _page_runs(page_indexes)
+                for run_number, (first, last) in enumerate(runs, start=1):
+                    out.insert_pdf(doc, from_page=first, to_page=last, final=run_number == len(runs))
+        with stage("write", backend="fitz", pages=page_count) as write_stage:
+            out.save(output_path, garbage=1)
+            write_stage.bytes_out = _path_size(output_path)
+    return output_path
+
+def merge_pdfs(input_paths, output_path, progress_callback=None):
+    """Appends all pages of every PDF in `input_paths`, in order, into `output_path`."""
+    user_log.info(f"Merging {len(input_paths)} PDF(s) into {os.path.basename(output_path)}")
+    docs = []
+    try:
+        for done, input_path in enumerate(input_paths, start=1):
+            docs.append(_open_source_pdf(input_path))
+            if progress_callback:
+                progress_callback(done, len(input_paths) + 1)
+        copy_pdf_pages([(doc, range(doc.page_count)) for doc in docs], output_path)
+    except Exception as e:
+        user_log.error(f"Failed to merge PDFs into {os.path.basename(output_path)}: {e}")
+        debug_log.exception(f"Error merging {input_paths} into {output_path}.")
+        raise
+    finally:
+        for doc in docs:
+            doc.close()
+    if progress_callback:
+        progress_callback(len(input_paths) + 1, len(input_paths) + 1)
+    return output_path
+
+def extract_pdf_pages(input_path, output_path, page_range):
+    """Copies the pages selected by `page_range` (see parse_page_range) into `output_path`, in page order."""
+    user_log.info(f"Extracting pages '{page_range}' of '{os.path.basename(input_path)}' to {os.path.basename(output_path)}")
+    try:
+        with _open_source_pdf(input_path) as doc:
+            copy_pdf_pages([(doc, parse_page_range(page_range, doc.page_count))], output_path)
+    except Exception as e:
+        user_log.error(f"Failed to extract pages from {input_path}: {e}")
+        debug_log.exception(f"Error extracting pages '{page_range}' from {input_path}.")
+        raise
+    return output_path
+
+def split_pdf(input_path, output_path_template, page_groups=None, progress_callback=None):
+    """
+    Writes one PDF per page group (see parse_page_groups; default: one per page), named
+    `<name>_<first>-<last>.pdf` or `<name>_<page>.pdf` after the template. Returns the output paths.
+    """
+    user_log.info(f"Splitting '{os.path.basename(input_path)}' ({page_groups or 'one file per page'})")
+    directory = os.path.dirname(output_path_template)
+    base_name = os.path.splitext(os.path.basename(output_path_template))[0]
+    output_files = []
+    reserved = []
+    try:
+        with _open_source_pdf(input_path) as doc:
+            groups = parse_page_groups(page_groups, doc.page_count)
+            # Names are reserved up front, in group order, like the pages of an image conversion
+            for group in groups:
+                suffix = f"{group[0] + 1}" if len(group) == 1 else f"{group[0] + 1}-{group[-1] + 1}"
+                reserved.append(get_unique_filename(directory, f"{base_name}_{suffix}.pdf", reserve=True))
+            for done, (group, part_path) in enumerate(zip(groups, reserved), start=1):
+                output_files.append(copy_pdf_pages([(doc, group)], part_path))
+                debug_log.debug("Wrote pages %d-%d of %s to %s", group[0] + 1, group[-1] + 1, input_path, part_path)
+                if progress_callback:
+                    progress_callback(done, len(groups))
+    except Exception as e:
+        for part_path in reserved[len(output_files):]: # Drop names reserved for parts that were never written
+            if os.path.exists(part_path) and os.path.getsize(part_path) == 0:
+                os.remove(part_path)
+                release_filename(part_path)
+        user_log.error(f"Failed to split PDF {input_path}: {e}")
+        debug_log.exception(f"Error splitting {input_path} by '{page_groups}'.")
+        raise
+    user_log.info(f"Split '{os.path.basename(input_path)}' into {len(output_files)} PDF(s).")
+    return output_files
+
+@track_conversion("pdf-tools")
+def run_pdf_tool(input_paths_raw, tool, progress_callback=None, page_range=None, open_outputs=True, work_dir=None):
+    """
+    Runs one of PDF_TOOLS and sorts the result(s) like any conversion output:
+    - "merge": all input PDFs, in order, into `<first>_merged.pdf`;
+    - "split": each input into one PDF per ';'-separated group of `page_range` (default: one per page);
+    - "extract": the pages of `page_range` from one input into `<name>_extract.pdf`.
+    Results are not cached; copying pages takes about as long as restoring them from the cache would.
+    """
+    user_log.info(f"Request to {tool} PDF(s): {input_paths_raw}")
+    input_paths = [p for p in input_paths_raw.split(';') if p] if isinstance(input_paths_raw, str) else list(input_paths_raw)
+    if tool not in PDF_TOOLS:
+        raise ValueError(f"Unknown PDF tool '{tool}'. Choose one of: {', '.join(PDF_TOOLS)}.")
+    if not input_paths:
+        raise ValueError("No input PDF file provided.")
+    not_pdfs = [os.path.basename(p) for p in input_paths if os.path.splitext(p)[1].lower() != '.pdf']
+    if not_pdfs:
+        raise ValueError(f"PDF tools only accept PDF files, got: {', '.join(not_pdfs)}")
+    if tool != "merge" and len(input_paths) > 1:
+        raise ValueError(f"'{tool}' works on one PDF at a time; run one job per file (see convert_batch).")
+    if tool == "extract" and not (page_range and str(page_range).strip()):
+        raise ValueError("Enter the pages to extract, e.g. '1-3, 7'.")
+
+    output_dir = work_dir or os.path.dirname(input_paths[0]) or SCRIPT_DIR
+    base_name = os.path.splitext(os.path.basename(input_paths[0]))[0]
+    if tool == "merge":
+        output_path = get_unique_filename(output_dir, f"{base_name}_merged.pdf")
+        outputs = merge_pdfs(input_paths, output_path, progress_callback=progress_callback)
+    elif tool == "extract":
+        output_path = get_unique_filename(output_dir, f"{base_name}_extract.pdf")
+        outputs = extract_pdf_pages(input_paths[0], output_path, page_range)
+    else:
+        output_path = os.path.join(output_dir, f"{base_name}.pdf")
+        outputs = split_pdf(input_paths[0], output_path, page_range, progress_callback=progress_callback)
+
+    sorted_files = handle_output_file(output_path, outputs, multiple_files=isinstance(outputs, list), open_outputs=open_outputs)
+    user_log.info(f"Finished PDF {tool} of {[os.path.basename(p) for p in input_paths]}. Final sorted output(s): {sorted_files}")
+    return sorted_files
+
+
+# --- Background Job Execution ---
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_SUCCEEDED = "succeeded"
+JOB_STATUS_FAILED = "failed"
+JOB_WORKER_COUNT = 2 # Concurrent conversions allowed from the GUI
+JOB_POLL_INTERVAL_MS = 100 # How often the GUI drains the job event queue
+BATCH_SUMMARY_MAX_LINES = 25 # Per-file lines shown in the batch summary dialog
+
+class ConversionJob:
+    """A single conversion submitted to a ConversionJobExecutor."""
+    def __init__(self, job_id, description, func, args, kwargs):
+        self.job_id = job_id
+        self.description = description
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.status = JOB_STATUS_QUEUED
+        self.progress = None # (done, total) once the converter reports it
+        self.result = None
+        self.error = None
+        self.future = None
+
+    def __repr__(self):
+        return f"ConversionJob(#{self.job_id}, {self.description!r}, {self.status})"
+
+
+class ConversionJobExecutor:
+    """
+    Runs conversion functions (e.g. convert_to_pdf / convert_from_pdf) on worker threads.
+    Status, progress, results and errors are posted to `self.events` as
+    (event_type, job, payload) tuples so a GUI can drain them from its own thread.
+    The converter is called with a `progress_callback` keyword argument.
+    """
+    def __init__(self, max_workers=2):
+        self.max_workers = max_workers
+        self.events = queue.Queue()
+        self.jobs = {}
+        self._job_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ConversionWorker")
+        debug_log.debug("ConversionJobExecutor started with %d worker(s).", max_workers)
+
+    def submit(self, description, func, *args, **kwargs):
+        with self._lock:
+            job = ConversionJob(next(self._job_ids), description, func, args, kwargs)
+            self.jobs[job.job_id] = job
+        user_log.info(f"Queued job #{job.job_id}: {description}")
+        self.events.put(("status", job, JOB_STATUS_QUEUED))
+        job.future = self._pool.submit(self._run_job, job)
+        return job
+
+    def _run_job(self, job):
+        job.status = JOB_STATUS_RUNNING
+        self.events.put(("status", job, JOB_STATUS_RUNNING))
+        debug_log.debug("Job #%d started on thread %s", job.job_id, threading.current_thread().name)
+
+        def report_progress(done, total):
+            job.progress = (done, total)
+            self.events.put(("progress", job, (done, total)))
+
+        try:
+            job.result = job.func(*job.args, progress_callback=report_progress, **job.kwargs)
+            job.status = JOB_STATUS_SUCCEEDED
+            self.events.put(("done", job, job.result))
+            debug_log.debug("Job #%d finished successfully.", job.job_id)
+        except Exception as e:
+            # The converter functions log their own failures; we only hand the error back.
+            job.error = e
+            job.status = JOB_STATUS_FAILED
+            self.events.put(("failed", job, e))
+            debug_log.debug("Job #%d failed: %r", job.job_id, e)
+        return job.result
+
+    def drain_events(self):
+        """Returns all pending events without blocking."""
+        pending = []
+        while True:
+            try:
+                pending.append(self.events.get_nowait())
+            except queue.Empty:
+                return pending
+
+    def active_jobs(self):
+        with self._lock:
+            return [job for job in self.jobs.values() if job.status in (JOB_STATUS_QUEUED, JOB_STATUS_RUNNING)]
+
+    def shutdown(self, wait=False):
+        debug_log.debug("Shutting down ConversionJobExecutor (wait=%s).", wait)
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+# --- Headless Batch API & CLI ---
+FROM_PDF_FORMATS = ["txt", "jpg", "png", "docx", *ARCHIVE_FORMATS]
+
+def expand_input_patterns(patterns, base_dir=None):
+    """
+    Expands glob patterns (including '**') into a de-duplicated list of files, in argument order.
+    Patterns that match nothing are kept as-is so they show up as failed results rather than vanish.
+    """
+    paths = []
+    seen = set()
+    for pattern in patterns:
+        if base_dir and not os.path.isabs(pattern):
+            pattern = os.path.join(base_dir, pattern)
+        matches = sorted(p for p in glob.glob(pattern, recursive=True) if os.path.isfile(p)) if glob.has_magic(pattern) else [pattern]
+        if not matches:
+            debug_log.warning(f"Input pattern matched no files: {pattern}")
+            matches = [pattern]
+        for path in matches:
+            key = os.path.normcase(os.path.abspath(path))
+            if key not in seen:
+                seen.add(key)
+                paths.append(os.path.abspath(path))
+    return paths
+
+def read_manifest(manifest_path):
+    """Reads a manifest: one path or glob per line, '#' comments allowed, relative to the manifest's folder."""
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        patterns = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+    return expand_input_patterns(patterns, base_dir=os.path.dirname(os.path.abspath(manifest_path)))
+
+# Rough relative cost of a conversion, in "bytes of image input" equivalents. Only the ordering matters:
+# the most expensive jobs start first so a long one does not begin last and hold up the whole batch.
+CONVERSION_COST_FACTORS = { # ext -> (cost per input byte, fixed cost per file)
+    '.doc': (1.0, 5_000_000), '.docx': (1.0, 5_000_000), # LibreOffice start-up dominates small documents
+    '.xls': (1.0, 5_000_000), '.xlsx': (1.0, 5_000_000),
+    '.ppt': (1.0, 5_000_000), '.pptx': (1.0, 5_000_000),
+    '.txt': (0.5, 0), # Streamed text layout, several MB/s
+}
+PDF_PAGE_COST = {"txt": 20_000, "jpg": 400_000, "png": 600_000, "docx": 300_000, # Per page, by output type
+                 "split": 2_000, "extract": 2_000}
+PDF_PAGE_COST.update({archive_format: PDF_PAGE_COST[image_ext] for archive_format, (image_ext, _) in ARCHIVE_FORMATS.items()})
+
+def estimate_conversion_cost(path, output_type="pdf"):
+    """Estimated relative cost of converting `path`. PDFs are costed by page count, other files by size."""
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return 0 # Missing files fail immediately
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.pdf' and output_type in PDF_PAGE_COST:
+        try:
+            with load_fitz().open(path) as doc: # Only reads the xref; pages are not parsed
+                return doc.page_count * PDF_PAGE_COST[output_type]
+        except Exception as e:
+            debug_log.debug("Could not count pages of %s for scheduling (%s); using file size.", path, e)
+            return size
+    per_byte, fixed = CONVERSION_COST_FACTORS.get(ext, (1.0, 0))
+    return fixed + size * per_byte
+
+def schedule_by_cost(input_paths, output_type="pdf"):
+    """Returns `input_paths` ordered most expensive first (stable for equal estimates)."""
+    costs = {path: estimate_conversion_cost(path, output_type) for path in input_paths}
+    return sorted(input_paths, key=lambda path: costs[path], reverse=True)
+
+def convert_batch(input_paths, mode="to-pdf", output_type="pdf", jobs=1, open_outputs=False, merge_images=False,
+                  on_result=None, use_cache=True, **options):
+    """
+    Converts many files without the GUI. `mode` is "to-pdf", "from-pdf", "chain" or "pdf-tools"; `output_type` is one
+    of FROM_PDF_FORMATS for "from-pdf" and "chain", and one of PDF_TOOLS for "pdf-tools". Every file is its own job
+    (except merged images and "merge"), run on `jobs` workers, largest estimated cost first. A failing file does not
+    stop the others. Extra keyword options go to the converter: page_range, dpi, colorspace, workers, memory_limit_mb
+    for convert_from_pdf; text_font, monospace, image_dpi, optimize, linearize for convert_to_pdf; both sets (without
+    optimize, linearize) for convert_chain; page_range for run_pdf_tool.
+    Returns one result dict per job and calls `on_result(result)` as each job finishes.
+    """
+    if mode not in ("to-pdf", "from-pdf", "chain", "pdf-tools"):
+        raise ValueError(f"Unknown conversion mode '{mode}'. Use 'to-pdf', 'from-pdf', 'chain' or 'pdf-tools'.")
+    if mode in ("from-pdf", "chain") and output_type not in FROM_PDF_FORMATS:
+        raise ValueError(f"Unsupported output format '{output_type}'. Choose one of: {', '.join(FROM_PDF_FORMATS)}.")
+    if mode == "pdf-tools" and output_type not in PDF_TOOLS:
+        raise ValueError(f"Unknown PDF tool '{output_type}'. Choose one of: {', '.join(PDF_TOOLS)}.")
+    user_log.info(f"Batch conversion started: {len(input_paths)} file(s), mode={mode}, output={output_type}, jobs={jobs}")
+
+    executor = ConversionJobExecutor(max_workers=max(1, jobs))
+    submitted = []
+    try:
+        if mode == "to-pdf" and merge_images:
+            submitted.append((list(input_paths), executor.submit("merged images -> pdf", convert_to_pdf, list(input_paths),
+                                                                 open_outputs=open_outputs, use_cache=use_cache, **options)))
+        elif mode == "chain" and merge_images:
+            submitted.append((list(input_paths), executor.submit(f"merged images -> pdf -> {output_type}", convert_chain, list(input_paths),
+                                                                 output_type, open_outputs=open_outputs, use_cache=use_cache, **options)))
+        elif mode == "pdf-tools" and output_type == "merge":
+            submitted.append((list(input_paths), executor.submit(f"{len(input_paths)} PDF(s) -> merge", run_pdf_tool, list(input_paths),
+                                                                 output_type, open_outputs=open_outputs, **options)))
+        else:
+            for path in schedule_by_cost(input_paths, output_type):
+                # One-element lists: a bare string would be split on ';', which is valid in file names
+                if mode == "to-pdf":
+                    job = executor.submit(f"{os.path.basename(path)} -> pdf", convert_to_pdf, [path],
+                                          open_outputs=open_outputs, use_cache=use_cache, **options)
+                elif mode == "chain":
+                    job = executor.submit(f"{os.path.basename(path)} -> pdf -> {output_type}", convert_chain, [path], output_type,
+                                          open_outputs=open_outputs, use_cache=use_cache, **options)
+                elif mode == "pdf-tools":
+                    job = executor.submit(f"{os.path.basename(path)} -> {output_type}", run_pdf_tool, [path], output_type,
+                                          open_outputs=open_outputs, **options)
+                else:
+                    job = executor.submit(f"{os.path.basename(path)} -> {output_type}", convert_from_pdf, path, output_type,
+                                          open_outputs=open_outputs, use_cache=use_cache, **options)
+                submitted.append(([path], job))
+
+        inputs_by_future = {job.future: (inputs, job) for inputs, job in submitted}
+        results = []
+        for future in as_completed(inputs_by_future):
+            inputs, job = inputs_by_future[future]
+            future.result() # The job wrapper never raises; errors are kept on the job
+            result = {
+                "job_id": job.job_id,
+                "inputs": inputs,
+                "mode": mode,
+                "output_type": output_type,
+                "status": job.status,
+                "outputs": [f for f in (job.result or []) if os.path.dirname(f).endswith('All')],
+                "error": str(job.error) if job.error else None,
+                "error_type": type(job.error).__name__ if job.error else None,
+            }
+            results.append(result)
+            if on_result:
+                on_result(result)
+    finally:
+        executor.shutdown(wait=True)
+
+    results.sort(key=lambda res: res["job_id"])
+    failed = sum(1 for res in results if res["status"] != JOB_STATUS_SUCCEEDED)
+    user_log.info(f"Batch conversion finished: {len(results) - failed} succeeded, {failed} failed.")
+    return results
+
+# --- Hot-Folder Watch Mode ---
+WATCH_DEBOUNCE_SECONDS = 2.0 # A file must keep the same size and mtime this long before it is converted
+WATCH_POLL_INTERVAL_SECONDS = 1.0
+WATCH_LEDGER_FILENAME = ".converted.jsonl" # Inside the inbox; one JSON line per handled file
+WATCH_WORK_DIRNAME = ".converting" # Intermediate outputs are written here, not next to the inbox files
+WATCH_TO_PDF_EXTS = ['.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.txt']
+
+class InotifyWatcher:
+    """Reports names of files closed after writing or moved into a directory (Linux inotify via ctypes)."""
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_Q_OVERFLOW = 0x00004000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, directory):
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), self.IN_CLOSE_WRITE | self.IN_MOVED_TO) < 0:
+            errno_value = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno_value, f"inotify_add_watch failed for {directory}")
+
+    def wait(self, timeout):
+        """Returns (names, overflowed) for events arriving within `timeout` seconds."""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return [], False
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return [], False
+        names, overflowed, offset = [], False, 0
+        while offset + self.EVENT_HEADER.size <= len(data):
+            _, mask, _, name_len = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = data[offset:offset + name_len].rstrip(b'\0')
+            offset += name_len
+            if mask & self.IN_Q_OVERFLOW:
+                overflowed = True
+            elif name:
+                names.append(os.fsdecode(name))
+        return names, overflowed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class HotFolderWatcher:
+    """
+    Converts files dropped into `inbox` with the same rules as the GUI: images, Office and text files go
+    through convert_to_pdf, PDFs through convert_from_pdf(`pdf_output_type`), anything else to
+    'Other_Unprocessed'. Results are sorted by handle_output_file as usual.
+
+    Files are picked up with inotify on Linux (polling elsewhere, or with `use_polling=True`), converted once
+    their size and mtime have been stable for `debounce_seconds`, and run on at most `jobs` workers.
+    Every handled file is appended to a ledger in the inbox, keyed by name, size and mtime, so restarts
+    skip work that is already done while changed files are converted again.
+
+    Extra keyword `options` go to whichever converter accepts them: e.g. dpi, page_range, workers for
+    convert_from_pdf and text_font, image_dpi, optimize for convert_to_pdf.
+    """
+    def __init__(self, inbox, pdf_output_type="txt", jobs=2, debounce_seconds=WATCH_DEBOUNCE_SECONDS,
+                 use_polling=False, use_cache=True, on_result=None, **options):
+        if pdf_output_type not in FROM_PDF_FORMATS:
+            raise ValueError(f"Unsupported output format '{pdf_output_type}'. Choose one of: {', '.join(FROM_PDF_FORMATS)}.")
+        if not os.path.isdir(inbox):
+            raise ValueError(f"Inbox folder does not exist: {inbox}")
+        self.inbox = os.path.abspath(inbox)
+        self.pdf_output_type = pdf_output_type
+        self.jobs = max(1, jobs)
+        self.debounce_seconds = debounce_seconds
+        self.use_cache = use_cache
+        self.on_result = on_result
+        self.pdf_options, self.to_pdf_options = {}, {}
+        for name, value in options.items():
+            accepted = False
+            for converter, converter_options in ((convert_from_pdf, self.pdf_options), (convert_to_pdf, self.to_pdf_options)):
+                if name in inspect.signature(converter).parameters:
+                    converter_options[name] = value
+                    accepted = True
+            if not accepted:
+                raise ValueError(f"Unknown watch option '{name}'.")
+        self.ledger_path = os.path.join(self.inbox, WATCH_LEDGER_FILENAME)
+        self.work_dir = os.path.join(self.inbox, WATCH_WORK_DIRNAME)
+        os.makedirs(self.work_dir, exist_ok=True)
+        self._handled = self._load_ledger()
+        self._pending = {} # name -> (size, mtime_ns, stable_since)
+        self._in_flight = {} # job_id -> (name, size, mtime_ns)
+        self._executor = ConversionJobExecutor(max_workers=self.jobs)
+        self._inotify = None
+        if not use_polling and sys.platform.startswith('linux'):
+            try:
+                self._inotify = InotifyWatcher(self.inbox)
+            except OSError as e:
+                user_log.warning(f"inotify unavailable for {self.inbox} ({e}); falling back to polling.")
+
+    def _load_ledger(self):
+        handled = set()
+        try:
+            with open(self.ledger_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        handled.add((record["name"], record["size"], record["mtime_ns"]))
+                    except (ValueError, KeyError):
+                        debug_log.warning(f"Skipping malformed ledger line in {self.ledger_path}: {line!r}")
+        except FileNotFoundError:
+            pass
+        debug_log.debug("Loaded %d handled file(s) from %s", len(handled), self.ledger_path)
+        return handled
+
+    def _append_ledger(self, record):
+        with open(self.ledger_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + "\n")
+
+    def _is_candidate(self, name):
+        return not name.startswith('.') and not name.startswith('~$') # Hidden/work files and Office lock files
+
+    def _observe(self, name, now):
+        # Records (or refreshes) a file's size/mtime; a change restarts its debounce period
+        if not self._is_candidate(name) or any(info[0] == name for info in self._in_flight.values()):
+            return
+        try:
+            st = os.stat(os.path.join(self.inbox, name))
+        except FileNotFoundError:
+            self._pending.pop(name, None)
+            return
+        if not os.path.isfile(os.path.join(self.inbox, name)) or (name, st.st_size, st.st_mtime_ns) in self._handled:
+            self._pending.pop(name, None)
+            return
+        previous = self._pending.get(name)
+        if previous is None or previous[:2] != (st.st_size, st.st_mtime_ns):
+            self._pending[name] = (st.st_size, st.st_mtime_ns, now)
+
+    def _scan(self, now):
+        with os.scandir(self.inbox) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    self._observe(entry.name, now)
+
+    def _submit_ready(self, now):
+        for name in sorted(self._pending, key=lambda n: self._pending[n][2]): # Oldest arrivals first
+            if len(self._in_flight) >= self.jobs:
+                break # Bounded: the rest stay pending until a worker is free
+            size, mtime_ns, stable_since = self._pending[name]
+            if now - stable_since < self.debounce_seconds:
+                continue
+            del self._pending[name]
+            path = os.path.join(self.inbox, name)
+            ext = os.path.splitext(name)[1].lower()
+            if ext == '.pdf':
+                job = self._executor.submit(f"{name} -> {self.pdf_output_type}", convert_from_pdf, path, self.pdf_output_type,
+                                            open_outputs=False, use_cache=self.use_cache, work_dir=self.work_dir, **self.pdf_options)
+            elif ext in WATCH_TO_PDF_EXTS: # [path]: a bare string would be split on ';', which is valid in file names
+                job = self._executor.submit(f"{name} -> pdf", convert_to_pdf, [path],
+                                            open_outputs=False, use_cache=self.use_cache, work_dir=self.work_dir, **self.to_pdf_options)
+            else:
+                job = self._executor.submit(f"{name} (unsupported)", lambda p, progress_callback=None: handle_unsupported_file(p), path)
+            self._in_flight[job.job_id] = (name, size, mtime_ns)
+
+    def _collect_finished(self):
+        for event_type, job, payload in self._executor.drain_events():
+            if event_type not in ("done", "failed"):
+                continue
+            name, size, mtime_ns = self._in_flight.pop(job.job_id)
+            record = {
+                "name": name,
+                "size": size,
+                "mtime_ns": mtime_ns,
+                "status": job.status,
+                "outputs": [f for f in (job.result or []) if os.path.dirname(f).endswith('All')],
+                "error": str(job.error) if job.error else None,
+                "finished": datetime.now().isoformat(timespec='seconds'),
+            }
+            # Failures are recorded too: retrying an unreadable file on every restart only repeats the error.
+            # Touching or replacing the file (new size/mtime) queues it again.
+            self._handled.add((name, size, mtime_ns))
+            self._append_ledger(record)
+            user_log.info(f"Hot folder: {name} {job.status}" + (f" ({job.error})" if job.error else ""))
+            if self.on_result:
+                self.on_result(record)
+
+    def run(self, stop_event=None, once=False):
+        """
+        Watches until `stop_event` is set (or KeyboardInterrupt). With `once=True`, converts what is
+        already in the inbox and returns when that is done.
+        """
+        mode = "polling" if self._inotify is None else "inotify"
+        user_log.info(f"Watching hot folder {self.inbox} ({mode}, {self.jobs} worker(s), PDFs -> {self.pdf_output_type}).")
+        self._scan(time.monotonic() - (self.debounce_seconds if once else 0))
+        try:
+            while not (stop_event and stop_event.is_set()):
+                now = time.monotonic()
+                self._submit_ready(now)
+                self._collect_finished()
+                if once and not self._pending and not self._in_flight:
+                    break
+                if self._inotify is not None:
+                    names, overflowed = self._inotify.wait(min(WATCH_POLL_INTERVAL_SECONDS, self.debounce_seconds / 2 or 0.1))
+                    now = time.monotonic()
+                    if overflowed:
+                        self._scan(now)
+                    for name in names:
+                        self._observe(name, now)
+                    for name in list(self._pending): # Re-check files still inside their debounce period
+                        self._observe(name, now)
+                elif once:
+                    time.sleep(0.1)
+                    for name in list(self._pending):
+                        self._observe(name, time.monotonic())
+                else:
+                    time.sleep(WATCH_POLL_INTERVAL_SECONDS)
+                    self._scan(time.monotonic())
+        except KeyboardInterrupt:
+            user_log.info("Hot folder watch interrupted.")
+        finally:
+            self.close()
+
+    def close(self):
+        self._executor.shutdown(wait=True) # Let running conversions finish; queued ones are cancelled
+        self._collect_finished()
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        user_log.info(f"Stopped watching {self.inbox}.")
+
+def _positive_int(text):
+    # argparse type for counts and resolutions that must be at least 1
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{text}'")
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive number, got {value}")
+    return value
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(
+        prog=os.path.basename(sys.argv[0]) or "convert_to_from_pdf",
+        description="Convert files to or from PDF without the GUI. Prints one JSON result per line on stdout. "
+                    "Run without arguments to start the GUI.")
+    subparsers = parser.add_subparsers(dest="mode", required=True)
+
+    def add_common_arguments(sub, cached=True):
+        sub.add_argument("inputs", nargs="*", help="Input files or glob patterns (quote patterns to avoid shell expansion, '**' recurses)")
+        sub.add_argument("--manifest", action="append", default=[], help="File listing one input path or glob per line")
+        sub.add_argument("--jobs", "-j", type=_positive_int, default=1, help="Number of files converted concurrently (default: 1)")
+        sub.add_argument("--open", action="store_true", help="Open converted files with the default application")
+        if cached:
+            sub.add_argument("--no-cache", dest="use_cache", action="store_false", help="Always convert, bypassing the conversion cache")
+
+    def add_to_pdf_arguments(sub):
+        sub.add_argument("--merge-images", action="store_true", help="Combine all (image) inputs into a single PDF")
+        sub.add_argument("--font", dest="text_font", help=f"TrueType font to embed for text files, for non-Latin text (default: ${TEXT_PDF_FONT_ENV} or Helvetica)")
+        sub.add_argument("--monospace", action="store_true", help="Set text files in Courier (or the --font given)")
+        sub.add_argument("--image-dpi", type=_positive_int, help="Downsample images to this resolution on the page, e.g. 150 (default: keep images as they are)")
+
+    def add_from_pdf_arguments(sub):
+        sub.add_argument("--format", "-f", dest="output_type", choices=FROM_PDF_FORMATS, required=True)
+        sub.add_argument("--pages", help="Pages to convert, e.g. '1-3,7,10-' (default: all)")
+        sub.add_argument("--dpi", type=_positive_int, help="Resolution for image output (default: 72)")
+        sub.add_argument("--colorspace", choices=sorted(RENDER_COLORSPACES), default="rgb", help="Colorspace for image output")
+        sub.add_argument("--workers", type=_positive_int, help="Most processes one file uses for image rendering and DOCX parsing (default and upper limit for rendering: CPU count)")
+        sub.add_argument("--memory-limit", dest="memory_limit_mb", type=_positive_int,
+                         help=f"MB one page's pixmap may use before it is rendered in strips to PNG (default: {RENDER_MEMORY_LIMIT_MB})")
+
+    to_pdf = subparsers.add_parser("to-pdf", help="Convert images, Office documents or text files to PDF")
+    add_common_arguments(to_pdf)
+    add_to_pdf_arguments(to_pdf)
+    to_pdf.add_argument("--optimize", action="store_true", default=None,
+                        help=f"Shrink the PDFs: downsample images above {PDF_OPTIMIZE_DPI_THRESHOLD} DPI, re-compress, drop duplicate objects")
+    to_pdf.add_argument("--linearize", action="store_true", help="Linearize the PDFs for fast web view (needs the pikepdf package)")
+
+    from_pdf = subparsers.add_parser("from-pdf", help="Convert PDF files to text, images or DOCX")
+    add_common_arguments(from_pdf)
+    add_from_pdf_arguments(from_pdf)
+
+    # The PDF in between stays in memory; only the --format output is saved
+    chain = subparsers.add_parser("chain", help="Convert images, Office documents or text files via PDF to text, images or DOCX")
+    add_common_arguments(chain)
+    add_to_pdf_arguments(chain)
+    add_from_pdf_arguments(chain)
+
+    # PDF tools copy pages without re-rendering them; each tool is its own subcommand
+    merge = subparsers.add_parser("merge", help="Merge PDFs into one, in the order given")
+    add_common_arguments(merge, cached=False)
+    split = subparsers.add_parser("split", help="Split each PDF into one PDF per page group")
+    add_common_arguments(split, cached=False)
+    split.add_argument("--pages", help="';'-separated page groups, e.g. '1-3;4-10;11-' (default: one file per page)")
+    extract = subparsers.add_parser("extract", help="Copy selected pages of each PDF into a new PDF")
+    add_common_arguments(extract, cached=False)
+    extract.add_argument("--pages", required=True, help="Pages to copy, e.g. '1-3,7,10-'")
+
+    watch = subparsers.add_parser("watch", help="Convert files dropped into an inbox folder as they arrive")
+    watch.add_argument("inbox", help="Folder to watch")
+    watch.add_argument("--pdf-format", dest="output_type", choices=FROM_PDF_FORMATS, default="txt", help="What PDFs in the inbox are converted to (default: txt)")
+    watch.add_argument("--jobs", "-j", type=_positive_int, default=2, help="Maximum concurrent conversions (default: 2)")
+    watch.add_argument("--debounce", type=float, default=WATCH_DEBOUNCE_SECONDS, help="Seconds a file must stay unchanged before it is converted")
+    watch.add_argument("--poll", action="store_true", help="Poll the folder instead of using inotify")
+    watch.add_argument("--once", action="store_true", help="Convert what is in the inbox now, then exit")
+    watch.add_argument("--no-cache", dest="use_cache", action="store_false", help="Always convert, bypassing the conversion cache")
+
+    cache = subparsers.add_parser("cache", help="Show conversion cache statistics (JSON) or clear the cache")
+    cache.add_argument("--clear", action="store_true", help="Delete all cached conversion results")
+
+    history = subparsers.add_parser("history", help="List past conversions from the job journal (JSON lines, newest first)")
+    history.add_argument("--since", help="Only jobs started after this: an age like '7d', '12h', '30m', or a date like '2024-05-01'")
+    history.add_argument("--until", help="Only jobs started before this (same formats as --since)")
+    history.add_argument("--status", choices=["succeeded", "failed"], help="Only jobs with this status")
+    history.add_argument("--kind", choices=["to-pdf", "from-pdf", "chain", "pdf-tools"], help="Only jobs of this kind")
+    history.add_argument("--input", dest="input_file", help="Only jobs that read a file with the same content as this one")
+    history.add_argument("--limit", type=int, default=100, help="Maximum number of jobs listed (default: 100)")
+    history.add_argument("--summary", action="store_true", help="Print job counts, durations and bytes per kind and status instead")
+    return parser
+
+def cli_main(argv=None):
+    """Command-line entry point. Returns the process exit code (0 all succeeded, 1 some failed, 2 bad usage)."""
+    parser = build_arg_parser()
+    args = parser.parse_args(argv)
+    user_log.info(f"Command-line run: {args.mode} {argv if argv is not None else sys.argv[1:]}")
+
+    if args.mode == "cache":
+        cache = get_conversion_cache()
+        if cache is None:
+            print(json.dumps({"enabled": False}))
+            return 0
+        if args.clear:
+            cache.clear()
+            user_log.info("Conversion cache cleared from the command line.")
+        print(json.dumps(dict(cache.stats(), enabled=True)))
+        return 0
+
+    if args.mode == "history":
+        journal = get_job_journal()
+        if journal is None:
+            print(json.dumps({"enabled": False}))
+            return 0
+        try:
+            filters = {"since": parse_journal_time(args.since) if args.since else None,
+                       "until": parse_journal_time(args.until) if args.until else None,
+                       "status": args.status, "kind": args.kind,
+                       "input_sha256": file_sha256(args.input_file) if args.input_file else None}
+        except ValueError as e:
+            parser.error(str(e))
+        except OSError as e:
+            parser.error(f"Could not read {args.input_file}: {e}")
+        if args.summary:
+            for row in journal.summary(**filters):
+                print(json.dumps(row))
+            return 0
+        for job in journal.query(limit=args.limit, **filters):
+            job["time"] = datetime.fromtimestamp(job.pop("started_at")).isoformat(timespec='seconds')
+            print(json.dumps(job))
+        return 0
+
+    if args.mode == "watch":
+        try:
+            watcher = HotFolderWatcher(args.inbox, pdf_output_type=args.output_type, jobs=args.jobs, debounce_seconds=args.debounce,
+                                       use_polling=args.poll, use_cache=args.use_cache,
+                                       on_result=lambda record: print(json.dumps(record), flush=True))
+        except ValueError as e:
+            parser.error(str(e))
+        watcher.run(once=args.once)
+        return 0
+
+    try:
+        input_paths = expand_input_patterns(args.inputs)
+        for manifest in args.manifest:
+            input_paths.extend(p for p in read_manifest(manifest) if p not in input_paths)
+    except OSError as e:
+        parser.error(f"Could not read manifest: {e}")
+    if not input_paths:
+        parser.error("No input files given (pass paths/globs or --manifest).")
+
+    def print_result(result):
+        print(json.dumps(result), flush=True)
+
+    mode, output_type = args.mode, getattr(args, "output_type", "pdf")
+    if mode in PDF_TOOLS:
+        mode, output_type = "pdf-tools", args.mode
+    options = {}
+    if args.mode in ("from-pdf", "chain"):
+        options = {"page_range": args.pages, "dpi": args.dpi, "colorspace": args.colorspace, "workers": args.workers,
+                   "memory_limit_mb": args.memory_limit_mb}
+    if args.mode in ("to-pdf", "chain"):
+        options.update({"text_font": args.text_font, "monospace": args.monospace, "image_dpi": args.image_dpi})
+    if args.mode == "to-pdf":
+        options.update({"optimize": args.optimize, "linearize": args.linearize})
+    elif args.mode in PDF_TOOLS:
+        options = {"page_range": getattr(args, "pages", None)}
+    try:
+        results = convert_batch(
+            input_paths, mode=mode, output_type=output_type, jobs=args.jobs,
+            open_outputs=args.open, merge_images=getattr(args, "merge_images", False), on_result=print_result,
+            use_cache=getattr(args, "use_cache", True), **options)
+    except ValueError as e:
+        parser.error(str(e))
+    return 0 if all(res["status"] == JOB_STATUS_SUCCEEDED for res in results) else 1
+
+
+# --- Log History Tail Reader ---
+LOG_VIEW_POLL_INTERVAL_MS = 500 # How often the open log window checks the file for new lines
+LOG_VIEW_INITIAL_LINES = 500 # Lines shown when the window opens
+LOG_VIEW_OLDER_BATCH_LINES = 500 # Lines added per "Load older" click
+LOG_VIEW_MAX_LINES = 5000 # Lines kept in the window while following; the oldest are dropped first
+LOG_TAIL_CHUNK_BYTES = 64 * 1024
+LOG_VIEW_LEVELS = ("ALL", "INFO", "WARNING", "ERROR") # Filter choices; each shows its level and above
+LOG_LEVEL_RANKS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+LOG_FINGERPRINT_BYTES = 64 # Leading bytes compared to notice a file replaced by one of similar size
+
+class LogTailReader:
+    """
+    Reads a growing log file incrementally, returning `(offset, line)` pairs. `read_new_lines` returns
+    only complete lines written since the last call; `read_older_lines` walks backwards from the earliest line read so far in fixed-size
+    chunks, so neither ever loads the whole file. A file that was truncated (Clear Log File) or replaced
+    (rotation to user_log.txt.1, daily rename) is detected by size, inode and leading bytes and re-read
+    from its start; `read_new_lines` then reports `reset=True`.
+    """
+    def __init__(self, path, chunk_size=LOG_TAIL_CHUNK_BYTES):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.reset()
+
+    def reset(self):
+        self.offset = 0 # End of the last complete line read
+        self.start_offset = 0 # Start of the earliest line read; 0 means nothing older is left
+        self.file_id = None
+        self.fingerprint = b""
+
+    @property
+    def has_older(self):
+        return self.start_offset > 0
+
+    def _identify(self, f, st):
+        f.seek(0)
+        self.file_id = (st.st_dev, st.st_ino)
+        self.fingerprint = f.read(LOG_FINGERPRINT_BYTES)
+
+    def _was_replaced(self, f, st):
+        if self.file_id is None:
+            return False
+        if (st.st_dev, st.st_ino) != self.file_id or st.st_size < self.offset:
+            return True
+        f.seek(0)
+        return f.read(len(self.fingerprint)) != self.fingerprint
+
+    def read_tail(self, max_lines):
+        """Starts reading at the last `max_lines` complete lines of the file and returns them."""
+        self.reset()
+        try:
+            with open(self.path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                self._identify(f, st)
+                self.offset = self.start_offset = self._last_line_end(f, st.st_size)
+        except FileNotFoundError:
+            return []
+        return self.read_older_lines(max_lines)
+
+    def read_new_lines(self):
+        """Returns `(lines, reset)`: complete lines appended since the last read, and whether the file was replaced."""
+        try:
+            with open(self.path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                reset = self._was_replaced(f, st)
+                if reset:
+                    self.reset()
+                if self.file_id is None:
+                    self._identify(f, st)
+                if st.st_size <= self.offset:
+                    return [], reset
+                f.seek(self.offset)
+                data = f.read(st.st_size - self.offset)
+        except FileNotFoundError:
+            return [], False
+        end = data.rfind(b"\n") + 1 # A half-written last line is picked up on the next call
+        lines = _decode_log_lines(self.offset, data[:end].split(b"\n")[:-1])
+        self.offset += end
+        return lines, reset
+
+    def read_older_lines(self, max_lines):
+        """Returns up to `max_lines` complete lines that precede everything read so far, oldest first."""
+        if not self.has_older:
+            return []
+        blocks = []
+        newlines = 0
+        position = self.start_offset
+        try:
+            with open(self.path, 'rb') as f:
+                # One extra newline marks where the earliest wanted line starts
+                while position > 0 and newlines <= max_lines:
+                    size = min(self.chunk_size, position)
+                    position -= size
+                    f.seek(position)
+                    block = f.read(size)
+                    blocks.append(block)
+                    newlines += block.count(b"\n")
+        except FileNotFoundError:
+            return []
+        data = b"".join(reversed(blocks))[:self.start_offset - position]
+        raw_lines = data.split(b"\n")[:-1] # Data ends at a line boundary; the first piece may be partial
+        if len(raw_lines) > max_lines:
+            raw_lines = raw_lines[-max_lines:]
+            self.start_offset -= sum(len(raw) + 1 for raw in raw_lines)
+        else:
+            self.start_offset = position # Reached the start of the file
+        return _decode_log_lines(self.start_offset, raw_lines)
+
+    def _last_line_end(self, f, size):
+        position = size
+        while position > 0:
+            step = min(self.chunk_size, position)
+            f.seek(position - step)
+            block = f.read(step)
+            index = block.rfind(b"\n")
+            if index >= 0:
+                return position - step + index + 1
+            position -= step
+        return 0
+
+def _decode_log_lines(offset, raw_lines):
+    lines = []
+    for raw in raw_lines:
+        lines.append((offset, raw.decode('utf-8', errors='replace').rstrip("\r")))
+        offset += len(raw) + 1
+    return lines
+
+def parse_log_line(line):
+    """Returns `(level, text)` for a user log line in text or JSON format; level is None for continuation lines."""
+    if line.startswith("{"):
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            entry = None
+        if isinstance(entry, dict) and "level" in entry:
+            text = f"{entry.get('time', '')} - {entry['level']} - {entry.get('message', '')}"
+            if entry.get("exception"):
+                text += "\n" + entry["exception"]
+            return entry["level"], text
+    parts = line.split(" - ", 2)
+    if len(parts) == 3 and parts[1] in LOG_LEVEL_RANKS:
+        return parts[1], line
+    return None, line # Traceback or wrapped message; belongs to the line above
+
+
 class FileConverterGUI:
     def __init__(self, root_tk):
         self.root = root_tk
@@ -642,12 +4217,36 @@ class FileConverterGUI:
         self.file_path = tk.StringVar()
         self.conversion_type = tk.StringVar(value="to-pdf")
         self.output_format = tk.StringVar()
+        self.page_range = tk.StringVar() # From PDF only; empty means all pages
+        self.worker_count = tk.IntVar(value=PDF2DOCX_WORKER_COUNT) # Processes per file for rendering / DOCX parsing
+        self.optimize_output = tk.BooleanVar(value=PDF_OPTIMIZE_ENABLED) # Run optimize_pdf on "To PDF" results
+        self.text_font = tk.StringVar(value=os.environ.get(TEXT_PDF_FONT_ENV, "")) # TrueType font for text files; empty = Helvetica
+        self.monospace_text = tk.BooleanVar(value=False) # Courier instead of Helvetica when no font is chosen
 
-        self.log_history_window = None 
+        self.log_history_window = None
         self.log_history_text_widget = None
-        
+        self.log_tail_reader = None
+        self.log_view_entries = [] # (file offset, level, text) for every retained log line, oldest first
+        self.log_view_line_cap = LOG_VIEW_MAX_LINES
+        self.log_view_poll_id = None
+        self.log_view_level = tk.StringVar(value="ALL")
+        self.log_view_follow = tk.BooleanVar(value=True)
+
+        self.job_history_window = None
+        self.job_history_tree = None
+        self.job_history_period = tk.StringVar(value="Last 7 days")
+        self.job_history_status = tk.StringVar(value="All")
+        self.job_history_outputs = {} # Treeview item id -> output path in 'All' opened on double-click
+
+        # Conversions run on background workers; results come back through the event queue
+        self.job_executor = ConversionJobExecutor(max_workers=JOB_WORKER_COUNT)
+        self.job_batches = {} # job_id -> batch dict shared by all jobs of one multi-file submission
+        self.job_batches_lock = threading.Lock() # Batches are submitted from a scheduler thread
+        self.batch_counter = 0
+
         # Create GUI elements
         self.create_widgets()
+        self.root.after(JOB_POLL_INTERVAL_MS, self.poll_job_events)
         user_log.info("FileConverterGUI initialized.")
         debug_log.debug("FileConverterGUI __init__ completed.")
         
@@ -685,6 +4284,8 @@ class FileConverterGUI:
                        variable=self.conversion_type, command=self.update_formats).pack(side=tk.LEFT, padx=10)
         ttk.Radiobutton(type_frame, text="From PDF", value="from-pdf", 
                        variable=self.conversion_type, command=self.update_formats).pack(side=tk.LEFT)
+        ttk.Radiobutton(type_frame, text="PDF Tools", value="pdf-tools",
+                       variable=self.conversion_type, command=self.update_formats).pack(side=tk.LEFT, padx=10)
         
         # Output format selection
         format_frame = ttk.Frame(main_content_frame, padding="10")
@@ -693,6 +4294,29 @@ class FileConverterGUI:
         ttk.Label(format_frame, text="Output Format:").pack(side=tk.LEFT)
         self.format_dropdown = ttk.Combobox(format_frame, textvariable=self.output_format, state="readonly", width=10)
         self.format_dropdown.pack(side=tk.LEFT, padx=5)
+        self.format_dropdown.bind("<<ComboboxSelected>>", lambda e: self.update_formats()) # "To PDF" options depend on the target
+
+        ttk.Label(format_frame, text="Pages:").pack(side=tk.LEFT, padx=(15, 0))
+        self.page_range_entry = ttk.Entry(format_frame, textvariable=self.page_range, width=15)
+        self.page_range_entry.pack(side=tk.LEFT, padx=5)
+        ttk.Label(format_frame, text="Workers:").pack(side=tk.LEFT, padx=(15, 0))
+        self.worker_spinbox = ttk.Spinbox(format_frame, from_=1, to=max(1, os.cpu_count() or 1), textvariable=self.worker_count, width=4)
+        self.worker_spinbox.pack(side=tk.LEFT, padx=5)
+        self.optimize_checkbox = ttk.Checkbutton(format_frame, text="Optimize PDF", variable=self.optimize_output)
+        self.optimize_checkbox.pack(side=tk.LEFT, padx=(15, 0))
+
+        # Text files in "To PDF" mode: an embedded TrueType font (for non-Latin text) or the standard fonts
+        text_font_frame = ttk.Frame(main_content_frame, padding=(10, 0, 10, 10))
+        text_font_frame.pack(fill=tk.X)
+        ttk.Label(text_font_frame, text="Text font:").pack(side=tk.LEFT)
+        self.text_font_entry = ttk.Entry(text_font_frame, textvariable=self.text_font, width=50)
+        self.text_font_entry.pack(side=tk.LEFT, padx=5)
+        self.text_font_button = ttk.Button(text_font_frame, text="Choose...", command=self.browse_text_font)
+        self.text_font_button.pack(side=tk.LEFT)
+        self.text_font_clear_button = ttk.Button(text_font_frame, text="Default", command=lambda: self.text_font.set(""))
+        self.text_font_clear_button.pack(side=tk.LEFT, padx=5)
+        self.monospace_checkbox = ttk.Checkbutton(text_font_frame, text="Monospace (without a font)", variable=self.monospace_text)
+        self.monospace_checkbox.pack(side=tk.LEFT, padx=(15, 0))
         
         # File selection frame
         file_frame = ttk.Frame(main_content_frame, padding="10")
@@ -745,6 +4369,7 @@ class FileConverterGUI:
         # Convert button
         button_frame = ttk.Frame(main_content_frame, padding="10")
         button_frame.pack(fill=tk.X)
+        ttk.Button(button_frame, text="History", command=self.toggle_job_history_view).pack(side=tk.RIGHT)
         ttk.Button(button_frame, text="Convert", command=self.convert_file).pack()
         
         # Log display bar at the very bottom of the root window
@@ -757,6 +4382,17 @@ class FileConverterGUI:
         self.update_formats()
         debug_log.debug("FileConverterGUI create_widgets finished.")
         
+    def _set_text_font_state(self, state):
+        for widget in (self.text_font_entry, self.text_font_button, self.text_font_clear_button, self.monospace_checkbox):
+            widget['state'] = state
+
+    def browse_text_font(self):
+        font_path = filedialog.askopenfilename(title="Select a TrueType font for text files",
+                                               filetypes=[("TrueType fonts", "*.ttf"), ("All files", "*.*")])
+        if font_path:
+            self.text_font.set(font_path)
+            self._log_gui_event(f"Text files will use the font '{os.path.basename(font_path)}'.")
+
     def update_formats(self):
         debug_log.debug(f"Updating formats for conversion type: {self.conversion_type.get()}")
         prev_type = getattr(self, '_prev_type', None)
@@ -777,12 +4413,36 @@ class FileConverterGUI:
         self._prev_type = curr_type
         
         if curr_type == "to-pdf":
-            self.format_dropdown['state'] = 'disabled'
-            self.format_dropdown.set('pdf')
-            self.output_format.set('pdf') # Ensure underlying var is also set
+            # "pdf", or a chained target: converted via an in-memory PDF, with the "From PDF" options
+            self.format_dropdown['state'] = 'readonly'
+            formats = ["pdf", *FROM_PDF_FORMATS]
+            self.format_dropdown['values'] = formats
+            if prev_type != curr_type or not self.output_format.get() in formats: # Switching to "To PDF" starts at plain PDF
+                self.output_format.set('pdf')
+            self.format_dropdown.set(self.output_format.get())
+            is_chain = self.output_format.get() != 'pdf'
+            self.page_range_entry['state'] = 'normal' if is_chain else 'disabled'
+            self.worker_spinbox['state'] = 'normal' if is_chain else 'disabled'
+            self.optimize_checkbox['state'] = 'disabled' if is_chain else 'normal'
+            self._set_text_font_state('normal')
+        elif curr_type == "pdf-tools":
+            # The format dropdown picks the tool; Pages is the extract selection or the split groups
+            self.format_dropdown['state'] = 'readonly'
+            self.page_range_entry['state'] = 'normal'
+            self.worker_spinbox['state'] = 'disabled'
+            self.optimize_checkbox['state'] = 'disabled'
+            self._set_text_font_state('disabled')
+            self.format_dropdown['values'] = PDF_TOOLS
+            if not self.output_format.get() in PDF_TOOLS:
+                self.output_format.set(PDF_TOOLS[0])
+            self.format_dropdown.set(self.output_format.get())
         else: # from-pdf
             self.format_dropdown['state'] = 'readonly'
-            formats = ["txt", "jpg", "png", "docx"] # Added png
+            self.page_range_entry['state'] = 'normal'
+            self.worker_spinbox['state'] = 'normal'
+            self.optimize_checkbox['state'] = 'disabled'
+            self._set_text_font_state('disabled')
+            formats = FROM_PDF_FORMATS # Page images one file each, or all in one .zip/.tar
             self.format_dropdown['values'] = formats
             if not self.output_format.get() in formats: # Set default if current is invalid
                 self.output_format.set(formats[0])
@@ -835,9 +4495,9 @@ class FileConverterGUI:
                     self._log_gui_event(f"Added file: {os.path.basename(path)}")
 
 
-            else: # from-pdf, must be a single PDF
+            else: # from-pdf or pdf-tools, must be a single PDF
                 if os.path.splitext(path)[1].lower() != '.pdf':
-                    messagebox.showerror("Error", "For 'From PDF' conversion, input must be a PDF file.")
+                    messagebox.showerror("Error", "For 'From PDF' and 'PDF Tools', input must be a PDF file.")
                     self._log_gui_event("Error: Manual input for 'From PDF' must be a PDF.", is_error=True)
                     return
                 self.file_path.set(path)
@@ -884,19 +4544,10 @@ class FileConverterGUI:
                 text_types_tuple,
                 ("All files", "*.*")
             ]
-            # Allow multiple file selection only if all are images
+            # Several images are merged into one PDF; any other multi-selection becomes a batch of one job per file
             filenames_or_name = filedialog.askopenfilenames(title="Select file(s) to convert to PDF", filetypes=filetypes)
             
             if filenames_or_name: # It's a tuple of paths
-                exts = [os.path.splitext(f)[1].lower() for f in filenames_or_name]
-                are_all_images = all(ext in ['.jpg', '.jpeg', '.png', '.bmp', '.tiff'] for ext in exts)
-                
-                if len(filenames_or_name) > 1 and not are_all_images:
-                    messagebox.showerror("Error", "Multiple file selection is only supported if all files are images.")
-                    self._log_gui_event("Error: Tried to select multiple non-image files for 'To PDF'.", is_error=True)
-                    return
-                
-                # If single file, or multiple images, proceed
                 paths_str = ';'.join(filenames_or_name)
                 self.file_path.set(paths_str)
                 
@@ -907,16 +4558,20 @@ class FileConverterGUI:
                 self.file_list.config(state=tk.DISABLED)
                 self._log_gui_event(f"Selected {len(filenames_or_name)} file(s) for 'To PDF'.")
 
-        else: # from-pdf
+        else: # from-pdf or pdf-tools
             filetypes = [("PDF files", "*.pdf"), ("All files", "*.*")]
-            filenames_or_name = filedialog.askopenfilename(title="Select PDF file to convert from", filetypes=filetypes)
-            if filenames_or_name: # It's a single path string
-                self.file_path.set(filenames_or_name)
+            filenames_or_name = filedialog.askopenfilenames(title="Select PDF file(s)", filetypes=filetypes)
+            if filenames_or_name: # It's a tuple of paths
+                self.file_path.set(';'.join(filenames_or_name))
                 self.file_list.config(state=tk.NORMAL)
                 self.file_list.delete(1.0, tk.END)
-                self._add_path_to_list_widget(self.file_list, filenames_or_name)
+                for fn in filenames_or_name:
+                    self._add_path_to_list_widget(self.file_list, fn)
                 self.file_list.config(state=tk.DISABLED)
-                self._log_gui_event(f"Selected PDF: {os.path.basename(filenames_or_name)}")
+                if len(filenames_or_name) == 1:
+                    self._log_gui_event(f"Selected PDF: {os.path.basename(filenames_or_name[0])}")
+                else:
+                    self._log_gui_event(f"Selected {len(filenames_or_name)} PDFs.")
 
     def convert_file(self):
         input_path_str = self.file_path.get()
@@ -927,64 +4582,194 @@ class FileConverterGUI:
             messagebox.showerror("Input Error", "No input file(s) selected.")
             return
 
-        # Clear previous output list
+        # Clear previous output list, unless other jobs are still going to add to it
+        if not self.job_executor.active_jobs():
+            self.output_list.config(state=tk.NORMAL)
+            self.output_list.delete(1.0, tk.END)
+            self.output_list.config(state=tk.DISABLED)
+
+        input_paths = [p for p in input_path_str.split(';') if p]
+        # Capture the current settings; the user may change them while the job is queued
+        if self.conversion_type.get() == "to-pdf":
+            output_ext = self.output_format.get() or "pdf"
+            text_options = {"text_font": self.text_font.get().strip() or None, "monospace": self.monospace_text.get()}
+            if output_ext == "pdf":
+                convert, target, options = convert_to_pdf, "pdf", {"optimize": self.optimize_output.get(), **text_options}
+            else: # Chained: only the final output is saved, the PDF in between stays in memory
+                page_range, workers = self._selected_page_options()
+                convert, target = convert_chain, f"pdf -> {output_ext}"
+                options = {"output_type": output_ext, "page_range": page_range, "workers": workers, **text_options}
+            are_all_images = all(os.path.splitext(p)[1].lower() in TO_PDF_IMAGE_EXTS for p in input_paths)
+            if len(input_paths) == 1 or are_all_images: # Images are merged into a single PDF
+                job = self.job_executor.submit(f"{os.path.basename(input_paths[0])} -> {target}", convert, input_path_str, **options)
+                self._log_gui_event(f"Queued job #{job.job_id}: {job.description}",
+                                    detail_for_debug=f"Queued job #{job.job_id} for full path(s): {input_path_str}")
+                return
+            submit_one = lambda path: self.job_executor.submit(f"{os.path.basename(path)} -> {target}", convert, path, **options)
+        elif self.conversion_type.get() == "pdf-tools":
+            output_ext = tool = self.output_format.get()
+            page_range = self.page_range.get().strip() or None
+            if tool == "extract" and not page_range:
+                self._log_gui_event("Enter the pages to extract in 'Pages', e.g. 1-3, 7.", level="ERROR", is_error=True)
+                messagebox.showerror("Input Error", "Enter the pages to extract, e.g. 1-3, 7.")
+                return
+            if tool == "merge" or len(input_paths) == 1: # All selected PDFs go into one merged file
+                job = self.job_executor.submit(f"{len(input_paths)} PDF(s) -> {tool}", run_pdf_tool, input_path_str, tool, page_range=page_range)
+                self._log_gui_event(f"Queued job #{job.job_id}: {job.description}",
+                                    detail_for_debug=f"Queued job #{job.job_id} for full path(s): {input_path_str}")
+                return
+            submit_one = lambda path: self.job_executor.submit(f"{os.path.basename(path)} -> {tool}", run_pdf_tool, path, tool, page_range=page_range)
+        else: # from-pdf
+            output_ext = self.output_format.get()
+            if not output_ext:
+                 self._log_gui_event("Please select an output format for 'From PDF' conversion.", level="ERROR", is_error=True)
+                 messagebox.showerror("Input Error", "Output format not selected.")
+                 return
+            page_range, workers = self._selected_page_options()
+            description_suffix = f" (pages {page_range})" if page_range else ""
+            submit_one = lambda path: self.job_executor.submit(f"{os.path.basename(path)} -> {output_ext}{description_suffix}", convert_from_pdf,
+                                                               path, output_ext, page_range=page_range, workers=workers)
+            if len(input_paths) == 1:
+                job = submit_one(input_paths[0])
+                self._log_gui_event(f"Queued job #{job.job_id}: {job.description}",
+                                    detail_for_debug=f"Queued job #{job.job_id} for full path(s): {input_path_str}")
+                return
+
+        # Batch: one job per file, most expensive first; failures are collected into a summary at the end.
+        # Estimating the cost opens every PDF, so ordering and submitting happen on a scheduler thread.
+        self.batch_counter += 1
+        batch = {"id": self.batch_counter, "total": len(input_paths), "results": []}
+        self._show_status(f"Scheduling batch #{batch['id']}: {len(input_paths)} file(s) -> {output_ext}...")
+        threading.Thread(target=self._submit_batch, args=(batch, input_paths, output_ext, submit_one),
+                         name=f"BatchScheduler{batch['id']}", daemon=True).start()
+
+    def _submit_batch(self, batch, input_paths, output_ext, submit_one):
+        # Runs on a scheduler thread; the Tk thread learns about the batch from a "batch_queued" job event
+        try:
+            ordered_paths = schedule_by_cost(input_paths, output_ext)
+        except Exception:
+            debug_log.exception(f"Could not order batch #{batch['id']} by cost; submitting in selection order.")
+            ordered_paths = list(input_paths)
+        try:
+            for path in ordered_paths:
+                with self.job_batches_lock: # Registered before the Tk thread can look the job up
+                    job = submit_one(path)
+                    self.job_batches[job.job_id] = batch
+        except RuntimeError: # The window was closed and the executor shut down
+            debug_log.debug(f"Batch #{batch['id']} was not fully submitted: the job executor is shut down.")
+            return
+        self.job_executor.events.put(("batch_queued", None, (batch, input_paths, output_ext)))
+
+    def _selected_page_options(self):
+        # (page_range, workers) from the Pages field and Workers spinbox
+        page_range = self.page_range.get().strip() or None
+        try:
+            workers = max(1, self.worker_count.get())
+        except tk.TclError: # Non-numeric text in the spinbox
+            workers = None
+        return page_range, workers
+
+    def _show_status(self, message):
+        # Updates the status bar only; used for frequent progress updates that should not go to the log files
+        self.latest_log_display.config(text=message, foreground="darkgreen")
+
+    def poll_job_events(self):
+        """Drains the job executor's event queue on the Tk thread. Reschedules itself."""
+        try:
+            latest_progress = {}
+            for event_type, job, payload in self.job_executor.drain_events():
+                if event_type == "batch_queued":
+                    batch, input_paths, output_ext = payload
+                    self._log_gui_event(f"Queued batch #{batch['id']}: {len(input_paths)} file(s) -> {output_ext}",
+                                        detail_for_debug=f"Queued batch #{batch['id']} for: {input_paths}")
+                    continue
+                if event_type == "progress":
+                    latest_progress[job.job_id] = (job, payload)
+                    continue
+                latest_progress.pop(job.job_id, None)
+                if event_type == "status" and payload == JOB_STATUS_RUNNING:
+                    self._log_gui_event(f"Job #{job.job_id} started: {job.description}...")
+                elif event_type == "done":
+                    self._on_job_succeeded(job, payload)
+                    self._record_batch_result(job)
+                elif event_type == "failed":
+                    self._on_job_failed(job, payload)
+                    self._record_batch_result(job)
+
+            for job, (done, total) in latest_progress.values():
+                self._show_status(f"Job #{job.job_id} ({job.description}): {done}/{total}")
+        except Exception:
+            debug_log.exception("Error while processing job events in the GUI.")
+        finally:
+            if self.root.winfo_exists():
+                self.root.after(JOB_POLL_INTERVAL_MS, self.poll_job_events)
+
+    def _on_job_succeeded(self, job, sorted_files):
+        # Update output list with the paths (typically from 'All' folder or specific outputs)
+        # We want to show the files that are in the 'All' folder primarily, as they are the main result.
         self.output_list.config(state=tk.NORMAL)
-        self.output_list.delete(1.0, tk.END)
+        displayed_outputs = []
+        unique_all_folder_files = {f for f in sorted_files if os.path.dirname(f).endswith('All')}
+
+        for file_path_in_all in sorted(list(unique_all_folder_files)): # Sort for consistent display
+            self._add_path_to_list_widget(self.output_list, file_path_in_all)
+            displayed_outputs.append(os.path.basename(file_path_in_all))
         self.output_list.config(state=tk.DISABLED)
 
-        try:
-            base_input_name = os.path.basename(input_path_str.split(';')[0]) # Use first file for log name
-            self._log_gui_event(f"Starting conversion for: {base_input_name}...", 
-                                detail_for_debug=f"Starting conversion for full path(s): {input_path_str}")
-            
-            sorted_files = []
-            if self.conversion_type.get() == "to-pdf":
-                sorted_files = convert_to_pdf(input_path_str)
-            else: # from-pdf
-                output_ext = self.output_format.get()
-                if not output_ext:
-                     self._log_gui_event("Please select an output format for 'From PDF' conversion.", level="ERROR", is_error=True)
-                     messagebox.showerror("Input Error", "Output format not selected.")
-                     return
-                self._log_gui_event(f"Converting '{base_input_name}' from PDF to {output_ext}...",
-                                    detail_for_debug=f"Converting '{input_path_str}' from PDF to {output_ext}...")
-                sorted_files = convert_from_pdf(input_path_str, output_ext)
-            
-            # Update output list with the paths (typically from 'All' folder or specific outputs)
-            # We want to show the files that are in the 'All' folder primarily, as they are the main result.
-            self.output_list.config(state=tk.NORMAL)
-            displayed_outputs = []
-            unique_all_folder_files = {f for f in sorted_files if os.path.dirname(f).endswith('All')}
+        success_msg = f"Job #{job.job_id} successful! Output(s): {', '.join(displayed_outputs) if displayed_outputs else 'None'}"
+        self._log_gui_event(success_msg, detail_for_debug=f"Job #{job.job_id} successful. All sorted files: {sorted_files}")
 
-            for file_path_in_all in sorted(list(unique_all_folder_files)): # Sort for consistent display
-                self._add_path_to_list_widget(self.output_list, file_path_in_all)
-                displayed_outputs.append(os.path.basename(file_path_in_all))
-            self.output_list.config(state=tk.DISABLED)
-                
-            success_msg = f"Conversion successful! Output(s): {', '.join(displayed_outputs) if displayed_outputs else 'None'}"
-            self._log_gui_event(success_msg, detail_for_debug=f"Conversion successful. All sorted files: {sorted_files}")
+    def _record_batch_result(self, job):
+        # Shows one summary when the last job of a batch has finished
+        with self.job_batches_lock:
+            batch = self.job_batches.pop(job.job_id, None)
+        if batch is None:
+            return
+        batch["results"].append(job)
+        if len(batch["results"]) < batch["total"]:
+            self._show_status(f"Batch #{batch['id']}: {len(batch['results'])}/{batch['total']} file(s) done")
+            return
+
+        failed = [j for j in batch["results"] if j.status != JOB_STATUS_SUCCEEDED]
+        summary = f"Batch #{batch['id']} finished: {batch['total'] - len(failed)} succeeded, {len(failed)} failed."
+        self._log_gui_event(summary, is_error=bool(failed))
+        lines = [f"{'OK    ' if j.status == JOB_STATUS_SUCCEEDED else 'FAILED'}  {j.description}" +
+                 (f": {j.error}" if j.error else "") for j in sorted(batch["results"], key=lambda j: j.job_id)]
+        if len(lines) > BATCH_SUMMARY_MAX_LINES:
+            lines = lines[:BATCH_SUMMARY_MAX_LINES] + [f"... and {len(lines) - BATCH_SUMMARY_MAX_LINES} more (see the log)"]
+        show = messagebox.showwarning if failed else messagebox.showinfo
+        show("Batch Finished", summary + "\n\n" + "\n".join(lines))
 
-        except ValueError as ve: # Expected errors like unsupported type, soffice not found, etc.
-            self._log_gui_event(f"Conversion error: {str(ve)}", level="ERROR", is_error=True)
+    def _on_job_failed(self, job, error):
+        prefix = f"Job #{job.job_id} ({job.description})"
+        # Files in a batch are reported together when the batch finishes, not with one dialog each
+        with self.job_batches_lock:
+            in_batch = job.job_id in self.job_batches
+        show_error = (lambda *args: None) if in_batch else messagebox.showerror
+        if isinstance(error, ValueError): # Expected errors like unsupported type, soffice not found, etc.
+            self._log_gui_event(f"{prefix} conversion error: {str(error)}", level="ERROR", is_error=True)
             # Backend function should have logged details via user_log.error and debug_log.error/exception
-            messagebox.showerror("Conversion Error", str(ve))
-        except subprocess.CalledProcessError as cpe:
-            err_details = cpe.stderr.decode(errors='ignore') if cpe.stderr else (cpe.stdout.decode(errors='ignore') if cpe.stdout else "No details from subprocess.")
-            self._log_gui_event(f"Office conversion process error: {err_details.strip()[:200]}", level="ERROR", is_error=True)
-            debug_log.exception(f"CalledProcessError during conversion of {input_path_str}") # Full trace for debug
-            messagebox.showerror("Process Error", f"External process failed: {err_details.strip()[:500]}")
-        except RuntimeError as rte: # E.g. if conversion produced no output
-            self._log_gui_event(f"Conversion runtime error: {str(rte)}", level="ERROR", is_error=True)
-            debug_log.exception(f"RuntimeError during conversion of {input_path_str}")
-            messagebox.showerror("Runtime Error", str(rte))
-        except Exception as e: # Unexpected errors
-            self._log_gui_event(f"An unexpected error occurred: {str(e)}", level="ERROR", is_error=True)
-            debug_log.exception(f"Unexpected error in GUI convert_file for {input_path_str}") # Full trace for debug
-            messagebox.showerror("Unexpected Error", f"An critical error occurred: {str(e)}")
+            show_error("Conversion Error", str(error))
+        elif isinstance(error, subprocess.CalledProcessError):
+            err_details = error.stderr or error.stdout or "No details from subprocess."
+            if isinstance(err_details, bytes):
+                err_details = err_details.decode(errors='ignore')
+            self._log_gui_event(f"{prefix} office conversion process error: {err_details.strip()[:200]}", level="ERROR", is_error=True)
+            debug_log.error(f"CalledProcessError in job #{job.job_id}", exc_info=error) # Full trace for debug
+            show_error("Process Error", f"External process failed: {err_details.strip()[:500]}")
+        elif isinstance(error, RuntimeError): # E.g. if conversion produced no output
+            self._log_gui_event(f"{prefix} runtime error: {str(error)}", level="ERROR", is_error=True)
+            debug_log.error(f"RuntimeError in job #{job.job_id}", exc_info=error)
+            show_error("Runtime Error", str(error))
+        else: # Unexpected errors
+            self._log_gui_event(f"{prefix} unexpected error: {str(error)}", level="ERROR", is_error=True)
+            debug_log.error(f"Unexpected error in job #{job.job_id}", exc_info=error) # Full trace for debug
+            show_error("Unexpected Error", f"An critical error occurred: {str(error)}")
 
     def toggle_log_history_view(self, event=None):
         debug_log.debug("Toggling log history view.")
         if self.log_history_window and self.log_history_window.winfo_exists():
+            self._stop_log_follow()
             self.log_history_window.destroy()
             self.log_history_window = None
             self.latest_log_display.config(relief="sunken")
@@ -1007,8 +4792,18 @@ class FileConverterGUI:
         
         refresh_button = ttk.Button(toolbar, text="Refresh", command=self.refresh_log_history_view)
         refresh_button.pack(side=tk.LEFT)
+        self.load_older_button = ttk.Button(toolbar, text="Load older", command=self.load_older_log_history)
+        self.load_older_button.pack(side=tk.LEFT, padx=(5,0))
         clear_button = ttk.Button(toolbar, text="Clear Log File", command=self.clear_user_log_file)
         clear_button.pack(side=tk.LEFT, padx=5)
+        ttk.Label(toolbar, text="Level:").pack(side=tk.LEFT, padx=(10,2))
+        level_dropdown = ttk.Combobox(toolbar, textvariable=self.log_view_level, values=LOG_VIEW_LEVELS,
+                                      state="readonly", width=9)
+        level_dropdown.pack(side=tk.LEFT)
+        level_dropdown.bind("<<ComboboxSelected>>", lambda e: self._render_log_view())
+        ttk.Checkbutton(toolbar, text="Follow", variable=self.log_view_follow).pack(side=tk.LEFT, padx=10)
+        self.log_view_status = ttk.Label(toolbar, text="")
+        self.log_view_status.pack(side=tk.RIGHT)
 
 
         text_frame = ttk.Frame(self.log_history_window)
@@ -1026,39 +4821,147 @@ class FileConverterGUI:
         self.log_history_text_widget.config(state=tk.DISABLED) # Read-only
 
         self.refresh_log_history_view()
+        self.log_view_poll_id = self.root.after(LOG_VIEW_POLL_INTERVAL_MS, self._poll_log_history)
         self.log_history_window.protocol("WM_DELETE_WINDOW", self.on_log_history_close)
         debug_log.info("Opened log history window.")
 
     def on_log_history_close(self):
         if self.log_history_window:
+            self._stop_log_follow()
             self.log_history_window.destroy()
             self.log_history_window = None
             self.latest_log_display.config(relief="sunken")
             debug_log.info("Log history window closed via WM_DELETE_WINDOW.")
 
+    def _log_view_available(self):
+        return bool(self.log_history_window and self.log_history_window.winfo_exists() and self.log_history_text_widget)
+
+    def _stop_log_follow(self):
+        if self.log_view_poll_id is not None:
+            self.root.after_cancel(self.log_view_poll_id)
+            self.log_view_poll_id = None
+        self.log_tail_reader = None
+        self.log_view_entries = []
+
+    def _parse_log_lines(self, lines, level=None):
+        """Turns `(offset, line)` pairs into view entries; continuation lines take the level of the line above."""
+        entries = []
+        for offset, line in lines:
+            line_level, text = parse_log_line(line)
+            level = line_level or level
+            entries.append((offset, level, text))
+        return entries
+
+    def _log_entry_visible(self, level):
+        selected = self.log_view_level.get()
+        if selected == "ALL":
+            return True
+        return level is not None and LOG_LEVEL_RANKS.get(level, 0) >= LOG_LEVEL_RANKS[selected]
+
+    def _visible_log_text(self, entries):
+        return "".join(text + "\n" for offset, level, text in entries if self._log_entry_visible(level))
+
+    def _update_log_view_status(self):
+        if self.log_tail_reader is None:
+            return
+        if not os.path.exists(USER_LOG_FILE_PATH):
+            status = "User log file not found."
+        else:
+            status = f"{len(self.log_view_entries)} lines loaded"
+            if not self.log_tail_reader.has_older:
+                status += " (start of file)"
+        self.log_view_status.config(text=status)
+        self.load_older_button.config(state=tk.NORMAL if self.log_tail_reader.has_older else tk.DISABLED)
+
+    def _render_log_view(self):
+        """Redraws the widget from the retained entries (after a reload or a level filter change)."""
+        if not self._log_view_available():
+            return
+        self.log_history_text_widget.config(state=tk.NORMAL)
+        self.log_history_text_widget.delete(1.0, tk.END)
+        self.log_history_text_widget.insert(tk.END, self._visible_log_text(self.log_view_entries))
+        self.log_history_text_widget.config(state=tk.DISABLED)
+        self.log_history_text_widget.see(tk.END) # Scroll to bottom
+        self._update_log_view_status()
+
+    def _append_log_entries(self, entries):
+        widget = self.log_history_text_widget
+        self.log_view_entries.extend(entries)
+        widget.config(state=tk.NORMAL)
+        widget.insert(tk.END, self._visible_log_text(entries))
+        overflow = len(self.log_view_entries) - self.log_view_line_cap
+        if overflow > 0: # Drop the oldest lines from the widget as well as from the retained entries
+            dropped_text = self._visible_log_text(self.log_view_entries[:overflow])
+            del self.log_view_entries[:overflow]
+            if dropped_text:
+                widget.delete(1.0, f"{dropped_text.count(chr(10)) + 1}.0")
+            self.log_tail_reader.start_offset = self.log_view_entries[0][0] # "Load older" brings dropped lines back
+        widget.config(state=tk.DISABLED)
+        if self.log_view_follow.get():
+            widget.see(tk.END)
+        self._update_log_view_status()
+
+    def _poll_log_history(self):
+        self.log_view_poll_id = None
+        if not (self._log_view_available() and self.log_tail_reader):
+            return
+        try:
+            lines, reset = self.log_tail_reader.read_new_lines()
+        except OSError as e:
+            debug_log.warning("Could not read user log file for the history view: %s", e)
+            lines, reset = [], False
+        if reset: # Rotated or cleared: the window now mirrors the new file
+            debug_log.debug("User log file was replaced; restarting the history view.")
+            self.log_view_entries = []
+            self.log_view_line_cap = LOG_VIEW_MAX_LINES
+            self._render_log_view()
+        if lines:
+            last_level = self.log_view_entries[-1][1] if self.log_view_entries else None
+            self._append_log_entries(self._parse_log_lines(lines, last_level))
+        self.log_view_poll_id = self.root.after(LOG_VIEW_POLL_INTERVAL_MS, self._poll_log_history)
+
     def refresh_log_history_view(self):
-        if not (self.log_history_window and self.log_history_window.winfo_exists() and self.log_history_text_widget):
+        if not self._log_view_available():
             debug_log.debug("Log history window/widget not available for refresh.")
             return
         debug_log.debug("Refreshing log history view.")
-        self.log_history_text_widget.config(state=tk.NORMAL)
-        self.log_history_text_widget.delete(1.0, tk.END)
+        self.log_tail_reader = LogTailReader(USER_LOG_FILE_PATH)
+        self.log_view_line_cap = LOG_VIEW_MAX_LINES
         try:
-            if os.path.exists(USER_LOG_FILE_PATH):
-                with open(USER_LOG_FILE_PATH, 'r', encoding='utf-8') as f:
-                    log_content = f.read()
-                    self.log_history_text_widget.insert(tk.END, log_content)
-                self.log_history_text_widget.see(tk.END) # Scroll to bottom
-                debug_log.info(f"Loaded content from {USER_LOG_FILE_PATH} into log history view.")
-            else:
-                self.log_history_text_widget.insert(tk.END, "User log file not found or is empty.")
-                user_log.warning("User log file not found when trying to display history in GUI.")
-        except Exception as e:
-            error_msg = f"Error reading user log file: {e}"
-            self.log_history_text_widget.insert(tk.END, error_msg)
-            debug_log.exception(error_msg)
-        finally:
-            self.log_history_text_widget.config(state=tk.DISABLED)
+            lines = self.log_tail_reader.read_tail(LOG_VIEW_INITIAL_LINES)
+        except OSError as e:
+            lines = []
+            debug_log.exception(f"Error reading user log file: {e}")
+        self.log_view_entries = self._parse_log_lines(lines)
+        self._render_log_view()
+        if not os.path.exists(USER_LOG_FILE_PATH):
+            user_log.warning("User log file not found when trying to display history in GUI.")
+        else:
+            debug_log.info(f"Loaded last {len(lines)} lines of {USER_LOG_FILE_PATH} into log history view.")
+
+    def load_older_log_history(self):
+        """Prepends the next batch of earlier lines, read backwards from where the view starts."""
+        if not (self._log_view_available() and self.log_tail_reader):
+            return
+        try:
+            lines = self.log_tail_reader.read_older_lines(LOG_VIEW_OLDER_BATCH_LINES)
+        except OSError as e:
+            lines = []
+            debug_log.exception(f"Error reading older user log lines: {e}")
+        if lines:
+            entries = self._parse_log_lines(lines)
+            level = entries[-1][1]
+            for i, (offset, entry_level, text) in enumerate(self.log_view_entries):
+                if entry_level is not None:
+                    break
+                self.log_view_entries[i] = (offset, level, text) # Traceback lines whose header line just loaded
+            self.log_view_entries[:0] = entries
+            self.log_view_line_cap += len(entries) # Explicitly loaded history is not trimmed away again
+            self.log_view_follow.set(False) # Stay on the loaded history instead of jumping to new lines
+            self._render_log_view()
+            # Keep the line that was on top before the load in view
+            self.log_history_text_widget.see(f"{self._visible_log_text(entries).count(chr(10)) + 1}.0")
+        self._update_log_view_status()
 
     def clear_user_log_file(self):
         debug_log.info("Attempting to clear user log file.")
@@ -1076,18 +4979,115 @@ class FileConverterGUI:
         else:
             debug_log.info("User cancelled clearing of log file.")
 
+    def toggle_job_history_view(self):
+        """Opens (or closes) the conversion history window, read from the job journal."""
+        if self.job_history_window and self.job_history_window.winfo_exists():
+            self.job_history_window.destroy()
+            self.job_history_window = None
+            return
+        if get_job_journal() is None:
+            messagebox.showinfo("History", "The job journal is disabled, so there is no conversion history.")
+            return
+
+        self.job_history_window = tk.Toplevel(self.root)
+        self.job_history_window.title("Conversion History")
+        self.job_history_window.geometry(f"{max(self.root.winfo_width(), 700)}x{max(self.root.winfo_height() // 2, 300)}")
+
+        toolbar = ttk.Frame(self.job_history_window)
+        toolbar.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
+        ttk.Label(toolbar, text="Period:").pack(side=tk.LEFT, padx=(0,2))
+        period_dropdown = ttk.Combobox(toolbar, textvariable=self.job_history_period, values=list(JOB_HISTORY_PERIODS),
+                                       state="readonly", width=13)
+        period_dropdown.pack(side=tk.LEFT)
+        period_dropdown.bind("<<ComboboxSelected>>", lambda e: self.refresh_job_history_view())
+        ttk.Label(toolbar, text="Status:").pack(side=tk.LEFT, padx=(10,2))
+        status_dropdown = ttk.Combobox(toolbar, textvariable=self.job_history_status, values=["All", "succeeded", "failed"],
+                                       state="readonly", width=10)
+        status_dropdown.pack(side=tk.LEFT)
+        status_dropdown.bind("<<ComboboxSelected>>", lambda e: self.refresh_job_history_view())
+        ttk.Button(toolbar, text="Refresh", command=self.refresh_job_history_view).pack(side=tk.LEFT, padx=10)
+        self.job_history_summary = ttk.Label(toolbar, text="")
+        self.job_history_summary.pack(side=tk.RIGHT)
+
+        tree_frame = ttk.Frame(self.job_history_window)
+        tree_frame.pack(side=tk.BOTTOM, fill=tk.BOTH, expand=True, padx=5, pady=(0,5))
+        columns = ("time", "kind", "output", "status", "seconds", "inputs", "outputs")
+        self.job_history_tree = ttk.Treeview(tree_frame, columns=columns, show="headings")
+        for column, width in zip(columns, (140, 70, 60, 70, 60, 220, 220)):
+            self.job_history_tree.heading(column, text=column.capitalize())
+            self.job_history_tree.column(column, width=width, stretch=column in ("inputs", "outputs"))
+        scrollbar_y = ttk.Scrollbar(tree_frame, orient="vertical", command=self.job_history_tree.yview)
+        self.job_history_tree.configure(yscrollcommand=scrollbar_y.set)
+        scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
+        self.job_history_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.job_history_tree.bind("<Double-1>", self._open_job_history_output)
+
+        self.refresh_job_history_view()
+        debug_log.info("Opened job history window.")
+
+    def refresh_job_history_view(self):
+        journal = get_job_journal()
+        if journal is None or not (self.job_history_window and self.job_history_window.winfo_exists()):
+            return
+        age = JOB_HISTORY_PERIODS.get(self.job_history_period.get())
+        status = self.job_history_status.get()
+        filters = {"since": time.time() - age if age else None, "status": None if status == "All" else status}
+        jobs = journal.query(limit=JOB_HISTORY_LIMIT, **filters)
+        self.job_history_tree.delete(*self.job_history_tree.get_children())
+        self.job_history_outputs = {}
+        for job in jobs:
+            outputs = [o["path"] for o in job["outputs"] if os.path.basename(os.path.dirname(o["path"])) == 'All']
+            item = self.job_history_tree.insert("", tk.END, values=(
+                datetime.fromtimestamp(job["started_at"]).strftime('%Y-%m-%d %H:%M:%S'), job["kind"], job["output_type"],
+                job["status"], f"{job['seconds']:.2f}", "; ".join(os.path.basename(i["path"]) for i in job["inputs"]),
+                job["error"] or "; ".join(os.path.basename(path) for path in outputs)))
+            if outputs:
+                self.job_history_outputs[item] = outputs[0]
+        totals = journal.summary(**filters)
+        failed = sum(row["jobs"] for row in totals if row["status"] == "failed")
+        self.job_history_summary.config(text=f"{sum(row['jobs'] for row in totals)} job(s), {failed} failed, "
+                                             f"{sum(row['seconds'] or 0 for row in totals):.1f} s in total")
+
+    def _open_job_history_output(self, event):
+        path = self.job_history_outputs.get(self.job_history_tree.identify_row(event.y))
+        if path and os.path.exists(path):
+            open_file(path)
+        elif path:
+            messagebox.showinfo("History", f"'{os.path.basename(path)}' no longer exists.")
+
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support() # Needed for render worker processes in the frozen .exe
+    startup_timing = "--startup-timing" in sys.argv[1:] or os.environ.get(STARTUP_TIMING_ENV) == "1"
+    cli_args = [arg for arg in sys.argv[1:] if arg != "--startup-timing"]
+    if startup_timing:
+        report_startup_timing("module import")
+    if cli_args: # Any argument selects the headless command-line mode
+        sys.exit(cli_main(cli_args))
+    if tk is None:
+        print("Tkinter is not available; run with --help for the command-line mode.", file=sys.stderr)
+        sys.exit(2)
     user_log.info("Application started.")
     debug_log.info("Application __main__ block initiated.")
     root = tk.Tk()
     app = FileConverterGUI(root)
+    if startup_timing:
+        def on_first_idle():
+            window_ms = report_startup_timing("first window")
+            app._show_status(f"Startup: window ready after {window_ms:.0f} ms.")
+        root.after_idle(on_first_idle)
     
     def on_closing():
         user_log.info("Application closing.")
         debug_log.info("Application GUI closing sequence initiated.")
+        running_jobs = app.job_executor.active_jobs()
+        if running_jobs:
+            user_log.warning(f"Closing with {len(running_jobs)} job(s) still queued or running; queued jobs are cancelled.")
+        app.job_executor.shutdown(wait=False)
         if app.log_history_window and app.log_history_window.winfo_exists():
             app.log_history_window.destroy()
+        if app.job_history_window and app.job_history_window.winfo_exists():
+            app.job_history_window.destroy()
         root.destroy()
         user_log.info("Application closed.")
         debug_log.info("Application GUI destroyed. Exiting.")
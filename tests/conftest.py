@@ -0,0 +1,37 @@
+import os
+import sys
+
+import pytest
+
+# Metrics and the job journal would write into the real Logs/ folder; the tests don't need them
+os.environ.setdefault("FILE_CONVERTER_METRICS", "0")
+os.environ.setdefault("FILE_CONVERTER_JOURNAL", "0")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import convert_to_from_pdf as converter # noqa: E402
+
+
+@pytest.fixture
+def app_dir(tmp_path, monkeypatch):
+    """A private script folder: outputs are sorted into its All/, Pdf/, ... and the cache lives in it."""
+    script_dir = tmp_path / "app"
+    script_dir.mkdir()
+    monkeypatch.setattr(converter, "SCRIPT_DIR", str(script_dir))
+    cache = converter.ConversionCache(str(script_dir / "Cache"))
+    monkeypatch.setattr(converter, "_conversion_cache", cache)
+    yield script_dir
+    cache.close()
+
+
+@pytest.fixture
+def make_pdf(tmp_path):
+    """Writes a PDF with one line of text per page and returns its path."""
+    def make(name="doc.pdf", pages=2, directory=None):
+        path = os.path.join(directory or tmp_path, name)
+        fitz = converter.load_fitz()
+        with fitz.open() as doc:
+            for number in range(pages):
+                doc.new_page().insert_text((72, 72), f"Page {number + 1}")
+            doc.save(path)
+        return path
+    return make
@@ -0,0 +1,27 @@
+import os
+
+import pytest
+
+from conftest import converter
+
+
+@pytest.mark.parametrize("mode, output_type, name", [
+    ("to-pdf", "pdf", "notes;v2.txt"),
+    ("chain", "txt", "notes;v2.txt"),
+    ("from-pdf", "txt", "doc;v2.pdf"),
+    ("pdf-tools", "split", "doc;v2.pdf"),
+])
+def test_semicolon_in_file_name_is_one_input(app_dir, make_pdf, tmp_path, mode, output_type, name):
+    if name.endswith(".pdf"):
+        path = make_pdf(name)
+    else:
+        path = str(tmp_path / name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("Page 1\n")
+
+    results = converter.convert_batch([path], mode=mode, output_type=output_type)
+
+    assert [res["status"] for res in results] == [converter.JOB_STATUS_SUCCEEDED], results[0]["error"]
+    assert results[0]["inputs"] == [path]
+    assert results[0]["outputs"]
+    assert all(os.path.basename(out).startswith(name.split('.')[0]) for out in results[0]["outputs"])
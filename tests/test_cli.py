@@ -0,0 +1,25 @@
+import pytest
+
+from conftest import converter
+
+
+@pytest.mark.parametrize("argv", [
+    ["from-pdf", "doc.pdf", "-f", "png", "--dpi", "-50"],
+    ["from-pdf", "doc.pdf", "-f", "png", "--dpi", "0"],
+    ["to-pdf", "notes.txt", "--jobs", "0"],
+    ["watch", "inbox", "--jobs", "0"],
+    ["to-pdf", "scan.png", "--image-dpi", "0"],
+    ["from-pdf", "doc.pdf", "-f", "docx", "--workers", "-3"],
+    ["chain", "notes.docx", "-f", "png", "--workers", "0"],
+    ["from-pdf", "doc.pdf", "-f", "png", "--memory-limit", "-1"],
+])
+def test_non_positive_numbers_are_rejected(argv, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        converter.build_arg_parser().parse_args(argv)
+    assert exit_info.value.code == 2
+    assert "must be a positive number" in capsys.readouterr().err
+
+
+def test_positive_numbers_are_accepted():
+    args = converter.build_arg_parser().parse_args(["from-pdf", "doc.pdf", "-f", "png", "--dpi", "150", "--jobs", "2"])
+    assert (args.dpi, args.jobs) == (150, 2)
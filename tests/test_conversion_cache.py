@@ -0,0 +1,48 @@
+import os
+
+from conftest import converter
+
+
+def test_single_output_hit_does_not_overwrite_existing_file(app_dir, make_pdf, tmp_path):
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    pdf = make_pdf(directory=str(inbox))
+    first = converter.convert_from_pdf(pdf, "png.zip", open_outputs=False)
+    assert first[0].endswith(os.path.join("All", "doc.png.zip"))
+
+    own_file = inbox / "doc.png.zip"
+    own_file.write_bytes(b"the user's own archive")
+    second = converter.convert_from_pdf(pdf, "png.zip", open_outputs=False)
+
+    assert own_file.read_bytes() == b"the user's own archive"
+    assert second[0].endswith(os.path.join("All", "doc_1.png.zip"))
+    with open(first[0], 'rb') as converted, open(second[0], 'rb') as restored:
+        assert converted.read() == restored.read()
+
+
+def test_lookup_numbers_single_output_like_a_miss(tmp_path):
+    cache = converter.ConversionCache(str(tmp_path / "Cache"))
+    try:
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        result = out_dir / "report.txt"
+        result.write_text("cached text")
+        cache.store("k" * 64, str(result), str(result))
+
+        result.write_text("newer file with the same name")
+        restored = cache.lookup("k" * 64, str(result))
+
+        assert restored == str(out_dir / "report_1.txt")
+        assert result.read_text() == "newer file with the same name"
+        assert (out_dir / "report_1.txt").read_text() == "cached text"
+    finally:
+        cache.close()
+
+
+def test_lookup_miss_writes_nothing(tmp_path):
+    cache = converter.ConversionCache(str(tmp_path / "Cache"))
+    try:
+        assert cache.lookup("0" * 64, str(tmp_path / "missing.txt")) is None
+        assert not (tmp_path / "missing.txt").exists()
+    finally:
+        cache.close()
@@ -0,0 +1,121 @@
+import logging
+import os
+import re
+
+import pytest
+
+from conftest import converter
+
+
+@pytest.fixture
+def write_text(tmp_path):
+    def write(text, name="notes.txt"):
+        path = tmp_path / name
+        path.write_text(text, encoding="utf-8")
+        return str(path)
+    return write
+
+
+@pytest.fixture
+def out_pdf(tmp_path):
+    return str(tmp_path / "out.pdf")
+
+
+@pytest.fixture(scope="module")
+def cjk_font(tmp_path_factory):
+    # Droid Sans Fallback, a TrueType CJK font bundled with PyMuPDF (about 3.5 MB)
+    path = tmp_path_factory.mktemp("fonts") / "cjk.ttf"
+    path.write_bytes(converter.load_fitz().Font("cjk").buffer)
+    return str(path)
+
+
+def _pages(pdf_path):
+    with converter.load_fitz().open(pdf_path) as doc:
+        return [page.get_text() for page in doc]
+
+
+def _fonts(pdf_path):
+    with converter.load_fitz().open(pdf_path) as doc:
+        return [font[3] for font in doc[0].get_fonts()]
+
+
+def test_ascii_text_round_trips(write_text, out_pdf):
+    pdf = converter.convert_text_to_pdf(write_text("Hello world\nSecond line\n"), out_pdf)
+    assert _pages(pdf) == ["Hello world\nSecond line\n"]
+    assert _fonts(pdf) == ["Helvetica"]
+
+
+def test_windows_1252_characters_use_the_standard_font(write_text, out_pdf):
+    pdf = converter.convert_text_to_pdf(write_text("Café – 20 € “quoted”\n"), out_pdf)
+    assert _pages(pdf) == ["Café – 20 € “quoted”\n"]
+
+
+def test_indentation_and_blank_lines_are_kept(write_text, out_pdf):
+    pdf = converter.convert_text_to_pdf(write_text("def f():\n    return 1\n\n\n\tx = 2\n"), out_pdf)
+    assert _pages(pdf) == ["def f():\n    return 1\n" + " " * converter.TEXT_PDF_TAB_SIZE + "x = 2\n"]
+    with converter.load_fitz().open(pdf) as doc:
+        lines = [line for block in doc[0].get_text("dict")["blocks"] for line in block["lines"]]
+    baselines = [line["spans"][0]["origin"][1] for line in lines]
+    # Two blank lines between "return 1" and "x = 2": three line heights instead of one
+    assert baselines[1] - baselines[0] == pytest.approx(converter.TEXT_PDF_LINE_HEIGHT)
+    assert baselines[2] - baselines[1] == pytest.approx(3 * converter.TEXT_PDF_LINE_HEIGHT)
+
+
+def test_monospace_uses_courier(write_text, out_pdf):
+    pdf = converter.convert_text_to_pdf(write_text("a  b\n"), out_pdf, monospace=True)
+    assert _pages(pdf) == ["a  b\n"]
+    assert _fonts(pdf) == ["Courier"]
+
+
+def test_empty_file_gives_one_blank_page(write_text, out_pdf):
+    pdf = converter.convert_text_to_pdf(write_text(""), out_pdf)
+    assert _pages(pdf) == [""]
+
+
+def test_long_text_continues_on_new_pages(write_text, out_pdf):
+    lines = [f"Line {number}" for number in range(200)]
+    pdf = converter.convert_text_to_pdf(write_text("\n".join(lines) + "\n"), out_pdf)
+    pages = _pages(pdf)
+    assert len(pages) > 1
+    assert "".join(pages).splitlines() == lines
+
+
+def test_cjk_text_with_embedded_subset_font(write_text, cjk_font, out_pdf):
+    text = "日本語のテキスト\n中文 text\n"
+    pdf = converter.convert_text_to_pdf(write_text(text), out_pdf, font_path=cjk_font)
+    assert _pages(pdf) == [text]
+    (font_name,) = _fonts(pdf)
+    assert re.fullmatch(r"[A-Z]{6}\+DroidSansFallbackRegular", font_name)
+    assert os.path.getsize(pdf) < os.path.getsize(cjk_font) / 20 # Only the used glyphs are embedded
+
+
+def test_cjk_text_without_font_prints_question_marks_and_warns(write_text, caplog, out_pdf):
+    with caplog.at_level(logging.WARNING, logger=converter.user_log.name):
+        pdf = converter.convert_text_to_pdf(write_text("日本語\nok\n"), out_pdf)
+    assert _pages(pdf) == ["???\nok\n"]
+    assert any("3 character(s)" in record.getMessage() and "not in the Helvetica font" in record.getMessage()
+               for record in caplog.records)
+
+
+def test_to_memory_matches_the_file(write_text, cjk_font, out_pdf):
+    source = write_text("日本語\n")
+    data = converter.convert_text_to_pdf(source, "unused.pdf", font_path=cjk_font, to_memory=True)
+    pdf = converter.convert_text_to_pdf(source, out_pdf, font_path=cjk_font)
+    with open(pdf, 'rb') as f:
+        assert f.read() == data # No /ID or dates, so the output is reproducible
+
+
+def test_whole_font_is_embedded_without_fonttools(write_text, cjk_font, out_pdf, monkeypatch, caplog):
+    real_import_backend = converter.import_backend
+    def import_backend(module_name):
+        if module_name.startswith("fontTools"):
+            raise ImportError(module_name)
+        return real_import_backend(module_name)
+    monkeypatch.setattr(converter, "import_backend", import_backend)
+
+    with caplog.at_level(logging.WARNING, logger=converter.user_log.name):
+        pdf = converter.convert_text_to_pdf(write_text("中文\n"), out_pdf, font_path=cjk_font)
+
+    assert _pages(pdf) == ["中文\n"]
+    assert os.path.getsize(pdf) > os.path.getsize(cjk_font) / 4 # Compressed, but all glyphs are there
+    assert any("whole" in record.getMessage() and "fontTools" in record.getMessage() for record in caplog.records)
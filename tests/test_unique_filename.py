@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from conftest import converter
+
+
+def _name(path):
+    return os.path.basename(path)
+
+
+def _touch(path):
+    with open(path, 'w'):
+        pass
+
+
+def test_free_name_is_returned_unchanged(tmp_path):
+    assert converter.get_unique_filename(str(tmp_path), "a.txt") == str(tmp_path / "a.txt")
+
+
+def test_gap_is_filled_first(tmp_path):
+    _touch(tmp_path / "b.txt")
+    _touch(tmp_path / "b_2.txt")
+    assert _name(converter.get_unique_filename(str(tmp_path), "b.txt")) == "b_1.txt"
+
+
+@pytest.mark.parametrize("reserve", [False, True])
+def test_file_created_by_another_process_after_indexing(tmp_path, reserve):
+    _touch(tmp_path / "c.txt")
+    assert _name(converter.get_unique_filename(str(tmp_path), "c.txt")) == "c_1.txt" # Builds the index
+    subprocess.run([sys.executable, "-c", f"open({str(tmp_path / 'c_1.txt')!r}, 'w').close()"], check=True)
+
+    # Inside the rescan interval the index is stale; the check on disk still skips the new file
+    assert _name(converter.get_unique_filename(str(tmp_path), "c.txt", reserve=reserve)) == "c_2.txt"
+
+
+def test_deleted_file_is_reused_after_rescan(tmp_path, monkeypatch):
+    monkeypatch.setattr(converter, "DIRECTORY_RESCAN_INTERVAL_SECONDS", 0)
+    for name in ("d.txt", "d_1.txt", "d_2.txt"):
+        _touch(tmp_path / name)
+    assert _name(converter.get_unique_filename(str(tmp_path), "d.txt")) == "d_3.txt"
+
+    os.remove(tmp_path / "d_1.txt") # Behind the index's back
+    assert _name(converter.get_unique_filename(str(tmp_path), "d.txt")) == "d_1.txt"
+
+
+def test_released_name_is_reused_at_once(tmp_path):
+    first = converter.get_unique_filename(str(tmp_path), "e.txt", reserve=True)
+    second = converter.get_unique_filename(str(tmp_path), "e.txt", reserve=True)
+    os.remove(second)
+    converter.release_filename(second)
+    assert converter.get_unique_filename(str(tmp_path), "e.txt", reserve=True) == second
+    assert _name(first) == "e.txt"
+
+
+def test_reserve_creates_the_file(tmp_path):
+    path = converter.get_unique_filename(str(tmp_path), "f.txt", reserve=True)
+    assert os.path.isfile(path) and os.path.getsize(path) == 0
+    assert _name(converter.get_unique_filename(str(tmp_path), "f.txt", reserve=True)) == "f_1.txt"
+
+
+def test_concurrent_reservations_get_distinct_names(tmp_path):
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        paths = list(pool.map(lambda _: converter.get_unique_filename(str(tmp_path), "g.png", reserve=True), range(40)))
+    assert len(set(paths)) == 40
+    assert sorted(os.listdir(tmp_path)) == sorted(_name(path) for path in paths)
+
+
+def test_archive_extension_stays_whole(tmp_path):
+    _touch(tmp_path / "x.png.zip")
+    assert _name(converter.get_unique_filename(str(tmp_path), "x.png.zip")) == "x_1.png.zip"
+    assert _name(converter.get_unique_filename(str(tmp_path), "x.zip")) == "x.zip"
+
+
+def test_missing_directory_leaves_the_name_alone(tmp_path):
+    missing = str(tmp_path / "missing")
+    assert converter.get_unique_filename(missing, "h.txt", reserve=True) == os.path.join(missing, "h.txt")
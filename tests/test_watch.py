@@ -0,0 +1,42 @@
+import pytest
+
+from conftest import converter
+
+
+def _watch_once(inbox, **options):
+    records = []
+    watcher = converter.HotFolderWatcher(str(inbox), debounce_seconds=0, use_polling=True, on_result=records.append, **options)
+    watcher.run(once=True)
+    return {record["name"]: record for record in records}
+
+
+def test_semicolon_in_file_name_is_one_input(app_dir, tmp_path):
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    (inbox / "notes;v2.txt").write_text("hello\n", encoding="utf-8")
+
+    records = _watch_once(inbox)
+
+    assert records["notes;v2.txt"]["status"] == converter.JOB_STATUS_SUCCEEDED, records["notes;v2.txt"]["error"]
+
+
+def test_options_reach_both_converters(app_dir, make_pdf, tmp_path):
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    (inbox / "notes.txt").write_text("hello\n", encoding="utf-8")
+    make_pdf("scan.pdf", pages=1, directory=str(inbox))
+
+    records = _watch_once(inbox, pdf_output_type="png", dpi=144, monospace=True)
+
+    assert {record["status"] for record in records.values()} == {converter.JOB_STATUS_SUCCEEDED}
+    fitz = converter.load_fitz()
+    with fitz.open(records["notes.txt"]["outputs"][0]) as doc:
+        assert [font[3] for font in doc[0].get_fonts()] == ["Courier"]
+    from PIL import Image
+    with Image.open(records["scan.pdf"]["outputs"][0]) as image:
+        assert image.size == (1190, 1684) # A4 at 144 dpi instead of the default 72
+
+
+def test_unknown_option_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unknown watch option"):
+        converter.HotFolderWatcher(str(tmp_path), use_polling=True, no_such_option=1)